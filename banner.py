@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass, field
+from typing import Mapping, Sequence
+
+import config
+from data.elements import Element
+
+
+@dataclass(frozen=True)
+class Banner:
+    """
+    A time-limited draw pool, active for start_ts <= now < end_ts (epoch seconds).
+    `rarity_weights` overrides entries of config.RARITY_WEIGHTS; `rate_up` multiplies
+    an element's share within its own rarity (atomic number -> multiplier).
+    """
+
+    banner_id: str
+    start_ts: float
+    end_ts: float
+    rarity_weights: Mapping[int, float] = field(default_factory=dict)
+    rate_up: Mapping[int, float] = field(default_factory=dict)
+
+    def is_active(self, now: float) -> bool:
+        return self.start_ts <= now < self.end_ts
+
+
+def banner_weights(
+    elements_by_rarity: Mapping[int, Sequence[Element]],
+    banner: Banner | None = None,
+) -> tuple[dict[int, float], list[Element], list[float]]:
+    """
+    Rarity weights (normalised to sum to 1) plus the flattened (outcomes, weights)
+    a banner draws from. Raises ValueError for overrides the pool cannot honour.
+    """
+    rarity_weights = dict(config.RARITY_WEIGHTS)
+    rate_up: Mapping[int, float] = {}
+    if banner is not None:
+        for rarity, weight in banner.rarity_weights.items():
+            if rarity not in rarity_weights:
+                raise ValueError(f"Banner {banner.banner_id} overrides unknown rarity {rarity}.")
+            if weight < 0:
+                raise ValueError(f"Banner {banner.banner_id} has a negative weight for rarity {rarity}.")
+            rarity_weights[rarity] = weight
+        pool = {element.atomic_number for bucket in elements_by_rarity.values() for element in bucket}
+        for atomic_number, multiplier in banner.rate_up.items():
+            if atomic_number not in pool:
+                raise ValueError(f"Banner {banner.banner_id} rates up unknown element {atomic_number}.")
+            if not multiplier > 0:
+                raise ValueError(f"Banner {banner.banner_id} has a non-positive rate-up for element {atomic_number}.")
+        rate_up = banner.rate_up
+
+    # Normalised so roll_rarity (cumulative against one uniform) agrees with the alias table.
+    rarity_total = sum(rarity_weights.values())
+    if rarity_total <= 0:
+        raise ValueError("Rarity weights must sum to a positive value.")
+    rarity_weights = {rarity: weight / rarity_total for rarity, weight in rarity_weights.items()}
+
+    outcomes: list[Element] = []
+    weights: list[float] = []
+    for rarity, rarity_weight in rarity_weights.items():
+        bucket = elements_by_rarity[rarity]
+        multipliers = [rate_up.get(element.atomic_number, 1.0) for element in bucket]
+        bucket_total = sum(multipliers)
+        for element, multiplier in zip(bucket, multipliers):
+            outcomes.append(element)
+            weights.append(rarity_weight * multiplier / bucket_total)
+    return rarity_weights, outcomes, weights
+
+
+class BannerSchedule:
+    """
+    Banner windows resolved once into segments between consecutive start/end times,
+    so finding the active banner is a bisect rather than a scan. Where windows
+    overlap, the banner that started last wins.
+    """
+
+    def __init__(self, banners: Sequence[Banner] = ()) -> None:
+        seen: set[str] = set()
+        for banner in banners:
+            if banner.banner_id in seen:
+                raise ValueError(f"Duplicate banner id: {banner.banner_id}")
+            if banner.end_ts <= banner.start_ts:
+                raise ValueError(f"Banner {banner.banner_id} ends before it starts.")
+            seen.add(banner.banner_id)
+        self.banners: tuple[Banner, ...] = tuple(banners)
+        self._by_id: dict[str, Banner] = {banner.banner_id: banner for banner in self.banners}
+
+        # _segments[i] is active on [_boundaries[i - 1], _boundaries[i]); index 0 is before any banner.
+        self._boundaries: list[float] = sorted({ts for banner in self.banners for ts in (banner.start_ts, banner.end_ts)})
+        self._segments: list[Banner | None] = [None]
+        for boundary in self._boundaries:
+            active = [banner for banner in self.banners if banner.is_active(boundary)]
+            self._segments.append(max(active, key=lambda item: item.start_ts) if active else None)
+
+    def __len__(self) -> int:
+        return len(self.banners)
+
+    def get(self, banner_id: str) -> Banner | None:
+        return self._by_id.get(banner_id)
+
+    def active_at(self, now: float) -> Banner | None:
+        return self._segments[bisect.bisect_right(self._boundaries, now)]
+
+    def next_change_after(self, now: float) -> float | None:
+        """When the active banner may next change, e.g. to schedule a UI refresh."""
+        index = bisect.bisect_right(self._boundaries, now)
+        return self._boundaries[index] if index < len(self._boundaries) else None
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import argparse
+import cmath
+import math
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import config
+from data.elements import ELEMENTS, Element
+
+
+@dataclass(frozen=True)
+class RarityGroup:
+    rarity: int
+    size: int
+    probability: float  # chance that one draw lands on one specific element of this group
+
+
+def _log1m_exp_neg(value: complex) -> complex:
+    # log(1 - e^{-value}) without overflowing when Re(value) < 0.
+    if value.real >= 0.0:
+        return cmath.log(1.0 - cmath.exp(-value))
+    return -value + cmath.log(cmath.exp(value) - 1.0)
+
+
+class CompletionModel:
+    """
+    Exact draws-to-completion for the weighted coupon collector defined by the
+    rarity table. Elements of one rarity share a probability, so every quantity
+    is a product over the (at most 5) rarity groups instead of a sum over 2^118
+    subsets.
+
+    Poissonized, group r finishes by time x with probability (1 - e^{-q_r x})^{n_r},
+    independently of the other groups. Expectation and variance follow from
+    integrals of that product; the discrete CDF is recovered exactly by
+    extracting the t-th Taylor coefficient with a saddle-point contour integral.
+    """
+
+    def __init__(self, groups: Sequence[RarityGroup]) -> None:
+        self.groups: tuple[RarityGroup, ...] = tuple(group for group in groups if group.size > 0)
+        if not self.groups:
+            raise ValueError("Completion model needs at least one non-empty rarity group.")
+        total = sum(group.size * group.probability for group in self.groups)
+        if total <= 0:
+            raise ValueError("Rarity weights must sum to a positive value.")
+        if not math.isclose(total, 1.0):
+            self.groups = tuple(
+                RarityGroup(group.rarity, group.size, group.probability / total) for group in self.groups
+            )
+
+    @classmethod
+    def from_weights(
+        cls,
+        elements: Iterable[Element] = ELEMENTS,
+        rarity_weights: dict[int, float] | None = None,
+    ) -> "CompletionModel":
+        weights = config.RARITY_WEIGHTS if rarity_weights is None else rarity_weights
+        sizes: dict[int, int] = {rarity: 0 for rarity in weights}
+        for element in elements:
+            sizes[element.rarity_level] = sizes.get(element.rarity_level, 0) + 1
+        groups = [
+            RarityGroup(rarity, sizes[rarity], weight / sizes[rarity])
+            for rarity, weight in weights.items()
+            if sizes.get(rarity)
+        ]
+        return cls(groups)
+
+    def _select(self, rarities: Iterable[int] | None) -> tuple[RarityGroup, ...]:
+        if rarities is None:
+            return self.groups
+        wanted = set(rarities)
+        selected = tuple(group for group in self.groups if group.rarity in wanted)
+        if not selected:
+            raise ValueError(f"No rarity groups match {sorted(wanted)}.")
+        return selected
+
+    @staticmethod
+    def _poisson_incomplete(groups: Sequence[RarityGroup], x: float) -> float:
+        # 1 - prod_r (1 - e^{-q_r x})^{n_r}, accurate for both tails.
+        if x <= 0.0:
+            return 1.0
+        log_complete = 0.0
+        for group in groups:
+            tail = math.exp(-group.probability * x)
+            if tail >= 1.0:
+                return 1.0
+            log_complete += group.size * math.log1p(-tail)
+        return -math.expm1(log_complete)
+
+    @staticmethod
+    def _integration_limit(groups: Sequence[RarityGroup]) -> float:
+        # Past this point 1 - P(complete) is below ~1e-16 for every group.
+        return max((math.log(group.size) + 40.0) / group.probability for group in groups)
+
+    def _integrate(self, groups: Sequence[RarityGroup], power: int, intervals: int = 1 << 15) -> float:
+        # Composite Simpson; the integrand is smooth and flat wherever any group is far from done.
+        limit = self._integration_limit(groups)
+        step = limit / intervals
+        total = 0.0
+        for index in range(intervals + 1):
+            x = index * step
+            weight = 1 if index in (0, intervals) else (4 if index % 2 else 2)
+            total += weight * (x ** power) * self._poisson_incomplete(groups, x)
+        return total * step / 3.0
+
+    def expected_draws(self, rarities: Iterable[int] | None = None) -> float:
+        return self._integrate(self._select(rarities), power=0)
+
+    def draws_variance(self, rarities: Iterable[int] | None = None) -> float:
+        groups = self._select(rarities)
+        mean = self._integrate(groups, power=0)
+        # T = Gamma(N, 1) in Poisson time, so E[T^2] = E[N^2] + E[N].
+        second_moment = 2.0 * self._integrate(groups, power=1) - mean
+        return max(0.0, second_moment - mean * mean)
+
+    def cdf(self, draws: int, rarities: Iterable[int] | None = None) -> float:
+        """
+        Exact P(collection complete within `draws` draws).
+        Uses P(N <= t) = t! [x^t] e^x prod_r (1 - e^{-q_r x})^{n_r}, evaluated by
+        the trapezoid rule on the circle |x| = t, where the integrand is a narrow
+        positive peak; only the handful of nodes near the peak are summed.
+        """
+        groups = self._select(rarities)
+        if draws < sum(group.size for group in groups):
+            return 0.0
+
+        t = float(draws)
+        nodes = max(64, math.ceil(12.0 * math.sqrt(t)))
+        # e^{t(cos(theta) - 1)} < e^{-60} beyond this angle.
+        theta_limit = math.acos(max(-1.0, 1.0 - 60.0 / t))
+        half_span = math.ceil(theta_limit * nodes / (2.0 * math.pi))
+        indices = range(nodes) if 2 * half_span + 1 >= nodes else range(-half_span, half_span + 1)
+
+        total = 0.0
+        for index in indices:
+            theta = 2.0 * math.pi * index / nodes
+            unit = cmath.exp(1j * theta)
+            x = t * unit
+            log_value = t * (unit - 1.0) - 1j * t * theta
+            for group in groups:
+                log_value += group.size * _log1m_exp_neg(group.probability * x)
+            if log_value.real < -745.0:
+                continue
+            total += cmath.exp(log_value).real
+
+        log_prefactor = math.lgamma(t + 1.0) + t - t * math.log(t)
+        return min(1.0, max(0.0, math.exp(log_prefactor) * total / nodes))
+
+    def quantile(self, fraction: float, rarities: Iterable[int] | None = None) -> int:
+        if not 0.0 < fraction < 1.0:
+            raise ValueError("Quantile fraction must be between 0 and 1.")
+        groups = self._select(rarities)
+        low = sum(group.size for group in groups) - 1
+        high = max(low + 1, int(self.expected_draws(rarities)))
+        while self.cdf(high, rarities) < fraction:
+            low, high = high, high * 2
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.cdf(middle, rarities) >= fraction:
+                high = middle
+            else:
+                low = middle
+        return high
+
+    def cdf_curve(self, max_draws: int, step: int, rarities: Iterable[int] | None = None) -> list[tuple[int, float]]:
+        return [(draws, self.cdf(draws, rarities)) for draws in range(step, max_draws + 1, step)]
+
+
+def _parse_weights(raw: str | None) -> dict[int, float] | None:
+    if not raw:
+        return None
+    weights: dict[int, float] = {}
+    for item in raw.split(","):
+        rarity, _, weight = item.partition("=")
+        weights[int(rarity)] = float(weight)
+    return weights
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="元素抽卡收集：收集完成所需抽數的精確計算")
+    parser.add_argument("--weights", type=str, default=None, help="覆寫稀有度權重，例如 1=0.5,2=0.3,3=0.145,4=0.05,5=0.005")
+    parser.add_argument("--percentiles", type=str, default="0.1,0.5,0.9,0.99", help="要計算的分位數")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    model = CompletionModel.from_weights(ELEMENTS, _parse_weights(args.weights))
+    fractions = [float(value) for value in args.percentiles.split(",") if value]
+    buckets: list[tuple[str, list[int] | None]] = [("all", None)]
+    buckets += [(f"R{group.rarity}", [group.rarity]) for group in sorted(model.groups, key=lambda g: -g.rarity)]
+    for name, rarities in buckets:
+        mean = model.expected_draws(rarities)
+        deviation = math.sqrt(model.draws_variance(rarities))
+        quantiles = " ".join(f"p{fraction * 100:g}={model.quantile(fraction, rarities)}" for fraction in fractions)
+        print(f"{name:>4}  mean={mean:.1f}  sd={deviation:.1f}  {quantiles}")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,9 +26,18 @@ ELEMENT_CARD_FG = "#111111"
 
 UNLOCK_CODE = "ZIMEI-UNLOCK-2026"
 
-SAVE_VERSION = "2.0"
+# 3.x 起存檔使用二進位格式（save.dat）；2.x 以前為 JSON（save.json），載入時自動遷移。
+SAVE_VERSION = "3.0"
+SAVE_BINARY_MIN_VERSION = 3
 SAVE_DIR = Path.home() / ".element_gacha"
 SAVE_FILENAME = "save.json"
+SAVE_BINARY_FILENAME = "save.dat"
+SAVE_JOURNAL_SUFFIX = ".journal"
+SAVE_JOURNAL_COMPACT_EVERY = 64
+SAVE_DEBOUNCE_SECONDS = 0.5
+SAVE_RETRY_BASE_SECONDS = 0.5
+SAVE_RETRY_MAX_SECONDS = 30.0
+IMAGE_CACHE_DIRNAME = "image_cache"
 
 RARITY_WEIGHTS: dict[int, float] = {
     1: 0.50,
@@ -38,6 +47,9 @@ RARITY_WEIGHTS: dict[int, float] = {
     5: 0.005,
 }
 
+# 活動卡池的抽樣表快取上限（超過時淘汰最久未用者）。
+BANNER_TABLE_CACHE_SIZE = 8
+
 RARITY_LABELS: dict[int, str] = {
     1: "極常見",
     2: "常見",
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from banner import Banner, BannerSchedule
+
+# 限時活動卡池。時間為 epoch 秒（含開始、不含結束）；沒有進行中的活動時使用一般卡池。
+BANNERS: list[Banner] = []
+
+BANNER_SCHEDULE = BannerSchedule(BANNERS)
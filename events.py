@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Callable
+
+TICKETS_CHANGED = "tickets_changed"
+OWNERSHIP_CHANGED = "ownership_changed"  # payload: changed atomic numbers, or None for all
+LICENSE_CHANGED = "license_changed"
+LANGUAGE_CHANGED = "language_changed"
+
+EventHandler = Callable[[Any], None]
+
+
+class EventBus:
+    """Synchronous publish/subscribe for app state changes; handlers run on the Tk thread."""
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, list[EventHandler]] = defaultdict(list)
+
+    def subscribe(self, event: str, handler: EventHandler) -> Callable[[], None]:
+        self._handlers[event].append(handler)
+
+        def unsubscribe() -> None:
+            handlers = self._handlers.get(event, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+        return unsubscribe
+
+    def publish(self, event: str, payload: Any = None) -> None:
+        # Copy so handlers may unsubscribe while being notified.
+        for handler in list(self._handlers.get(event, ())):
+            handler(payload)
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import json
+import secrets
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from banner import Banner, BannerSchedule
+    from gacha import DrawBatchResult
+
+SERVER_SEED_BYTES = 32
+_DRBG_MAX_REQUEST_BYTES = 1 << 16  # SP 800-90A limit of 2^19 bits per generate call
+_UNIFORM_BYTES = 8
+_TWO_POW_53 = 9007199254740992.0
+
+
+class HmacDrbg:
+    """HMAC_DRBG from NIST SP 800-90A with SHA-512; each HMAC block yields 64 output bytes."""
+
+    def __init__(self, entropy: bytes, nonce: bytes = b"", personalization: bytes = b"") -> None:
+        self._key = b"\x00" * 64
+        self._value = b"\x01" * 64
+        self._update(entropy + nonce + personalization)
+
+    def _hmac(self, data: bytes) -> bytes:
+        return hmac.new(self._key, data, hashlib.sha512).digest()
+
+    def _update(self, provided: bytes = b"") -> None:
+        self._key = self._hmac(self._value + b"\x00" + provided)
+        self._value = self._hmac(self._value)
+        if provided:
+            self._key = self._hmac(self._value + b"\x01" + provided)
+            self._value = self._hmac(self._value)
+
+    def generate(self, length: int) -> bytes:
+        output = bytearray()
+        while len(output) < length:
+            request = min(_DRBG_MAX_REQUEST_BYTES, length - len(output))
+            chunk = bytearray()
+            while len(chunk) < request:
+                self._value = self._hmac(self._value)
+                chunk += self._value
+            output += chunk[:request]
+            self._update()
+        return bytes(output)
+
+
+def commitment_for(server_seed: bytes) -> str:
+    return hashlib.sha256(server_seed).hexdigest()
+
+
+def batch_uniforms(server_seed: bytes, client_seed: str, nonce: int, count: int) -> list[float]:
+    """The `count` uniforms of batch `nonce`; one DRBG instance per batch, 8 uniforms per HMAC block."""
+    if count <= 0:
+        return []
+    drbg = HmacDrbg(server_seed, nonce.to_bytes(8, "big"), client_seed.encode("utf-8"))
+    stream = drbg.generate(count * _UNIFORM_BYTES)
+    return [
+        (int.from_bytes(stream[offset : offset + _UNIFORM_BYTES], "big") >> 11) / _TWO_POW_53
+        for offset in range(0, len(stream), _UNIFORM_BYTES)
+    ]
+
+
+@dataclass(frozen=True)
+class FairnessReveal:
+    server_seed: bytes
+    client_seed: str
+    commitment: str
+
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "server_seed": self.server_seed.hex(),
+            "client_seed": self.client_seed,
+            "commitment": self.commitment,
+        }
+
+
+class FairDrawSource:
+    """
+    Commit-reveal draw randomness. The SHA-256 commitment of a secret server seed
+    is published first; every batch is derived from (server seed, client seed,
+    nonce) and can be re-derived by anyone once the server seed is revealed.
+
+    Used as the engine's `rng`: GachaEngine asks for a whole batch of uniforms at
+    once, and each batch uses the next nonce. Single draws are refused, since a
+    nonce spent outside a DrawBatchResult could never be verified.
+    """
+
+    def __init__(self, client_seed: str = "", server_seed: bytes | None = None, nonce: int = 0) -> None:
+        self.server_seed = server_seed if server_seed is not None else secrets.token_bytes(SERVER_SEED_BYTES)
+        self.client_seed = client_seed
+        self.nonce = nonce
+        self.last_nonce: int | None = None
+
+    @property
+    def commitment(self) -> str:
+        return commitment_for(self.server_seed)
+
+    def batch_uniforms(self, count: int) -> list[float]:
+        uniforms = batch_uniforms(self.server_seed, self.client_seed, self.nonce, count)
+        self.last_nonce = self.nonce
+        self.nonce += 1
+        return uniforms
+
+    def random(self) -> float:
+        raise TypeError("FairDrawSource only draws whole batches; use GachaEngine.pull_counts or draw_batch.")
+
+    def reveal(self, client_seed: str | None = None) -> FairnessReveal:
+        """Disclose the current server seed and rotate to a fresh one for later batches."""
+        revealed = FairnessReveal(self.server_seed, self.client_seed, self.commitment)
+        self.server_seed = secrets.token_bytes(SERVER_SEED_BYTES)
+        if client_seed is not None:
+            self.client_seed = client_seed
+        self.nonce = 0
+        self.last_nonce = None
+        return revealed
+
+
+def rederive_counts(
+    reveal: FairnessReveal,
+    nonce: int,
+    draw_count: int,
+    banner: "Banner | None" = None,
+) -> dict[int, int]:
+    from data.elements import ELEMENTS
+    from gacha import GachaEngine
+
+    engine = GachaEngine(ELEMENTS, rng=FairDrawSource(reveal.client_seed, reveal.server_seed, nonce))
+    engine.set_banner(banner)
+    return engine.pull_counts(draw_count)
+
+
+def verify_draw_batch(
+    result: "DrawBatchResult",
+    reveal: FairnessReveal,
+    banners: "BannerSchedule | None" = None,
+) -> bool:
+    """True when the revealed seeds match the commitment and reproduce `result` exactly."""
+    if result.draw_nonce is None or commitment_for(reveal.server_seed) != reveal.commitment:
+        return False
+    banner = None
+    if result.banner_id is not None:
+        if banners is None:
+            from data.banners import BANNER_SCHEDULE as banners
+        banner = banners.get(result.banner_id)
+        if banner is None:
+            return False
+    claimed = {entry.element.atomic_number: entry.count for entry in (*result.newly_obtained, *result.already_owned)}
+    return rederive_counts(reveal, result.draw_nonce, sum(claimed.values()), banner) == claimed
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="元素抽卡收集：公平性驗證（由公開的種子重算抽卡結果）")
+    parser.add_argument("--server-seed", required=True, help="公開後的伺服器種子（hex）")
+    parser.add_argument("--client-seed", default="", help="玩家種子")
+    parser.add_argument("--commitment", default=None, help="事先公布的承諾值（SHA-256 hex）")
+    parser.add_argument("--nonce", type=int, required=True, help="批次編號")
+    parser.add_argument("--count", type=int, required=True, help="該批次抽數")
+    parser.add_argument("--banner", default=None, help="該批次的活動卡池 ID（預設為一般卡池）")
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    args = parse_args()
+    server_seed = bytes.fromhex(args.server_seed)
+    commitment = commitment_for(server_seed)
+    if args.commitment is not None and args.commitment.lower() != commitment:
+        raise SystemExit("commitment mismatch: the revealed server seed is not the committed one")
+    banner = None
+    if args.banner is not None:
+        from data.banners import BANNER_SCHEDULE
+
+        banner = BANNER_SCHEDULE.get(args.banner)
+        if banner is None:
+            raise SystemExit(f"unknown banner: {args.banner}")
+    counts = rederive_counts(FairnessReveal(server_seed, args.client_seed, commitment), args.nonce, args.count, banner)
+    print(json.dumps({"commitment": commitment, "nonce": args.nonce, "counts": counts}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import math
 import random
-from collections import Counter, defaultdict
-from dataclasses import dataclass
-from typing import Sequence
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Mapping, Sequence
 
 import config
+from banner import Banner, BannerSchedule, banner_weights
 from data.elements import Element
+from rng import PhiloxRandom
 from save import SaveData
 from ticket import replenish_tickets, spend_tickets
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+
 
 @dataclass(frozen=True)
 class DrawEntry:
@@ -23,11 +34,193 @@ class DrawBatchResult:
     message: str
     newly_obtained: list[DrawEntry]
     already_owned: list[DrawEntry]
+    draw_nonce: int | None = None  # batch nonce when drawn from a FairDrawSource
+    banner_id: str | None = None  # banner the batch was drawn on; None for the standard pool
+    # Rarity (highest first) -> (entry, is_new) ordered by atomic number.
+    by_rarity: dict[int, list[tuple[DrawEntry, bool]]] = field(default_factory=dict)
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table over a fixed list of outcomes.
+    A single uniform draw in [0, 1) selects an outcome in O(1).
+    """
+
+    def __init__(self, outcomes: Sequence[Element], weights: Sequence[float]) -> None:
+        if not outcomes or len(outcomes) != len(weights):
+            raise ValueError("Alias table needs one weight per outcome.")
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("Alias table weights must sum to a positive value.")
+
+        size = len(outcomes)
+        self.outcomes: tuple[Element, ...] = tuple(outcomes)
+        self.size = size
+        self.probability: list[float] = [1.0] * size
+        self.alias: list[int] = list(range(size))
+
+        scaled = [weight * size / total for weight in weights]
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            self.probability[low] = scaled[low]
+            self.alias[low] = high
+            scaled[high] = (scaled[high] + scaled[low]) - 1.0
+            if scaled[high] < 1.0:
+                small.append(high)
+            else:
+                large.append(high)
+        # Leftovers are 1.0 up to float rounding; they keep probability 1.0.
+
+    def sample(self, roll: float) -> Element:
+        position = roll * self.size
+        index = int(position)
+        if index >= self.size:
+            index = self.size - 1
+        if position - index < self.probability[index]:
+            return self.outcomes[index]
+        return self.outcomes[self.alias[index]]
+
+    def sample_counts(self, rolls: Sequence[float]) -> list[int]:
+        """How many of `rolls` land on each outcome, indexed like `outcomes`."""
+        if NUMPY_AVAILABLE and isinstance(rolls, np.ndarray):
+            position = rolls * self.size
+            index = np.minimum(position.astype(np.int64), self.size - 1)
+            keep = (position - index) < np.asarray(self.probability)[index]
+            chosen = np.where(keep, index, np.asarray(self.alias)[index])
+            return [int(count) for count in np.bincount(chosen, minlength=self.size)]
+
+        counts = [0] * self.size
+        size = self.size
+        probability = self.probability
+        alias = self.alias
+        for roll in rolls:
+            position = roll * size
+            index = int(position)
+            if index >= size:
+                index = size - 1
+            counts[index if position - index < probability[index] else alias[index]] += 1
+        return counts
+
+    def outcome_probabilities(self) -> dict[Element, float]:
+        result: dict[Element, float] = {outcome: 0.0 for outcome in self.outcomes}
+        share = 1.0 / self.size
+        for index, outcome in enumerate(self.outcomes):
+            result[outcome] += share * self.probability[index]
+            result[self.outcomes[self.alias[index]]] += share * (1.0 - self.probability[index])
+        return result
+
+
+def _binomial(rng: random.Random, trials: int, probability: float) -> int:
+    if trials <= 0 or probability <= 0.0:
+        return 0
+    if probability >= 1.0:
+        return trials
+    if probability > 0.5:
+        return trials - _binomial(rng, trials, 1.0 - probability)
+    if trials * probability >= 30.0:
+        return _binomial_from_mode(rng, trials, probability)
+
+    # Skip ahead by geometric gaps between successes: O(trials * probability).
+    log_q = math.log1p(-probability)
+    successes = 0
+    position = 0
+    while True:
+        position += int(math.log(1.0 - rng.random()) / log_q) + 1
+        if position > trials:
+            return successes
+        successes += 1
+
+
+def _binomial_from_mode(rng: random.Random, trials: int, probability: float) -> int:
+    # Inversion that walks outward from the mode: O(sqrt(trials * p * q)) steps.
+    q = 1.0 - probability
+    mode = min(trials, int((trials + 1) * probability))
+    log_pmf = (
+        math.lgamma(trials + 1)
+        - math.lgamma(mode + 1)
+        - math.lgamma(trials - mode + 1)
+        + mode * math.log(probability)
+        + (trials - mode) * math.log(q)
+    )
+    odds = probability / q
+    low = high = mode
+    low_pmf = high_pmf = math.exp(log_pmf)
+    roll = rng.random() - low_pmf
+    if roll <= 0.0:
+        return mode
+    while low > 0 or high < trials:
+        if high < trials:
+            high_pmf *= (trials - high) / (high + 1) * odds
+            high += 1
+            roll -= high_pmf
+            if roll <= 0.0:
+                return high
+        if low > 0:
+            low_pmf *= low / ((trials - low + 1) * odds)
+            low -= 1
+            roll -= low_pmf
+            if roll <= 0.0:
+                return low
+    return mode
+
+
+def multinomial_counts(rng: random.Random, trials: int, weights: Sequence[float]) -> list[int]:
+    """
+    Split `trials` draws over `weights` with conditional binomials, drawn only from
+    `rng.random()`. Deliberately pure Python (no NumPy, no random.binomialvariate),
+    so a seed gives the same counts whatever is installed.
+    """
+    if trials <= 0:
+        return [0] * len(weights)
+
+    total = float(sum(weights))
+    counts = [0] * len(weights)
+    remaining = trials
+    remaining_mass = total
+    last_index = len(weights) - 1
+    for index, weight in enumerate(weights):
+        if remaining <= 0:
+            break
+        if index == last_index or remaining_mass <= 0.0:
+            counts[index] = remaining
+            break
+        count = _binomial(rng, remaining, min(1.0, weight / remaining_mass))
+        counts[index] = count
+        remaining -= count
+        remaining_mass -= weight
+    return counts
+
+
+DEFAULT_PULL_CHUNK = 1024
+# Below this, one alias lookup per draw beats the ~118 binomials of multinomial_counts.
+MULTINOMIAL_MIN_DRAWS = 512
+
+
+@dataclass(frozen=True)
+class SamplingTable:
+    banner: Banner | None
+    rarity_weights: dict[int, float]
+    outcomes: list[Element]
+    weights: list[float]
+    alias_table: AliasTable
 
 
 class GachaEngine:
-    def __init__(self, elements: Sequence[Element], rng: random.Random | None = None) -> None:
+    def __init__(
+        self,
+        elements: Sequence[Element],
+        rng: random.Random | None = None,
+        banners: BannerSchedule | None = None,
+        time_provider: Callable[[], float] | None = None,
+        table_cache_size: int = config.BANNER_TABLE_CACHE_SIZE,
+    ) -> None:
         self.rng = rng or random.Random()
+        self.banners = banners
+        self.time_provider: Callable[[], float] = time_provider or time.time
+        self.table_cache_size = max(1, table_cache_size)
         self.elements_by_rarity: dict[int, list[Element]] = defaultdict(list)
         self.elements_by_atomic_number: dict[int, Element] = {}
 
@@ -39,34 +232,228 @@ class GachaEngine:
             if not self.elements_by_rarity.get(rarity):
                 raise ValueError(f"Rarity bucket {rarity} is empty.")
 
+        # Static display order for results: rarity descending, then atomic number.
+        self.result_order: tuple[Element, ...] = tuple(
+            element
+            for rarity in sorted(self.elements_by_rarity, reverse=True)
+            for element in sorted(self.elements_by_rarity[rarity], key=lambda item: item.atomic_number)
+        )
+        # The standard pool is always kept; banner tables are compiled on first use and LRU-evicted.
+        self._standard_table = self._compile_table(None)
+        self._banner_tables: OrderedDict[str, SamplingTable] = OrderedDict()
+        self.banner: Banner | None = None
+        self._use_table(self._standard_table)
+
+    def _compile_table(self, banner: Banner | None) -> SamplingTable:
+        rarity_weights, outcomes, weights = banner_weights(self.elements_by_rarity, banner)
+        return SamplingTable(banner, rarity_weights, outcomes, weights, AliasTable(outcomes, weights))
+
+    def _use_table(self, table: SamplingTable) -> None:
+        self.rarity_weights = table.rarity_weights
+        self.outcomes = table.outcomes
+        self.outcome_weights = table.weights
+        self.alias_table = table.alias_table
+
+    def table_for(self, banner: Banner | None) -> SamplingTable:
+        if banner is None:
+            return self._standard_table
+        table = self._banner_tables.get(banner.banner_id)
+        # Same id is not enough: an edited schedule may reuse it with different weights.
+        if table is not None and (table.banner is banner or table.banner == banner):
+            self._banner_tables.move_to_end(banner.banner_id)
+            return table
+        table = self._compile_table(banner)
+        self._banner_tables[banner.banner_id] = table
+        self._banner_tables.move_to_end(banner.banner_id)
+        while len(self._banner_tables) > self.table_cache_size:
+            self._banner_tables.popitem(last=False)
+        return table
+
+    def set_banner(self, banner: Banner | None) -> None:
+        """Draw from `banner` (None for the standard pool) until changed again."""
+        if banner is self.banner:
+            return
+        self._use_table(self.table_for(banner))
+        self.banner = banner
+
+    def update_banner(self, now: float | None = None) -> Banner | None:
+        """Switch to the banner the schedule has active at `now` (default: time_provider())."""
+        if self.banners is not None:
+            self.set_banner(self.banners.active_at(self.time_provider() if now is None else now))
+        return self.banner
+
     def roll_rarity(self) -> int:
+        """
+        Test-only: an independent cumulative rarity roll, used to cross-check the
+        alias table. Draws never call it; the rarity comes from the sampled element.
+        """
         roll = self.rng.random()
         cumulative = 0.0
-        for rarity, weight in config.RARITY_WEIGHTS.items():
+        for rarity, weight in self.rarity_weights.items():
             cumulative += weight
             if roll < cumulative:
                 return rarity
-        return max(config.RARITY_WEIGHTS)
+        return max(self.rarity_weights)
 
     def pull_with_rarity(self) -> tuple[int, Element]:
-        rarity = self.roll_rarity()
-        element = self.rng.choice(self.elements_by_rarity[rarity])
-        return rarity, element
+        element = self.pull()
+        return element.rarity_level, element
 
     def pull(self) -> Element:
-        _, element = self.pull_with_rarity()
-        return element
+        return self.alias_table.sample(self.rng.random())
 
+    def _counts_by_atomic_number(self, counts: Sequence[int]) -> dict[int, int]:
+        return {
+            element.atomic_number: count
+            for element, count in zip(self.outcomes, counts)
+            if count > 0
+        }
 
-def collected_count(state: SaveData, elements: Sequence[Element]) -> int:
-    return sum(1 for element in elements if state.owned.get(element.atomic_number, 0) > 0)
+    def _bulk_rolls(self, draw_count: int) -> Sequence[float] | None:
+        """
+        The next `draw_count` uniforms, one per draw, when the backend produces them
+        in bulk; None for sequential generators. Shared by pull_counts and iter_pulls.
+        """
+        batch_uniforms = getattr(self.rng, "batch_uniforms", None)
+        if batch_uniforms is not None:
+            # Commit-reveal sources derive a whole batch from one DRBG instance.
+            return batch_uniforms(draw_count)
+        if isinstance(self.rng, PhiloxRandom):
+            # Counter-based streams keep one uniform per draw, so batches stay seekable.
+            start = self.rng.position
+            self.rng.seek(start + draw_count)
+            return self.rng.uniforms(start, draw_count)
+        return None
 
+    def pull_counts(self, draw_count: int) -> dict[int, int]:
+        if draw_count <= 0:
+            return {}
+        rolls = self._bulk_rolls(draw_count)
+        if rolls is None and draw_count < MULTINOMIAL_MIN_DRAWS:
+            random_ = self.rng.random
+            rolls = [random_() for _ in range(draw_count)]
+        if rolls is not None:
+            return self._counts_by_atomic_number(self.alias_table.sample_counts(rolls))
+        return self._counts_by_atomic_number(multinomial_counts(self.rng, draw_count, self.outcome_weights))
 
-def _sort_draw_entries(entries: list[DrawEntry]) -> list[DrawEntry]:
-    return sorted(
-        entries,
-        key=lambda entry: (-entry.element.rarity_level, entry.element.atomic_number),
-    )
+    def _iter_roll_chunks(self, draw_count: int, chunk_size: int) -> Iterator[tuple[int, Sequence[float] | None]]:
+        """
+        (size, rolls) per chunk of a `draw_count` batch; rolls is None where a
+        sequential generator should draw the chunk itself. A commit-reveal batch is
+        derived once under a single nonce and sliced, so its chunks verify as one batch.
+        """
+        if draw_count <= 0:
+            return
+        chunk_size = max(1, chunk_size)
+        if getattr(self.rng, "batch_uniforms", None) is not None:
+            rolls = self._bulk_rolls(draw_count)
+            for start in range(0, draw_count, chunk_size):
+                chunk = rolls[start : start + chunk_size]
+                yield len(chunk), chunk
+            return
+        for start in range(0, draw_count, chunk_size):
+            size = min(chunk_size, draw_count - start)
+            yield size, self._bulk_rolls(size)
+
+    def iter_pulls(self, draw_count: int, chunk_size: int = DEFAULT_PULL_CHUNK) -> Iterator[Element]:
+        """
+        Yield `draw_count` elements one at a time. Randomness is generated a chunk
+        at a time, so memory stays bounded by `chunk_size` however large the batch
+        (commit-reveal sources excepted: their batch is derived in one piece).
+        """
+        sample = self.alias_table.sample
+        for size, rolls in self._iter_roll_chunks(draw_count, chunk_size):
+            if rolls is None:
+                random_ = self.rng.random
+                rolls = [random_() for _ in range(size)]
+            for roll in rolls:
+                yield sample(float(roll))
+
+    def iter_pull_chunks(self, draw_count: int, chunk_size: int = DEFAULT_PULL_CHUNK) -> Iterator[dict[int, int]]:
+        """Yield per-chunk counts (atomic number -> count) for `draw_count` draws."""
+        for size, rolls in self._iter_roll_chunks(draw_count, chunk_size):
+            if rolls is None:
+                yield self.pull_counts(size)
+            else:
+                yield self._counts_by_atomic_number(self.alias_table.sample_counts(rolls))
+
+    def pull_at(self, draw_index: int) -> Element:
+        """Element of draw `draw_index` of a counter-based session, independent of any other draw."""
+        if not isinstance(self.rng, PhiloxRandom):
+            raise TypeError("pull_at needs a counter-based RNG backend.")
+        return self.alias_table.sample(self.rng.uniform_at(draw_index))
+
+    def pull_range(self, start: int, draw_count: int) -> dict[int, int]:
+        """
+        Counts for draws [start, start + draw_count) of a counter-based session.
+        Does not move the RNG position, so disjoint ranges can be computed in any
+        order or in parallel and summed.
+        """
+        if not isinstance(self.rng, PhiloxRandom):
+            raise TypeError("pull_range needs a counter-based RNG backend.")
+        if draw_count <= 0:
+            return {}
+        return self._counts_by_atomic_number(self.alias_table.sample_counts(self.rng.uniforms(start, draw_count)))
+
+
+class CollectionStats:
+    """
+    Collection summary shown by the UI, kept current from draw deltas.
+    Counts come from the state's OwnedCounts; the most-drawn element is tracked
+    incrementally because draws can only raise counts.
+    """
+
+    def __init__(self, elements: Sequence[Element], state: SaveData) -> None:
+        self.elements_by_atomic_number = {element.atomic_number: element for element in elements}
+        self.element_total = len(self.elements_by_atomic_number)
+        self.rarity_totals: dict[int, int] = {rarity: 0 for rarity in config.RARITY_WEIGHTS}
+        for element in elements:
+            self.rarity_totals[element.rarity_level] = self.rarity_totals.get(element.rarity_level, 0) + 1
+        self.state = state
+        self.top_atomic_number = 0
+        self.top_count = 0
+        self.rebuild(state)
+
+    def rebuild(self, state: SaveData) -> None:
+        self.state = state
+        self.top_atomic_number = 0
+        self.top_count = 0
+        for atomic_number, count in state.owned.items():
+            if count > self.top_count:
+                self.top_atomic_number = atomic_number
+                self.top_count = count
+
+    def apply_draws(self, rolled_counts: Mapping[int, int]) -> None:
+        owned = self.state.owned
+        for atomic_number in rolled_counts:
+            count = owned.get(atomic_number, 0)
+            if count > self.top_count or (count == self.top_count and atomic_number < self.top_atomic_number):
+                self.top_atomic_number = atomic_number
+                self.top_count = count
+
+    @property
+    def collected(self) -> int:
+        return self.state.owned.collected
+
+    @property
+    def total_owned_cards(self) -> int:
+        return self.state.owned.total
+
+    @property
+    def is_complete(self) -> bool:
+        return self.collected >= self.element_total
+
+    def rarity_progress(self, rarity: int) -> tuple[int, int]:
+        return self.state.owned.collected_in_rarity(rarity), self.rarity_totals.get(rarity, 0)
+
+    def top_element(self) -> Element | None:
+        return self.elements_by_atomic_number.get(self.top_atomic_number)
+
+
+def collected_count(state: SaveData, elements: Sequence[Element] | None = None) -> int:
+    if elements is None:
+        return state.owned.collected
+    return sum(1 for element in elements if state.owned.get(element.atomic_number, 0) > 0)
 
 
 def draw_batch(
@@ -74,6 +461,7 @@ def draw_batch(
     engine: GachaEngine,
     draw_count: int,
     now: float | None = None,
+    stats: CollectionStats | None = None,
 ) -> DrawBatchResult:
     if draw_count <= 0:
         return DrawBatchResult(False, "抽卡次數必須大於 0。", [], [])
@@ -88,32 +476,150 @@ def draw_batch(
             [],
         )
 
-    owned_before = {atomic_number for atomic_number, count in state.owned.items() if count > 0}
     spend_tickets(state, draw_count)
 
-    rolled_counts: Counter[int] = Counter()
-    for _ in range(draw_count):
-        element = engine.pull()
-        rolled_counts[element.atomic_number] += 1
-
-    for atomic_number, count in rolled_counts.items():
-        state.owned[atomic_number] = state.owned.get(atomic_number, 0) + count
+    banner = engine.update_banner(now)
+    rolled_counts = engine.pull_counts(draw_count)
     state.total_draws += draw_count
 
     newly_obtained: list[DrawEntry] = []
     already_owned: list[DrawEntry] = []
-    for atomic_number, count in rolled_counts.items():
-        element = engine.elements_by_atomic_number[atomic_number]
+    by_rarity: dict[int, list[tuple[DrawEntry, bool]]] = {}
+    # One pass over the static order table yields entries already sorted and grouped.
+    for element in engine.result_order:
+        count = rolled_counts.get(element.atomic_number)
+        if not count:
+            continue
         entry = DrawEntry(element=element, count=count)
-        if atomic_number in owned_before:
-            already_owned.append(entry)
-        else:
-            newly_obtained.append(entry)
+        is_new = state.owned.increment(element.atomic_number, count)
+        (newly_obtained if is_new else already_owned).append(entry)
+        by_rarity.setdefault(element.rarity_level, []).append((entry, is_new))
+    if stats is not None:
+        stats.apply_draws(rolled_counts)
 
     return DrawBatchResult(
         success=True,
         message="",
-        newly_obtained=_sort_draw_entries(newly_obtained),
-        already_owned=_sort_draw_entries(already_owned),
+        newly_obtained=newly_obtained,
+        already_owned=already_owned,
+        draw_nonce=getattr(engine.rng, "last_nonce", None),
+        banner_id=banner.banner_id if banner is not None else None,
+        by_rarity=by_rarity,
     )
 
+
+@dataclass(frozen=True)
+class DrawChunk:
+    entries: list[tuple[DrawEntry, bool]]  # this chunk's counts; is_new means first copy came in this chunk
+    drawn: int  # draws applied so far, including this chunk
+    total: int
+
+
+class DrawStream:
+    """
+    Streaming counterpart of draw_batch. Tickets are checked and spent when the
+    stream is created; iterating applies draws to the save chunk by chunk and
+    yields each chunk's entries, so large batches can be shown as they arrive.
+    `result()` drains whatever is left and returns the combined DrawBatchResult;
+    `close()` (also run on leaving a `with` block or when the stream is collected)
+    applies any remaining draws, so stopping early never loses paid-for draws.
+    """
+
+    def __init__(
+        self,
+        state: SaveData,
+        engine: GachaEngine,
+        draw_count: int,
+        now: float | None = None,
+        chunk_size: int = DEFAULT_PULL_CHUNK,
+        stats: CollectionStats | None = None,
+    ) -> None:
+        self.state = state
+        self.engine = engine
+        self.draw_count = draw_count
+        self.chunk_size = max(1, chunk_size)
+        self.stats = stats
+        self.drawn = 0
+        self._totals: dict[int, int] = {}
+        self._new: set[int] = set()
+        self._chunks: Iterator[dict[int, int]] | None = None
+        self.banner: Banner | None = None
+
+        if draw_count <= 0:
+            self.success, self.message = False, "抽卡次數必須大於 0。"
+            return
+        replenish_tickets(state, now=now)
+        if state.ticket_count < draw_count:
+            self.success, self.message = False, f"抽卡券不足 ({state.ticket_count} / {draw_count})"
+            return
+        spend_tickets(state, draw_count)
+        self.success, self.message = True, ""
+        # The whole stream stays on the banner active when the tickets were spent.
+        self.banner = engine.update_banner(now)
+        self._chunks = engine.iter_pull_chunks(draw_count, self.chunk_size)
+
+    def __iter__(self) -> Iterator[DrawChunk]:
+        if self._chunks is None:
+            return
+        owned = self.state.owned
+        while True:
+            self.engine.set_banner(self.banner)
+            counts = next(self._chunks, None)
+            if counts is None:
+                return
+            size = sum(counts.values())
+            entries: list[tuple[DrawEntry, bool]] = []
+            for element in self.engine.result_order:
+                count = counts.get(element.atomic_number)
+                if not count:
+                    continue
+                is_new = owned.increment(element.atomic_number, count)
+                if is_new:
+                    self._new.add(element.atomic_number)
+                self._totals[element.atomic_number] = self._totals.get(element.atomic_number, 0) + count
+                entries.append((DrawEntry(element=element, count=count), is_new))
+            self.state.total_draws += size
+            self.drawn += size
+            if self.stats is not None:
+                self.stats.apply_draws(counts)
+            yield DrawChunk(entries=entries, drawn=self.drawn, total=self.draw_count)
+
+    def close(self) -> None:
+        for _ in self:
+            pass
+
+    def __enter__(self) -> DrawStream:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if getattr(self, "_chunks", None) is not None:
+            self.close()
+
+    def result(self) -> DrawBatchResult:
+        self.close()
+        if not self.success:
+            return DrawBatchResult(False, self.message, [], [])
+
+        newly_obtained: list[DrawEntry] = []
+        already_owned: list[DrawEntry] = []
+        by_rarity: dict[int, list[tuple[DrawEntry, bool]]] = {}
+        for element in self.engine.result_order:
+            count = self._totals.get(element.atomic_number)
+            if not count:
+                continue
+            entry = DrawEntry(element=element, count=count)
+            is_new = element.atomic_number in self._new
+            (newly_obtained if is_new else already_owned).append(entry)
+            by_rarity.setdefault(element.rarity_level, []).append((entry, is_new))
+        return DrawBatchResult(
+            success=True,
+            message="",
+            newly_obtained=newly_obtained,
+            already_owned=already_owned,
+            draw_nonce=getattr(self.engine.rng, "last_nonce", None),
+            banner_id=self.banner.banner_id if self.banner is not None else None,
+            by_rarity=by_rarity,
+        )
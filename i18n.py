@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+
+from data.elements import ELEMENTS
+
 SUPPORTED_LANGUAGES: dict[str, str] = {
     "zh": "繁體中文",
     "en": "English",
@@ -46,6 +49,10 @@ TEXTS: dict[str, dict[str, str]] = {
         "settings_save_cleared": "存檔已清除。",
         "settings_export_dialog_title": "匯出存檔",
         "settings_export_done": "已匯出到：{path}",
+        "save_failed": "存檔寫入失敗，最近的進度可能未保存。\n{path}\n{error}",
+        "fair_status": "公平模式承諾值：{commitment}（上一批次 nonce：{nonce}）",
+        "fair_reveal": "公開種子",
+        "fair_revealed": "伺服器種子：{server_seed}\n玩家種子：{client_seed}\n承諾值：{commitment}\n\n已複製到剪貼簿，可用 fairness.py 重算先前每一批次的結果。之後的抽卡改用新的承諾值。",
         "detail_panel_title": "元素詳細資料",
         "detail_placeholder": "點擊任一卡片查看詳細資料",
         "detail_atomic_number": "原子序",
@@ -116,6 +123,10 @@ TEXTS: dict[str, dict[str, str]] = {
         "settings_save_cleared": "Save cleared.",
         "settings_export_dialog_title": "Export Save",
         "settings_export_done": "Exported to: {path}",
+        "save_failed": "Could not write the save file; recent progress may not be saved.\n{path}\n{error}",
+        "fair_status": "Fair mode commitment: {commitment} (last batch nonce: {nonce})",
+        "fair_reveal": "Reveal seed",
+        "fair_revealed": "Server seed: {server_seed}\nClient seed: {client_seed}\nCommitment: {commitment}\n\nCopied to the clipboard; fairness.py re-derives every earlier batch from it. Later draws use a new commitment.",
         "detail_panel_title": "Element Details",
         "detail_placeholder": "Click any card to view details",
         "detail_atomic_number": "Atomic Number",
@@ -186,6 +197,10 @@ TEXTS: dict[str, dict[str, str]] = {
         "settings_save_cleared": "セーブを削除しました。",
         "settings_export_dialog_title": "セーブ書き出し",
         "settings_export_done": "書き出し先：{path}",
+        "save_failed": "セーブデータを書き込めませんでした。最近の進行状況が保存されていない可能性があります。\n{path}\n{error}",
+        "fair_status": "公正モードのコミットメント：{commitment}（前回のバッチ nonce：{nonce}）",
+        "fair_reveal": "シードを公開",
+        "fair_revealed": "サーバーシード：{server_seed}\nクライアントシード：{client_seed}\nコミットメント：{commitment}\n\nクリップボードにコピーしました。fairness.py でこれまでの各バッチを再計算できます。以降のガチャは新しいコミットメントを使います。",
         "detail_panel_title": "元素詳細",
         "detail_placeholder": "カードをクリックすると詳細を表示します",
         "detail_atomic_number": "原子番号",
@@ -256,6 +271,10 @@ TEXTS: dict[str, dict[str, str]] = {
         "settings_save_cleared": "저장이 삭제되었습니다.",
         "settings_export_dialog_title": "저장 내보내기",
         "settings_export_done": "내보낸 위치: {path}",
+        "save_failed": "저장 파일을 쓰지 못했습니다. 최근 진행 상황이 저장되지 않았을 수 있습니다.\n{path}\n{error}",
+        "fair_status": "공정 모드 커밋먼트: {commitment} (마지막 배치 nonce: {nonce})",
+        "fair_reveal": "시드 공개",
+        "fair_revealed": "서버 시드: {server_seed}\n클라이언트 시드: {client_seed}\n커밋먼트: {commitment}\n\n클립보드에 복사했습니다. fairness.py로 이전 각 배치 결과를 다시 계산할 수 있습니다. 이후 뽑기는 새 커밋먼트를 사용합니다.",
         "detail_panel_title": "원소 상세 정보",
         "detail_placeholder": "카드를 클릭하면 상세 정보를 표시합니다",
         "detail_atomic_number": "원자 번호",
@@ -383,34 +402,85 @@ _KO_ELEMENT_NAMES: dict[int, str] = {
 }
 
 
+class CompiledCatalog:
+    """
+    Every string of one language with the zh fallback already applied and all
+    element names materialized. Built once per language.
+    """
+
+    def __init__(self, language: str) -> None:
+        self.language = language
+        keys = {key for texts in TEXTS.values() for key in texts}
+        own = TEXTS.get(language, {})
+        fallback = TEXTS["zh"]
+        self.texts: dict[str, str] = {key: own.get(key) or fallback.get(key) or key for key in keys}
+        self.element_names: dict[int, str] = {
+            element.atomic_number: _resolve_element_name(language, element.atomic_number, element.name_zh, element.name_en)
+            for element in ELEMENTS
+        }
+
+    def text(self, key: str, **kwargs: object) -> str:
+        text = self.texts.get(key, key)
+        return text.format(**kwargs) if kwargs else text
+
+    def many(self, *keys: str) -> dict[str, str]:
+        """Plain (unformatted) strings for several keys in one call."""
+        texts = self.texts
+        return {key: texts.get(key, key) for key in keys}
+
+    def rarity_label(self, rarity: int) -> str:
+        return self.texts.get(f"rarity_{rarity}", f"rarity_{rarity}")
+
+    def collection_section_title(self, rarity: int) -> str:
+        return self.texts.get(f"collection_section_{rarity}", f"collection_section_{rarity}")
+
+    def periodic_category_label(self, category: str) -> str:
+        return self.texts.get(f"category_{category}", f"category_{category}")
+
+    def element_name(self, atomic_number: int, name_zh: str, name_en: str) -> str:
+        name = self.element_names.get(atomic_number)
+        if name is None:
+            return _resolve_element_name(self.language, atomic_number, name_zh, name_en)
+        return name
+
+
+_CATALOGS: dict[str, CompiledCatalog] = {}
+
+
 def normalize_language(value: str | None) -> str:
     if value in SUPPORTED_LANGUAGES:
         return value
     return "zh"
 
 
-def t(language: str, key: str, **kwargs: object) -> str:
+def get_catalog(language: str | None) -> CompiledCatalog:
+    # Keyed by normalized code only, so arbitrary inputs cannot grow the cache.
     lang = normalize_language(language)
-    text = TEXTS.get(lang, {}).get(key) or TEXTS["zh"].get(key) or key
-    if kwargs:
-        return text.format(**kwargs)
-    return text
+    catalog = _CATALOGS.get(lang)
+    if catalog is None:
+        catalog = CompiledCatalog(lang)
+        _CATALOGS[lang] = catalog
+    return catalog
+
+
+def t(language: str, key: str, **kwargs: object) -> str:
+    text = get_catalog(language).texts.get(key, key)
+    return text.format(**kwargs) if kwargs else text
 
 
 def rarity_label(language: str, rarity: int) -> str:
-    return t(language, f"rarity_{rarity}")
+    return get_catalog(language).rarity_label(rarity)
 
 
 def collection_section_title(language: str, rarity: int) -> str:
-    return t(language, f"collection_section_{rarity}")
+    return get_catalog(language).collection_section_title(rarity)
 
 
 def periodic_category_label(language: str, category: str) -> str:
-    return t(language, f"category_{category}")
+    return get_catalog(language).periodic_category_label(category)
 
 
-def element_name(language: str, atomic_number: int, name_zh: str, name_en: str) -> str:
-    lang = normalize_language(language)
+def _resolve_element_name(lang: str, atomic_number: int, name_zh: str, name_en: str) -> str:
     if lang == "zh":
         return name_zh
     if lang == "ja":
@@ -418,3 +488,7 @@ def element_name(language: str, atomic_number: int, name_zh: str, name_en: str)
     if lang == "ko":
         return _KO_ELEMENT_NAMES.get(atomic_number, name_en)
     return name_en
+
+
+def element_name(language: str, atomic_number: int, name_zh: str, name_en: str) -> str:
+    return get_catalog(language).element_name(atomic_number, name_zh, name_en)
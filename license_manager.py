@@ -5,10 +5,10 @@ import json
 import shutil
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from cryptography.exceptions import InvalidSignature
-from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 
 PUBLIC_KEY_B64 = "9fBzaDG+VBIkoAltzQCrG0ojQMRtKMfSdje6lJIcJNg="
 LICENSE_FILENAME = "license.json"
@@ -42,22 +42,41 @@ def _decode_b64(value: str) -> bytes:
     return base64.b64decode(padded, validate=True)
 
 
-def _load_public_key() -> Ed25519PublicKey:
+def _load_public_key() -> "Ed25519PublicKey":
+    # cryptography is imported on first verification, which the app runs after first paint.
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
     key_raw = _decode_b64(PUBLIC_KEY_B64)
     if len(key_raw) != 32:
         raise ValueError("public_key_invalid_length")
     return Ed25519PublicKey.from_public_bytes(key_raw)
 
 
+def _verify_signature(signature: bytes, payload: bytes) -> str:
+    try:
+        public_key = _load_public_key()
+    except Exception:
+        return "public_key_invalid"
+
+    from cryptography.exceptions import InvalidSignature
+
+    try:
+        public_key.verify(signature, payload)
+    except InvalidSignature:
+        return "bad_signature"
+    except Exception:
+        return "verify_error"
+    return "ok"
+
+
 def load_license() -> tuple[bool, str, dict[str, Any] | None]:
     path = _license_path()
     if not path.exists():
         return False, "license_not_found", None
 
     try:
-        raw = path.read_text(encoding="utf-8")
-        data = json.loads(raw)
-    except (OSError, json.JSONDecodeError):
+        data = json.loads(path.read_bytes().decode("utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
         return False, "license_parse_error", None
 
     if not isinstance(data, dict):
@@ -87,19 +106,9 @@ def load_license() -> tuple[bool, str, dict[str, Any] | None]:
     except Exception:
         return False, "sig_base64_invalid", None
 
-    try:
-        public_key = _load_public_key()
-    except Exception:
-        return False, "public_key_invalid", None
-
-    payload = _canonical_payload_bytes(data)
-    try:
-        public_key.verify(signature, payload)
-    except InvalidSignature:
-        return False, "bad_signature", None
-    except Exception:
-        return False, "verify_error", None
-
+    reason = _verify_signature(signature, _canonical_payload_bytes(data))
+    if reason != "ok":
+        return False, reason, None
     return True, "ok", data
 
 
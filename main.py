@@ -1,18 +1,30 @@
 from __future__ import annotations
 
+import sys
+
+from startup import StartupProfiler, StartupTimer, profiling_requested
+
+# Started before the remaining imports so --profile-startup can time them.
+STARTUP_TIMER = StartupTimer()
+STARTUP_PROFILER = StartupProfiler(STARTUP_TIMER).start() if profiling_requested(sys.argv[1:]) else None
+
 import argparse
-import random
 import time
 import tkinter as tk
+from tkinter import messagebox
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable
 
 import config
 import i18n
+from data.banners import BANNER_SCHEDULE
 from data.elements import ELEMENTS
-from gacha import GachaEngine, collected_count
+from events import LANGUAGE_CHANGED, LICENSE_CHANGED, OWNERSHIP_CHANGED, TICKETS_CHANGED, EventBus
+from gacha import CollectionStats, DrawBatchResult, GachaEngine
 from license_manager import is_paid_unlocked
-from save import SaveData, get_save_path, load_save, write_save
+from persistence import SaveWorker
+from rng import RNG_BACKENDS, make_rng
+from save import DrawDelta, SaveData, get_save_path, load_save
 from ticket import replenish_tickets
 from ui import CollectionView, CongratsView, GachaView, MainMenu, SettingsView
 
@@ -24,69 +36,175 @@ except Exception:
     TkBase = tk.Tk
 
 
+STARTUP_TIMER.mark("imports")
+
+
+FRAME_CLASSES: tuple[type[tk.Frame], ...] = (MainMenu, GachaView, CollectionView, SettingsView, CongratsView)
+
+
 class ElementGachaApp(TkBase):
-    def __init__(self, seed: int | None = None, time_provider: Callable[[], float] | None = None) -> None:
+    def __init__(
+        self,
+        seed: int | None = None,
+        time_provider: Callable[[], float] | None = None,
+        rng_backend: str = "mt",
+        prebuild_frames: bool = True,
+        startup_timer: StartupTimer | None = None,
+        on_startup_complete: Callable[["ElementGachaApp"], None] | None = None,
+    ) -> None:
+        self.startup_timer = startup_timer or StartupTimer()
         super().__init__()
         self.geometry(config.WINDOW_SIZE)
         self.minsize(920, 640)
         self.state("zoomed")
         self.configure(bg=config.SPACE_BLUE_BG)
+        self.startup_timer.mark("tk_root")
 
         self.time_provider: Callable[[], float] = time_provider or time.time
         self.save_path: Path = get_save_path()
-        self.state: SaveData = load_save(self.save_path, now=self.time_provider())
-        paid_unlocked, self.license_reason = is_paid_unlocked()
-        self.state.paid_unlocked = paid_unlocked
+        with self.startup_timer.measure("load_save"):
+            self.state: SaveData = load_save(self.save_path, now=self.time_provider())
+        # The license signature is checked right after first paint (_verify_license). Until
+        # then the app is in free mode and tickets are not replenished, so nothing is granted
+        # on the strength of unverified files.
+        self.state.paid_unlocked = False
+        self.license_reason = "license_pending"
         self.state.ui_language = i18n.normalize_language(self.state.ui_language)
-        replenish_tickets(self.state, now=self.time_provider())
+        self.persistence = SaveWorker(self.save_path, journal_seq=self.state.journal_seq)
+        self.stats = CollectionStats(ELEMENTS, self.state)
+        self.events = EventBus()
+        self.events.subscribe(OWNERSHIP_CHANGED, self.mark_collection_dirty)
+        self.events.subscribe(LANGUAGE_CHANGED, self._on_language_changed)
         self.title(self.tr("app_title"))
 
-        self.rng = random.Random(seed)
-        self.gacha_engine = GachaEngine(ELEMENTS, rng=self.rng)
+        self.rng = make_rng(rng_backend, seed)
+        self.gacha_engine = GachaEngine(ELEMENTS, rng=self.rng, banners=BANNER_SCHEDULE, time_provider=self.time_provider)
 
-        container = tk.Frame(self, bg=config.SPACE_BLUE_BG)
-        container.pack(fill="both", expand=True)
-        container.grid_rowconfigure(0, weight=1)
-        container.grid_columnconfigure(0, weight=1)
+        self.container = tk.Frame(self, bg=config.SPACE_BLUE_BG)
+        self.container.pack(fill="both", expand=True)
+        self.container.grid_rowconfigure(0, weight=1)
+        self.container.grid_columnconfigure(0, weight=1)
 
+        # Frames are built on first use; the rest are prebuilt one per idle slot after first paint.
+        self.frame_classes: dict[str, type[tk.Frame]] = {frame_cls.__name__: frame_cls for frame_cls in FRAME_CLASSES}
         self.frames: dict[str, tk.Frame] = {}
         self.current_frame: tk.Frame | None = None
-
-        for frame_cls in (MainMenu, GachaView, CollectionView, SettingsView, CongratsView):
-            frame = frame_cls(container, self)
-            self.frames[frame_cls.__name__] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
+        self._prebuild_queue: list[str] = [name for name in self.frame_classes if name != "MainMenu"] if prebuild_frames else []
+        self._on_startup_complete = on_startup_complete
 
         self.protocol("WM_DELETE_WINDOW", self.on_close)
         self.show_frame("MainMenu")
+        self.after_idle(self._after_first_paint)
+
+    def get_frame(self, frame_name: str) -> tk.Frame:
+        frame = self.frames.get(frame_name)
+        if frame is None:
+            with self.startup_timer.measure(f"frame:{frame_name}"):
+                frame = self.frame_classes[frame_name](self.container, self)
+                frame.grid(row=0, column=0, sticky="nsew")
+            self.frames[frame_name] = frame
+            if self.current_frame is not None:
+                self.current_frame.tkraise()
+        return frame
+
+    def _after_first_paint(self) -> None:
+        self.update_idletasks()
+        self.startup_timer.mark("first_paint")
+        self._verify_license()
+        self._prebuild_next()
+
+    def _verify_license(self) -> None:
+        with self.startup_timer.measure("license"):
+            paid_unlocked, reason = is_paid_unlocked()
+        self.set_paid_unlocked(paid_unlocked, reason)
+        replenish_tickets(self.state, now=self.time_provider())
+        self.events.publish(TICKETS_CHANGED)
+
+    def _prebuild_next(self) -> None:
+        while self._prebuild_queue:
+            frame_name = self._prebuild_queue.pop(0)
+            if frame_name not in self.frames:
+                self.get_frame(frame_name)
+                # Yield to the event loop between frames so input stays responsive.
+                self.after_idle(self._prebuild_next)
+                return
+        self.startup_timer.mark("frames_ready")
+        if self._on_startup_complete is not None:
+            callback, self._on_startup_complete = self._on_startup_complete, None
+            callback(self)
 
-    def persist(self) -> None:
-        write_save(self.state, self.save_path)
+    def persist(self, wait: bool = False) -> None:
+        self.persistence.submit(self.state)
+        if wait:
+            self.persistence.flush()
+
+    def commit_draw(self, result: DrawBatchResult) -> None:
+        """Persist a finished draw batch and notify listeners of the changes."""
+        owned = {entry.element.atomic_number: entry.count for entry in (*result.newly_obtained, *result.already_owned)}
+        delta = DrawDelta(
+            owned=owned,
+            draws=sum(owned.values()),
+            ticket_count=self.state.ticket_count,
+            last_ticket_ts=self.state.last_ticket_ts,
+        )
+        self.persistence.submit(self.state, delta)
+        self.events.publish(OWNERSHIP_CHANGED, set(owned))
+        self.events.publish(TICKETS_CHANGED)
+
+    def replace_state(self, load: Callable[[], SaveData]) -> None:
+        # Pending writes must land before the save file is replaced underneath the worker.
+        self.persistence.flush()
+        self.state = load()
+        self.persistence.reset(self.state.journal_seq)
+        self.stats.rebuild(self.state)
+        self.events.publish(OWNERSHIP_CHANGED)
+        self.events.publish(TICKETS_CHANGED)
+
+    def set_paid_unlocked(self, paid_unlocked: bool, reason: str) -> None:
+        self.license_reason = reason
+        if paid_unlocked == self.state.paid_unlocked:
+            return
+        self.state.paid_unlocked = paid_unlocked
+        self.events.publish(LICENSE_CHANGED)
+
+    def mark_collection_dirty(self, atomic_numbers: Iterable[int] | None = None) -> None:
+        collection = self.frames.get("CollectionView")
+        if isinstance(collection, CollectionView):
+            collection.mark_dirty(atomic_numbers)
 
     def on_close(self) -> None:
         replenish_tickets(self.state, now=self.time_provider())
         self.persist()
+        self.persistence.stop()
+        error = self.persistence.last_error
+        if error is not None:
+            # The final write failed even after a retry; don't exit as if progress was saved.
+            message = self.tr("save_failed", path=self.save_path, error=error)
+            print(message, file=sys.stderr)
+            messagebox.showerror(self.tr("app_title"), message, parent=self)
         self.destroy()
 
+    @property
+    def catalog(self) -> i18n.CompiledCatalog:
+        return i18n.get_catalog(self.state.ui_language)
+
     def tr(self, key: str, **kwargs: object) -> str:
-        return i18n.t(self.state.ui_language, key, **kwargs)
+        return self.catalog.text(key, **kwargs)
+
+    def texts(self, *keys: str) -> dict[str, str]:
+        return self.catalog.many(*keys)
 
     def rarity_label(self, rarity: int) -> str:
-        return i18n.rarity_label(self.state.ui_language, rarity)
+        return self.catalog.rarity_label(rarity)
 
     def collection_section_title(self, rarity: int) -> str:
-        return i18n.collection_section_title(self.state.ui_language, rarity)
+        return self.catalog.collection_section_title(rarity)
 
     def periodic_category_label(self, category: str) -> str:
-        return i18n.periodic_category_label(self.state.ui_language, category)
+        return self.catalog.periodic_category_label(category)
 
     def element_name(self, element: "Element") -> str:
-        return i18n.element_name(
-            self.state.ui_language,
-            element.atomic_number,
-            element.name_zh,
-            element.name_en,
-        )
+        return self.catalog.element_name(element.atomic_number, element.name_zh, element.name_en)
 
     def set_language(self, language: str) -> None:
         normalized = i18n.normalize_language(language)
@@ -94,9 +212,13 @@ class ElementGachaApp(TkBase):
             return
         self.state.ui_language = normalized
         self.title(self.tr("app_title"))
-        self.refresh_all_texts()
+        self.events.publish(LANGUAGE_CHANGED)
         self.persist()
 
+    def _on_language_changed(self, _: object = None) -> None:
+        self.mark_collection_dirty()
+        self.refresh_all_texts()
+
     def refresh_all_texts(self) -> None:
         for frame in self.frames.values():
             if hasattr(frame, "refresh_texts"):
@@ -108,7 +230,7 @@ class ElementGachaApp(TkBase):
         if self.current_frame is not None and hasattr(self.current_frame, "on_hide"):
             getattr(self.current_frame, "on_hide")()
 
-        frame = self.frames[frame_name]
+        frame = self.get_frame(frame_name)
         frame.tkraise()
         self.current_frame = frame
 
@@ -116,20 +238,46 @@ class ElementGachaApp(TkBase):
             getattr(frame, "on_show")()
 
     def check_completion_and_show(self, previous_collected: int) -> None:
-        current_collected = collected_count(self.state, ELEMENTS)
-        if previous_collected < 118 and current_collected >= 118:
+        if previous_collected < self.stats.element_total and self.stats.is_complete:
             self.show_frame("CongratsView")
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="元素抽卡收集（tkinter 單機版）")
     parser.add_argument("--seed", type=int, default=None, help="指定隨機種子（測試用途）")
+    parser.add_argument("--rng", choices=RNG_BACKENDS, default="mt", help="亂數產生器（philox 可依抽數定位、平行產生，未安裝 NumPy 時大量抽卡較慢；fair 為可公開驗證的承諾-公開模式，搭配 --seed 時伺服器種子可預測，僅供測試）")
+    parser.add_argument("--no-prebuild", action="store_true", help="不在閒置時預先建立其他畫面")
+    parser.add_argument("--startup-report", action="store_true", help="啟動完成後輸出各階段耗時")
+    parser.add_argument(
+        "--profile-startup",
+        type=Path,
+        nargs="?",
+        const=Path("startup_profile"),
+        default=None,
+        metavar="DIR",
+        help="記錄匯入與啟動各階段耗時，輸出 JSON 與 cProfile 檔案後結束程式",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    app = ElementGachaApp(seed=args.seed)
+
+    def report_startup(app: ElementGachaApp) -> None:
+        if args.startup_report:
+            print(app.startup_timer.format_report())
+        if STARTUP_PROFILER is not None and args.profile_startup is not None:
+            json_path, stats_path = STARTUP_PROFILER.finish(args.profile_startup)
+            print(f"Wrote {json_path} and {stats_path}")
+            app.on_close()
+
+    app = ElementGachaApp(
+        seed=args.seed,
+        rng_backend=args.rng,
+        prebuild_frames=not args.no_prebuild,
+        startup_timer=STARTUP_TIMER,
+        on_startup_complete=report_startup if args.startup_report or args.profile_startup is not None else None,
+    )
     app.mainloop()
 
 
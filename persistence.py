@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import config
+from save import DrawDelta, SaveData, append_draw_journal, write_save
+
+
+class SaveWorker:
+    """
+    Writes saves off the Tk main thread.
+
+    Callers hand over a copy of the state on every change; notifications that
+    arrive within one debounce window are coalesced into a single write (one
+    journal append for draw-only changes, otherwise a full snapshot).
+    A failed write is queued again, unless a newer snapshot superseded it, and
+    retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        save_path: Path,
+        journal_seq: int = 0,
+        debounce_seconds: float = config.SAVE_DEBOUNCE_SECONDS,
+    ) -> None:
+        self.save_path = save_path
+        self.debounce_seconds = max(0.0, debounce_seconds)
+        self.last_error: Exception | None = None
+        self.writes = 0
+        self.failed_writes = 0
+
+        self._cond = threading.Condition()
+        self._snapshot: SaveData | None = None
+        self._delta: DrawDelta | None = None
+        self._full_write = False
+        self._deadline = 0.0
+        self._flush_requested = False
+        self._writing = False
+        self._stopping = False
+        self._journal_seq = journal_seq
+        self._needs_full_write = False
+        self._retry_streak = 0
+
+        self._thread = threading.Thread(target=self._run, name="SaveWorker", daemon=True)
+        self._thread.start()
+
+    def submit(self, state: SaveData, delta: DrawDelta | None = None) -> None:
+        snapshot = state.copy()
+        with self._cond:
+            if self._snapshot is None:
+                self._deadline = time.monotonic() + self.debounce_seconds
+            self._snapshot = snapshot
+            if delta is None:
+                self._full_write = True
+                self._delta = None
+            elif not self._full_write:
+                self._delta = delta if self._delta is None else self._delta.merged(delta)
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        with self._cond:
+            if self._snapshot is None and not self._writing:
+                return
+            self._flush_requested = True
+            self._cond.notify_all()
+            failed_before = self.failed_writes
+            # Timed wait: if the worker thread died it will never notify again.
+            while (self._snapshot is not None or self._writing) and self._thread.is_alive():
+                if self.failed_writes > failed_before:
+                    # One immediate attempt failed; the snapshot stays queued for retry.
+                    break
+                self._cond.wait(0.1)
+            self._flush_requested = False
+
+    def reset(self, journal_seq: int) -> None:
+        # Call after the save file was replaced directly (clear/import) and flush().
+        with self._cond:
+            self._journal_seq = journal_seq
+
+    def stop(self) -> None:
+        if not self._thread.is_alive():
+            return
+        self.flush()
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopping:
+                    if self._snapshot is not None:
+                        remaining = self._deadline - time.monotonic()
+                        if self._flush_requested or remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if self._snapshot is None:
+                    return
+                snapshot, delta, full_write = self._snapshot, self._delta, self._full_write
+                self._snapshot, self._delta, self._full_write = None, None, False
+                self._writing = True
+
+            failed = False
+            try:
+                self._write(snapshot, delta, full_write)
+                self.last_error = None
+            except Exception as exc:
+                # Never let a bad write kill the thread (flush/stop would hang on exit).
+                # The dropped delta is still in the retried snapshot, so write that in full.
+                self.last_error = exc
+                self._needs_full_write = True
+                failed = True
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self.writes += 1
+                    if failed:
+                        self.failed_writes += 1
+                        self._retry_streak += 1
+                        # A pending flush gets this one attempt; retries wait for the backoff.
+                        self._flush_requested = False
+                        if self._snapshot is None and not self._stopping:
+                            self._snapshot, self._delta, self._full_write = snapshot, None, True
+                            self._deadline = time.monotonic() + self._retry_delay()
+                    else:
+                        self._retry_streak = 0
+                    self._cond.notify_all()
+
+    def _retry_delay(self) -> float:
+        delay = config.SAVE_RETRY_BASE_SECONDS * 2 ** min(self._retry_streak - 1, 16)
+        return min(config.SAVE_RETRY_MAX_SECONDS, delay)
+
+    def _write(self, snapshot: SaveData, delta: DrawDelta | None, full_write: bool) -> None:
+        snapshot.journal_seq = self._journal_seq
+        if full_write or delta is None or self._needs_full_write:
+            write_save(snapshot, self.save_path)
+            self._needs_full_write = False
+        else:
+            append_draw_journal(snapshot, delta, self.save_path)
+        self._journal_seq = snapshot.journal_seq
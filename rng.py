@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import secrets
+from typing import TYPE_CHECKING, Any, MutableSequence, Sequence
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from fairness import FairDrawSource
+
+RNG_BACKENDS: tuple[str, ...] = ("mt", "philox", "fair")
+
+_MASK32 = 0xFFFFFFFF
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_PHILOX_M0 = 0xD2511F53
+_PHILOX_M1 = 0xCD9E8D57
+_PHILOX_W0 = 0x9E3779B9
+_PHILOX_W1 = 0xBB67AE85
+_PHILOX_ROUNDS = 10
+_TWO_POW_26 = 67108864.0
+_TWO_POW_53 = 9007199254740992.0
+
+
+def _seed_key(seed: int | str | bytes | None) -> tuple[int, int]:
+    if seed is None:
+        value = secrets.randbits(64)
+    elif isinstance(seed, int) and 0 <= seed <= _MASK64:
+        value = seed
+    else:
+        raw = seed if isinstance(seed, bytes) else str(seed).encode("utf-8")
+        value = int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "little")
+    return value & _MASK32, value >> 32
+
+
+def philox4x32(counter: Sequence[int], key: Sequence[int]) -> tuple[int, int, int, int]:
+    """One Philox4x32-10 block (Salmon et al., SC'11)."""
+    c0, c1, c2, c3 = counter
+    k0, k1 = key
+    for round_index in range(_PHILOX_ROUNDS):
+        if round_index:
+            k0 = (k0 + _PHILOX_W0) & _MASK32
+            k1 = (k1 + _PHILOX_W1) & _MASK32
+        p0 = _PHILOX_M0 * c0
+        p1 = _PHILOX_M1 * c2
+        c0, c1, c2, c3 = (p1 >> 32) ^ c1 ^ k0, p1 & _MASK32, (p0 >> 32) ^ c3 ^ k1, p0 & _MASK32
+    return c0, c1, c2, c3
+
+
+class PhiloxRandom:
+    """
+    Counter-based generator: value N of a (seed, stream) pair is a pure function of N,
+    so any draw can be computed directly and ranges can be generated in parallel.
+
+    Each Philox block yields two 64-bit slots; slot N becomes the N-th uniform with the
+    same 53-bit construction as random.random(). `position` is the next slot for the
+    sequential random.Random-style methods.
+    """
+
+    def __init__(self, seed: int | str | bytes | None = None, stream: int = 0) -> None:
+        self.key = _seed_key(seed)
+        self.stream = stream & _MASK64
+        self.position = 0
+        self._cached_index = -1
+        self._cached_block: tuple[int, int, int, int] = (0, 0, 0, 0)
+
+    def _block(self, block_index: int) -> tuple[int, int, int, int]:
+        if block_index != self._cached_index:
+            counter = (block_index & _MASK32, (block_index >> 32) & _MASK32, self.stream & _MASK32, self.stream >> 32)
+            self._cached_block = philox4x32(counter, self.key)
+            self._cached_index = block_index
+        return self._cached_block
+
+    def _words(self, slot: int) -> tuple[int, int]:
+        block = self._block(slot >> 1)
+        if slot & 1:
+            return block[2], block[3]
+        return block[0], block[1]
+
+    def raw64_at(self, slot: int) -> int:
+        high, low = self._words(slot)
+        return (high << 32) | low
+
+    def uniform_at(self, slot: int) -> float:
+        high, low = self._words(slot)
+        return ((high >> 5) * _TWO_POW_26 + (low >> 6)) / _TWO_POW_53
+
+    def uniforms(self, start: int, count: int) -> Sequence[float]:
+        """Uniforms for slots [start, start + count); does not move `position`."""
+        if count <= 0:
+            return []
+        # Same arithmetic as philox4x32 + uniform_at, inlined per block: the pure-Python
+        # fallback for batches has to avoid per-slot call overhead.
+        first_block = start >> 1
+        last_block = (start + count - 1) >> 1
+        s0, s1 = self.stream & _MASK32, self.stream >> 32
+        keys = []
+        k0, k1 = self.key
+        for round_index in range(_PHILOX_ROUNDS):
+            if round_index:
+                k0 = (k0 + _PHILOX_W0) & _MASK32
+                k1 = (k1 + _PHILOX_W1) & _MASK32
+            keys.append((k0, k1))
+        m0, m1, mask = _PHILOX_M0, _PHILOX_M1, _MASK32
+        scale, norm = _TWO_POW_26, _TWO_POW_53
+        values: list[float] = []
+        append = values.append
+        for block_index in range(first_block, last_block + 1):
+            c0, c1, c2, c3 = block_index & mask, (block_index >> 32) & mask, s0, s1
+            for k0, k1 in keys:
+                p0 = m0 * c0
+                p1 = m1 * c2
+                c0, c1, c2, c3 = (p1 >> 32) ^ c1 ^ k0, p1 & mask, (p0 >> 32) ^ c3 ^ k1, p0 & mask
+            append(((c0 >> 5) * scale + (c1 >> 6)) / norm)
+            append(((c2 >> 5) * scale + (c3 >> 6)) / norm)
+        offset = start - first_block * 2
+        return values[offset : offset + count]
+
+    def seek(self, position: int) -> None:
+        if position < 0:
+            raise ValueError("RNG position must be non-negative.")
+        self.position = position
+
+    def jumped(self, slots: int) -> "PhiloxRandom":
+        clone = type(self).__new__(type(self))
+        clone.key = self.key
+        clone.stream = self.stream
+        clone.position = self.position + slots
+        clone._cached_index = -1
+        clone._cached_block = (0, 0, 0, 0)
+        return clone
+
+    # random.Random-compatible subset used by the engine and simulations.
+
+    def random(self) -> float:
+        value = self.uniform_at(self.position)
+        self.position += 1
+        return value
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        value = 0
+        produced = 0
+        while produced < k:
+            value = (value << 64) | self.raw64_at(self.position)
+            self.position += 1
+            produced += 64
+        return value >> (produced - k)
+
+    def randrange(self, stop: int) -> int:
+        if stop <= 0:
+            raise ValueError("empty range for randrange()")
+        bits = stop.bit_length()
+        while True:
+            value = self.getrandbits(bits)
+            if value < stop:
+                return value
+
+    def shuffle(self, items: MutableSequence[Any]) -> None:
+        for index in range(len(items) - 1, 0, -1):
+            other = self.randrange(index + 1)
+            items[index], items[other] = items[other], items[index]
+
+    def getstate(self) -> tuple[tuple[int, int], int, int]:
+        return self.key, self.stream, self.position
+
+    def setstate(self, state: tuple[tuple[int, int], int, int]) -> None:
+        self.key, self.stream, self.position = state
+        self._cached_index = -1
+
+
+class NumpyPhiloxRandom(PhiloxRandom):
+    """Same streams as PhiloxRandom; ranges are generated with vectorized NumPy arithmetic."""
+
+    def _blocks(self, first_block: int, block_count: int) -> "np.ndarray":
+        index = np.arange(first_block, first_block + block_count, dtype=np.uint64)
+        mask = np.uint64(_MASK32)
+        shift = np.uint64(32)
+        c0 = index & mask
+        c1 = index >> shift
+        c2 = np.full(block_count, self.stream & _MASK32, dtype=np.uint64)
+        c3 = np.full(block_count, self.stream >> 32, dtype=np.uint64)
+        k0, k1 = self.key
+        m0 = np.uint64(_PHILOX_M0)
+        m1 = np.uint64(_PHILOX_M1)
+        for round_index in range(_PHILOX_ROUNDS):
+            if round_index:
+                k0 = (k0 + _PHILOX_W0) & _MASK32
+                k1 = (k1 + _PHILOX_W1) & _MASK32
+            p0 = c0 * m0
+            p1 = c2 * m1
+            c0, c1, c2, c3 = (p1 >> shift) ^ c1 ^ np.uint64(k0), p1 & mask, (p0 >> shift) ^ c3 ^ np.uint64(k1), p0 & mask
+        return np.stack((c0, c1, c2, c3), axis=1)
+
+    def uniforms(self, start: int, count: int) -> Sequence[float]:
+        if count <= 0:
+            return np.empty(0, dtype=np.float64)
+        first_block = start >> 1
+        last_block = (start + count - 1) >> 1
+        words = self._blocks(first_block, last_block - first_block + 1).reshape(-1, 2)
+        words = words[start - first_block * 2 : start - first_block * 2 + count]
+        high = (words[:, 0] >> np.uint64(5)).astype(np.float64)
+        low = (words[:, 1] >> np.uint64(6)).astype(np.float64)
+        return (high * _TWO_POW_26 + low) / _TWO_POW_53
+
+
+def make_rng(
+    backend: str = "mt",
+    seed: int | str | None = None,
+    stream: int = 0,
+) -> random.Random | PhiloxRandom | FairDrawSource:
+    if backend == "mt":
+        return random.Random(seed)
+    if backend == "philox":
+        rng_cls = NumpyPhiloxRandom if NUMPY_AVAILABLE else PhiloxRandom
+        return rng_cls(seed, stream=stream)
+    if backend == "fair":
+        from fairness import FairDrawSource
+
+        # A fixed seed makes the server seed predictable, so it is only for tests and simulation.
+        server_seed = None if seed is None else hashlib.sha256(f"{seed}:{stream}".encode("utf-8")).digest()
+        return FairDrawSource(server_seed=server_seed)
+    raise ValueError(f"Unknown RNG backend: {backend}")
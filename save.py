@@ -1,14 +1,112 @@
 from __future__ import annotations
 
 import json
-import shutil
+import os
+import struct
+import tempfile
 import time
-from dataclasses import dataclass, field
+import zlib
+from collections.abc import Iterator, Mapping, MutableMapping
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
 import config
 import i18n
+from data.elements import ELEMENTS
+
+BINARY_MAGIC = b"EGSV"
+# magic, format, flags, ticket_count, last_ticket_ts, total_draws, journal_seq, ui_language, slot_count
+BINARY_HEADER = struct.Struct("<4sHBxIdQQ4sH")
+BINARY_CHECKSUM = struct.Struct("<I")
+OWNED_SLOTS = 118
+_FLAG_PAID_UNLOCKED = 0x01
+
+_RARITY_BY_ATOMIC_NUMBER: dict[int, int] = {element.atomic_number: element.rarity_level for element in ELEMENTS}
+RARITY_SIZES: dict[int, int] = {
+    rarity: sum(1 for element in ELEMENTS if element.rarity_level == rarity) for rarity in config.RARITY_WEIGHTS
+}
+
+
+class OwnedCounts(MutableMapping[int, int]):
+    """
+    Owned card counts in a dense list indexed by atomic number.
+    Behaves like the old dict[int, int] (only counts > 0 are keys) while keeping
+    the collected total, card total and per-rarity collected counts up to date.
+    """
+
+    __slots__ = ("_counts", "collected", "total", "_collected_by_rarity")
+
+    def __init__(self, initial: Mapping[int, int] | None = None) -> None:
+        self._counts: list[int] = [0] * (OWNED_SLOTS + 1)
+        self.collected = 0
+        self.total = 0
+        self._collected_by_rarity: dict[int, int] = {rarity: 0 for rarity in RARITY_SIZES}
+        if initial:
+            for atomic_number, count in initial.items():
+                self[atomic_number] = count
+
+    def get(self, atomic_number: int, default: int = 0) -> int:  # type: ignore[override]
+        if 0 < atomic_number < len(self._counts):
+            count = self._counts[atomic_number]
+            if count > 0:
+                return count
+        return default
+
+    def __getitem__(self, atomic_number: int) -> int:
+        count = self.get(atomic_number)
+        if count <= 0:
+            raise KeyError(atomic_number)
+        return count
+
+    def __setitem__(self, atomic_number: int, count: int) -> None:
+        if not 1 <= atomic_number <= OWNED_SLOTS:
+            raise KeyError(atomic_number)
+        count = max(0, int(count))
+        previous = self._counts[atomic_number]
+        self._counts[atomic_number] = count
+        self.total += count - previous
+        if (previous > 0) != (count > 0):
+            step = 1 if count > 0 else -1
+            self.collected += step
+            rarity = _RARITY_BY_ATOMIC_NUMBER.get(atomic_number)
+            if rarity is not None:
+                self._collected_by_rarity[rarity] += step
+
+    def __delitem__(self, atomic_number: int) -> None:
+        if self.get(atomic_number) <= 0:
+            raise KeyError(atomic_number)
+        self[atomic_number] = 0
+
+    def __iter__(self) -> Iterator[int]:
+        return (atomic_number for atomic_number, count in enumerate(self._counts) if count > 0)
+
+    def __len__(self) -> int:
+        return self.collected
+
+    def __repr__(self) -> str:
+        return f"OwnedCounts({dict(self.items())!r})"
+
+    def increment(self, atomic_number: int, count: int = 1) -> bool:
+        """Add `count` cards; returns True when this made the element newly collected."""
+        previous = self.get(atomic_number)
+        self[atomic_number] = previous + count
+        return previous <= 0 < previous + count
+
+    def collected_in_rarity(self, rarity: int) -> int:
+        return self._collected_by_rarity.get(rarity, 0)
+
+    def slots(self) -> list[int]:
+        """Counts for atomic numbers 1..N, index 0 being hydrogen."""
+        return self._counts[1:]
+
+    def copy(self) -> "OwnedCounts":
+        clone = OwnedCounts.__new__(OwnedCounts)
+        clone._counts = list(self._counts)
+        clone.collected = self.collected
+        clone.total = self.total
+        clone._collected_by_rarity = dict(self._collected_by_rarity)
+        return clone
 
 
 @dataclass
@@ -17,9 +115,14 @@ class SaveData:
     ticket_count: int = 0
     last_ticket_ts: float = 0.0
     total_draws: int = 0
-    owned: dict[int, int] = field(default_factory=dict)
+    owned: OwnedCounts = field(default_factory=OwnedCounts)
     ui_language: str = "zh"
     version: str = config.SAVE_VERSION
+    journal_seq: int = 0
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.owned, OwnedCounts):
+            self.owned = OwnedCounts(self.owned)
 
     def to_dict(self) -> dict[str, Any]:
         owned_serialized = {str(key): value for key, value in sorted(self.owned.items())}
@@ -31,6 +134,38 @@ class SaveData:
             "owned": owned_serialized,
             "ui_language": self.ui_language,
             "version": self.version,
+            "journal_seq": self.journal_seq,
+        }
+
+    def copy(self) -> "SaveData":
+        return replace(self, owned=self.owned.copy())
+
+
+@dataclass(frozen=True)
+class DrawDelta:
+    owned: dict[int, int]
+    draws: int
+    ticket_count: int
+    last_ticket_ts: float
+
+    def merged(self, later: "DrawDelta") -> "DrawDelta":
+        owned = dict(self.owned)
+        for atomic_number, count in later.owned.items():
+            owned[atomic_number] = owned.get(atomic_number, 0) + count
+        return DrawDelta(
+            owned=owned,
+            draws=self.draws + later.draws,
+            ticket_count=later.ticket_count,
+            last_ticket_ts=later.last_ticket_ts,
+        )
+
+    def to_dict(self, seq: int) -> dict[str, Any]:
+        return {
+            "seq": seq,
+            "owned": {str(key): value for key, value in sorted(self.owned.items())},
+            "draws": self.draws,
+            "ticket_count": self.ticket_count,
+            "last_ticket_ts": self.last_ticket_ts,
         }
 
 
@@ -39,9 +174,25 @@ def default_save(now: float | None = None) -> SaveData:
     return SaveData(last_ticket_ts=current)
 
 
+def _version_major(version: str) -> int:
+    try:
+        return int(str(version).split(".", 1)[0])
+    except ValueError:
+        return 0
+
+
+def binary_format_enabled() -> bool:
+    return _version_major(config.SAVE_VERSION) >= config.SAVE_BINARY_MIN_VERSION
+
+
 def get_save_path() -> Path:
     config.SAVE_DIR.mkdir(parents=True, exist_ok=True)
-    return config.SAVE_DIR / config.SAVE_FILENAME
+    filename = config.SAVE_BINARY_FILENAME if binary_format_enabled() else config.SAVE_FILENAME
+    return config.SAVE_DIR / filename
+
+
+def get_journal_path(save_path: Path) -> Path:
+    return save_path.with_suffix(config.SAVE_JOURNAL_SUFFIX)
 
 
 def _normalize_owned(raw_owned: Any) -> dict[int, int]:
@@ -55,7 +206,7 @@ def _normalize_owned(raw_owned: Any) -> dict[int, int]:
             count = int(value)
         except (TypeError, ValueError):
             continue
-        if atomic_number < 1:
+        if not 1 <= atomic_number <= OWNED_SLOTS:
             continue
         normalized[atomic_number] = max(0, count)
     return normalized
@@ -67,42 +218,247 @@ def _build_save(payload: dict[str, Any], now: float) -> SaveData:
         ticket_count=max(0, int(payload.get("ticket_count", 0))),
         last_ticket_ts=float(payload.get("last_ticket_ts", payload.get("last_free_pull_ts", now))),
         total_draws=max(0, int(payload.get("total_draws", payload.get("total_pulls", 0)))),
-        owned=_normalize_owned(payload.get("owned", {})),
+        owned=OwnedCounts(_normalize_owned(payload.get("owned", {}))),
         ui_language=i18n.normalize_language(str(payload.get("ui_language", "zh"))),
         version=str(payload.get("version", config.SAVE_VERSION)),
+        journal_seq=max(0, int(payload.get("journal_seq", 0))),
     )
 
 
+def encode_binary_save(data: SaveData) -> bytes:
+    counts = [min(count, 0xFFFFFFFF) for count in data.owned.slots()]
+    slot_count = len(counts)
+
+    header = BINARY_HEADER.pack(
+        BINARY_MAGIC,
+        _version_major(data.version) or config.SAVE_BINARY_MIN_VERSION,
+        _FLAG_PAID_UNLOCKED if data.paid_unlocked else 0,
+        max(0, min(data.ticket_count, 0xFFFFFFFF)),
+        float(data.last_ticket_ts),
+        max(0, data.total_draws),
+        max(0, data.journal_seq),
+        data.ui_language.encode("ascii", "ignore")[:4],
+        slot_count,
+    )
+    body = header + struct.pack(f"<{slot_count}I", *counts)
+    return body + BINARY_CHECKSUM.pack(zlib.crc32(body))
+
+
+def decode_binary_save(raw: bytes) -> SaveData | None:
+    if len(raw) < BINARY_HEADER.size + BINARY_CHECKSUM.size or not raw.startswith(BINARY_MAGIC):
+        return None
+    body, checksum = raw[: -BINARY_CHECKSUM.size], raw[-BINARY_CHECKSUM.size :]
+    if BINARY_CHECKSUM.unpack(checksum)[0] != zlib.crc32(body):
+        return None
+
+    (
+        _,
+        format_version,
+        flags,
+        ticket_count,
+        last_ticket_ts,
+        total_draws,
+        journal_seq,
+        language,
+        slot_count,
+    ) = BINARY_HEADER.unpack_from(body)
+    counts_raw = body[BINARY_HEADER.size :]
+    if len(counts_raw) != 4 * slot_count:
+        return None
+    counts = struct.unpack(f"<{slot_count}I", counts_raw)
+
+    return SaveData(
+        paid_unlocked=bool(flags & _FLAG_PAID_UNLOCKED),
+        ticket_count=ticket_count,
+        last_ticket_ts=last_ticket_ts,
+        total_draws=total_draws,
+        owned=OwnedCounts({index + 1: count for index, count in enumerate(counts[:OWNED_SLOTS]) if count > 0}),
+        ui_language=i18n.normalize_language(language.rstrip(b"\0").decode("ascii", "ignore")),
+        version=f"{format_version}.0",
+        journal_seq=journal_seq,
+    )
+
+
+def read_save_file(path: Path, now: float | None = None) -> SaveData | None:
+    """Read a snapshot in either format; None when unreadable or corrupt."""
+    current = time.time() if now is None else now
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return None
+    if raw.startswith(BINARY_MAGIC):
+        return decode_binary_save(raw)
+    try:
+        payload = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    try:
+        return _build_save(payload, current)
+    except (TypeError, ValueError):
+        return None
+
+
+def _read_journal(journal_path: Path) -> list[dict[str, Any]]:
+    if not journal_path.exists():
+        return []
+    try:
+        lines = journal_path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+
+    entries: list[dict[str, Any]] = []
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            # A torn final append from a crash; everything before it is intact.
+            break
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+
+def _apply_journal(data: SaveData, entries: list[dict[str, Any]]) -> int:
+    applied = 0
+    for entry in entries:
+        try:
+            seq = int(entry["seq"])
+            draws = max(0, int(entry.get("draws", 0)))
+            ticket_count = max(0, int(entry["ticket_count"]))
+            last_ticket_ts = float(entry["last_ticket_ts"])
+        except (KeyError, TypeError, ValueError):
+            break
+        if seq <= data.journal_seq:
+            continue
+        for atomic_number, count in _normalize_owned(entry.get("owned", {})).items():
+            data.owned.increment(atomic_number, count)
+        data.total_draws += draws
+        data.ticket_count = ticket_count
+        data.last_ticket_ts = last_ticket_ts
+        data.journal_seq = seq
+        applied += 1
+    return applied
+
+
+def _set_aside_corrupt(save_path: Path) -> None:
+    try:
+        os.replace(save_path, save_path.with_name(save_path.name + ".corrupt"))
+    except OSError:
+        pass
+
+
 def load_save(path: Path | None = None, now: float | None = None) -> SaveData:
     current = time.time() if now is None else now
     save_path = path or get_save_path()
+    journal_path = get_journal_path(save_path)
+    source_path = save_path
     if not save_path.exists():
-        data = default_save(current)
-        write_save(data, save_path)
-        return data
+        legacy_path = save_path.with_name(config.SAVE_FILENAME)
+        if legacy_path == save_path or not legacy_path.exists():
+            data = default_save(current)
+            write_save(data, save_path)
+            return data
+        source_path = legacy_path
 
-    try:
-        payload = json.loads(save_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+    data = read_save_file(source_path, current)
+    if data is None:
+        _set_aside_corrupt(source_path)
         data = default_save(current)
         write_save(data, save_path)
         return data
 
-    if not isinstance(payload, dict):
-        data = default_save(current)
+    applied = _apply_journal(data, _read_journal(journal_path))
+    if source_path != save_path:
+        # Migrate the legacy JSON save into the current format, keeping the original.
+        data.version = config.SAVE_VERSION
         write_save(data, save_path)
-        return data
+        try:
+            os.replace(source_path, source_path.with_name(source_path.name + ".migrated"))
+        except OSError:
+            pass
+    elif applied:
+        write_save(data, save_path)
+    elif journal_path.exists():
+        _remove_journal(journal_path)
+    return data
+
+
+def _fsync_directory(directory: Path) -> None:
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
-    return _build_save(payload, current)
+
+def _atomic_write_bytes(target: Path, payload: bytes) -> None:
+    fd, temp_name = tempfile.mkstemp(prefix=target.name + ".", suffix=".tmp", dir=target.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_name, target)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(target.parent)
+
+
+def _remove_journal(journal_path: Path) -> None:
+    try:
+        journal_path.unlink()
+    except FileNotFoundError:
+        pass
 
 
 def write_save(data: SaveData, path: Path | None = None) -> None:
+    """
+    Atomically replace the snapshot, then drop the journal it now contains.
+    A crash in between is harmless: replay skips entries up to data.journal_seq.
+    """
     save_path = path or get_save_path()
     save_path.parent.mkdir(parents=True, exist_ok=True)
-    save_path.write_text(
-        json.dumps(data.to_dict(), ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    if binary_format_enabled():
+        _atomic_write_bytes(save_path, encode_binary_save(data))
+    else:
+        _atomic_write_bytes(save_path, json.dumps(data.to_dict(), ensure_ascii=False, indent=2).encode("utf-8"))
+    _remove_journal(get_journal_path(save_path))
+
+
+def append_draw_journal(data: SaveData, delta: DrawDelta, path: Path | None = None) -> None:
+    """
+    Persist one draw as a small fsynced append instead of a full snapshot rewrite.
+    `data` must already include the delta; it is written out as the new snapshot
+    every config.SAVE_JOURNAL_COMPACT_EVERY entries.
+    """
+    save_path = path or get_save_path()
+    if not save_path.exists():
+        write_save(data, save_path)
+        return
+
+    data.journal_seq += 1
+    line = json.dumps(delta.to_dict(data.journal_seq), ensure_ascii=False, separators=(",", ":"))
+    journal_path = get_journal_path(save_path)
+    with journal_path.open("a", encoding="utf-8") as handle:
+        handle.write(line + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+
+    if data.journal_seq % config.SAVE_JOURNAL_COMPACT_EVERY == 0:
+        write_save(data, save_path)
 
 
 def clear_save(path: Path | None = None, now: float | None = None) -> SaveData:
@@ -112,11 +468,11 @@ def clear_save(path: Path | None = None, now: float | None = None) -> SaveData:
 
 
 def export_save(export_path: Path, path: Path | None = None) -> Path:
+    """Export as portable JSON regardless of the on-disk save format."""
     save_path = path or get_save_path()
-    if not save_path.exists():
-        write_save(default_save(), save_path)
+    data = load_save(save_path)
     export_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(save_path, export_path)
+    _atomic_write_bytes(export_path, json.dumps(data.to_dict(), ensure_ascii=False, indent=2).encode("utf-8"))
     return export_path
 
 
@@ -124,6 +480,9 @@ def import_save(import_path: Path, path: Path | None = None) -> Path:
     save_path = path or get_save_path()
     if not import_path.exists():
         raise FileNotFoundError(import_path)
-    save_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(import_path, save_path)
+    data = read_save_file(import_path)
+    if data is None:
+        raise ValueError(f"Unreadable save file: {import_path}")
+    data.version = config.SAVE_VERSION
+    write_save(data, save_path)
     return save_path
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import builtins
+import cProfile
+import json
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_JSON_NAME = "startup.json"
+PROFILE_STATS_NAME = "startup.prof"
+
+
+@dataclass
+class StartupTimer:
+    """
+    Wall-clock phases of application launch.
+    `mark` records a point in time since start; `measure` records how long a block took.
+    """
+
+    started: float = field(default_factory=time.perf_counter)
+    marks: dict[str, float] = field(default_factory=dict)
+    durations: dict[str, float] = field(default_factory=dict)
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000.0
+
+    def mark(self, name: str) -> None:
+        self.marks.setdefault(name, self.elapsed_ms())
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = self.durations.get(name, 0.0) + (time.perf_counter() - begin) * 1000.0
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "marks_ms": {name: round(value, 3) for name, value in self.marks.items()},
+            "durations_ms": {name: round(value, 3) for name, value in self.durations.items()},
+        }
+
+    def format_report(self) -> str:
+        lines = ["startup timings (ms)"]
+        width = max((len(name) for name in (*self.marks, *self.durations)), default=0)
+        for name, value in self.durations.items():
+            lines.append(f"  {name.ljust(width)}  {value:9.1f}")
+        for name, value in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"  {name.ljust(width)}  @{value:8.1f}")
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    elapsed_ms: float  # includes the modules it imported in turn
+    depth: int
+
+
+class ImportTimer:
+    """
+    Times first imports by wrapping builtins.__import__. Works inside frozen
+    (PyInstaller) builds, where `python -X importtime` is not available.
+    """
+
+    def __init__(self) -> None:
+        self.records: list[ImportRecord] = []
+        self._depth = 0
+        self._original: Callable[..., Any] | None = None
+
+    def install(self) -> "ImportTimer":
+        if self._original is None:
+            self._original = builtins.__import__
+            builtins.__import__ = self._timed_import
+        return self
+
+    def uninstall(self) -> None:
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+    def _timed_import(self, name: str, globals: Any = None, locals: Any = None, fromlist: Any = (), level: int = 0) -> Any:
+        original = self._original or builtins.__import__
+        if level != 0 or name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+        depth = self._depth
+        self._depth += 1
+        begin = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            self._depth = depth
+            if name in sys.modules:
+                self.records.append(ImportRecord(name, (time.perf_counter() - begin) * 1000.0, depth))
+
+
+class StartupProfiler:
+    """Import timing plus a cProfile capture of everything up to the end of startup."""
+
+    def __init__(self, timer: StartupTimer) -> None:
+        self.timer = timer
+        self.imports = ImportTimer()
+        self.profile = cProfile.Profile()
+
+    def start(self) -> "StartupProfiler":
+        self.imports.install()
+        self.profile.enable()
+        return self
+
+    def finish(self, output_dir: Path) -> tuple[Path, Path]:
+        self.profile.disable()
+        self.imports.uninstall()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stats_path = output_dir / PROFILE_STATS_NAME
+        self.profile.dump_stats(str(stats_path))
+
+        report = self.timer.report()
+        report["imports_ms"] = [
+            {"module": record.module, "elapsed_ms": round(record.elapsed_ms, 3), "depth": record.depth}
+            for record in self.imports.records
+        ]
+        report["python"] = sys.version.split()[0]
+        report["frozen"] = bool(getattr(sys, "frozen", False))
+        json_path = output_dir / PROFILE_JSON_NAME
+        json_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        return json_path, stats_path
+
+
+def profiling_requested(argv: list[str]) -> bool:
+    return any(arg == PROFILE_FLAG or arg.startswith(PROFILE_FLAG + "=") for arg in argv)
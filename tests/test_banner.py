@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+import config
+from banner import Banner, BannerSchedule
+from data.elements import ELEMENTS
+from fairness import FairDrawSource, verify_draw_batch
+from gacha import GachaEngine, draw_batch
+from save import SaveData
+
+IRON = 26
+HELIUM = 2
+
+SPRING = Banner("spring", start_ts=1_000.0, end_ts=2_000.0, rate_up={IRON: 10.0})
+NOBLE = Banner("noble", start_ts=1_500.0, end_ts=3_000.0, rarity_weights={5: 0.05, 1: 0.455}, rate_up={HELIUM: 4.0})
+
+
+class BannerScheduleTests(unittest.TestCase):
+    def test_active_banner_follows_windows(self) -> None:
+        schedule = BannerSchedule([SPRING, NOBLE])
+        self.assertIsNone(schedule.active_at(999.0))
+        self.assertIs(schedule.active_at(1_000.0), SPRING)
+        self.assertIs(schedule.active_at(1_700.0), NOBLE)  # later start wins the overlap
+        self.assertIs(schedule.active_at(2_500.0), NOBLE)
+        self.assertIsNone(schedule.active_at(3_000.0))
+        self.assertEqual(schedule.next_change_after(1_200.0), 1_500.0)
+        self.assertIsNone(schedule.next_change_after(3_000.0))
+
+    def test_invalid_schedules_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            BannerSchedule([SPRING, SPRING])
+        with self.assertRaises(ValueError):
+            BannerSchedule([Banner("empty", start_ts=5.0, end_ts=5.0)])
+
+
+class BannerEngineTests(unittest.TestCase):
+    def test_rate_up_keeps_rarity_share(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=random.Random(0))
+        engine.set_banner(SPRING)
+        probabilities = {element.atomic_number: p for element, p in engine.alias_table.outcome_probabilities().items()}
+        iron_rarity = engine.elements_by_atomic_number[IRON].rarity_level
+        bucket = [element.atomic_number for element in engine.elements_by_rarity[iron_rarity]]
+        self.assertAlmostEqual(sum(probabilities[n] for n in bucket), config.RARITY_WEIGHTS[iron_rarity], places=9)
+        self.assertAlmostEqual(probabilities[IRON], config.RARITY_WEIGHTS[iron_rarity] * 10.0 / (len(bucket) + 9.0), places=9)
+
+    def test_rarity_override_and_standard_pool(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=random.Random(0))
+        engine.set_banner(NOBLE)
+        self.assertEqual(engine.rarity_weights[5], 0.05)
+        self.assertEqual(engine.rarity_weights[2], config.RARITY_WEIGHTS[2])
+        engine.set_banner(None)
+        self.assertEqual(engine.rarity_weights, config.RARITY_WEIGHTS)
+
+    def test_rarity_overrides_are_normalised(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=random.Random(7))
+        engine.set_banner(Banner("heavy", start_ts=0.0, end_ts=1.0, rarity_weights={5: 0.5}))
+        self.assertAlmostEqual(sum(engine.rarity_weights.values()), 1.0, places=9)
+        expected = 0.5 / (1.0 - config.RARITY_WEIGHTS[5] + 0.5)
+        self.assertAlmostEqual(engine.rarity_weights[5], expected, places=9)
+        alias_share = sum(p for element, p in engine.alias_table.outcome_probabilities().items() if element.rarity_level == 5)
+        self.assertAlmostEqual(alias_share, expected, places=9)
+        rolls = [engine.roll_rarity() for _ in range(20_000)]
+        self.assertAlmostEqual(rolls.count(5) / len(rolls), expected, delta=0.02)
+
+    def test_invalid_overrides_are_rejected(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=random.Random(0))
+        invalid = [
+            Banner("negative", start_ts=0.0, end_ts=1.0, rate_up={IRON: -0.5}),
+            Banner("zero", start_ts=0.0, end_ts=1.0, rate_up={IRON: 0.0}),
+            Banner("unknown", start_ts=0.0, end_ts=1.0, rate_up={9999: 5.0}),
+            Banner("rarity", start_ts=0.0, end_ts=1.0, rarity_weights={9: 0.1}),
+            Banner("empty", start_ts=0.0, end_ts=1.0, rarity_weights={rarity: 0.0 for rarity in config.RARITY_WEIGHTS}),
+        ]
+        for banner in invalid:
+            with self.subTest(banner=banner.banner_id), self.assertRaises(ValueError):
+                engine.set_banner(banner)
+        self.assertIsNone(engine.banner)
+
+    def test_tables_are_cached_and_lru_evicted(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=random.Random(0), table_cache_size=2)
+        spring_table = engine.table_for(SPRING)
+        self.assertIs(engine.table_for(SPRING), spring_table)
+        engine.table_for(NOBLE)
+        engine.table_for(SPRING)
+        engine.table_for(Banner("third", start_ts=0.0, end_ts=1.0))
+        self.assertIs(engine.table_for(SPRING), spring_table)
+        self.assertEqual(list(engine._banner_tables), ["third", "spring"])
+
+    def test_edited_banner_with_same_id_is_recompiled(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=random.Random(0))
+        engine.set_banner(SPRING)
+        edited = Banner("spring", start_ts=1_000.0, end_ts=2_000.0, rate_up={IRON: 2.0})
+        engine.set_banner(edited)
+        self.assertIs(engine.table_for(edited).banner, edited)
+        iron = engine.elements_by_atomic_number[IRON]
+        iron_share = engine.alias_table.outcome_probabilities()[iron]
+        bucket_size = len(engine.elements_by_rarity[iron.rarity_level])
+        self.assertAlmostEqual(iron_share, config.RARITY_WEIGHTS[iron.rarity_level] * 2.0 / (bucket_size + 1.0), places=9)
+        self.assertIs(engine.table_for(Banner("spring", 1_000.0, 2_000.0, rate_up={IRON: 2.0})), engine.table_for(edited))
+
+    def test_draw_batch_uses_time_provider_banner(self) -> None:
+        clock = [1_200.0]
+        engine = GachaEngine(ELEMENTS, rng=random.Random(4), banners=BannerSchedule([SPRING, NOBLE]), time_provider=lambda: clock[0])
+        self.assertIs(engine.update_banner(), SPRING)
+        state = SaveData(paid_unlocked=True, ticket_count=1_000, last_ticket_ts=2_500.0)
+        result = draw_batch(state, engine, draw_count=10, now=2_500.0)
+        self.assertEqual(result.banner_id, "noble")
+        self.assertIs(engine.banner, NOBLE)
+
+    def test_fair_banner_batch_verifies_against_schedule(self) -> None:
+        schedule = BannerSchedule([SPRING])
+        source = FairDrawSource(client_seed="alice", server_seed=bytes(range(32)))
+        engine = GachaEngine(ELEMENTS, rng=source, banners=schedule)
+        state = SaveData(paid_unlocked=True, ticket_count=1_000, last_ticket_ts=1_500.0)
+        result = draw_batch(state, engine, draw_count=500, now=1_500.0)
+        reveal = source.reveal()
+        self.assertTrue(verify_draw_batch(result, reveal, banners=schedule))
+        self.assertFalse(verify_draw_batch(result, reveal, banners=BannerSchedule()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import unittest
+
+from completion import CompletionModel, RarityGroup
+
+
+def _brute_force_cdf(probabilities: list[float], max_draws: int) -> list[float]:
+    full = (1 << len(probabilities)) - 1
+    distribution = {0: 1.0}
+    cdf: list[float] = []
+    for _ in range(max_draws):
+        updated: dict[int, float] = {}
+        for collected, mass in distribution.items():
+            for index, probability in enumerate(probabilities):
+                key = collected | (1 << index)
+                updated[key] = updated.get(key, 0.0) + mass * probability
+        distribution = updated
+        cdf.append(distribution.get(full, 0.0))
+    return cdf
+
+
+class CompletionModelTests(unittest.TestCase):
+    def test_uniform_coupon_collector(self) -> None:
+        model = CompletionModel([RarityGroup(1, 5, 0.2)])
+        harmonic = sum(1 / k for k in range(1, 6))
+        self.assertAlmostEqual(model.expected_draws(), 5 * harmonic, places=6)
+        variance = sum((1 - k / 5) / (k / 5) ** 2 for k in range(1, 6))
+        self.assertAlmostEqual(model.draws_variance(), variance, places=6)
+
+    def test_cdf_matches_brute_force(self) -> None:
+        groups = [RarityGroup(1, 2, 0.3), RarityGroup(2, 3, 0.1), RarityGroup(3, 1, 0.1)]
+        model = CompletionModel(groups)
+        expected = _brute_force_cdf([0.3, 0.3, 0.1, 0.1, 0.1, 0.1], 120)
+        for draws in (5, 6, 10, 25, 60, 120):
+            self.assertAlmostEqual(model.cdf(draws), expected[draws - 1], places=9)
+
+    def test_quantile_is_smallest_draw_count_reaching_fraction(self) -> None:
+        model = CompletionModel.from_weights()
+        median = model.quantile(0.5, rarities=[4])
+        self.assertGreaterEqual(model.cdf(median, rarities=[4]), 0.5)
+        self.assertLess(model.cdf(median - 1, rarities=[4]), 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
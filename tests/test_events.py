@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import unittest
+
+from events import OWNERSHIP_CHANGED, TICKETS_CHANGED, EventBus
+
+
+class EventBusTests(unittest.TestCase):
+    def test_publish_reaches_only_matching_subscribers(self) -> None:
+        bus = EventBus()
+        received: list[object] = []
+        bus.subscribe(OWNERSHIP_CHANGED, received.append)
+        bus.subscribe(TICKETS_CHANGED, lambda _: received.append("tickets"))
+        bus.publish(OWNERSHIP_CHANGED, {1, 8})
+        self.assertEqual(received, [{1, 8}])
+
+    def test_unsubscribe_during_publish(self) -> None:
+        bus = EventBus()
+        calls: list[str] = []
+        unsubscribe = bus.subscribe(TICKETS_CHANGED, lambda _: (calls.append("first"), unsubscribe()))
+        bus.subscribe(TICKETS_CHANGED, lambda _: calls.append("second"))
+        bus.publish(TICKETS_CHANGED)
+        bus.publish(TICKETS_CHANGED)
+        self.assertEqual(calls, ["first", "second", "second"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import unittest
+from dataclasses import replace
+
+from data.elements import ELEMENTS
+from fairness import FairDrawSource, FairnessReveal, HmacDrbg, batch_uniforms, commitment_for, verify_draw_batch
+from gacha import GachaEngine, draw_batch
+from rng import make_rng
+from save import SaveData
+
+
+class HmacDrbgTests(unittest.TestCase):
+    def test_output_is_deterministic_and_chunking_independent(self) -> None:
+        whole = HmacDrbg(b"entropy", b"nonce").generate(200)
+        self.assertEqual(len(whole), 200)
+        self.assertEqual(whole, HmacDrbg(b"entropy", b"nonce").generate(200))
+        self.assertNotEqual(whole, HmacDrbg(b"entropy", b"other").generate(200))
+
+    def test_uniforms_in_range(self) -> None:
+        values = batch_uniforms(b"s" * 32, "player", 0, 3600)
+        self.assertEqual(len(values), 3600)
+        self.assertTrue(all(0.0 <= value < 1.0 for value in values))
+        self.assertNotEqual(values, batch_uniforms(b"s" * 32, "player", 1, 3600))
+
+
+class FairDrawTests(unittest.TestCase):
+    def _draw(self) -> tuple[FairDrawSource, list]:
+        source = FairDrawSource(client_seed="alice", server_seed=bytes(range(32)))
+        engine = GachaEngine(ELEMENTS, rng=source)
+        state = SaveData(paid_unlocked=True, ticket_count=5_000, last_ticket_ts=100.0)
+        results = [draw_batch(state, engine, draw_count=count, now=100.0) for count in (10, 3600)]
+        return source, results
+
+    def test_revealed_seed_reproduces_every_batch(self) -> None:
+        source, results = self._draw()
+        commitment = source.commitment
+        reveal = source.reveal()
+        self.assertEqual(reveal.commitment, commitment)
+        self.assertEqual([result.draw_nonce for result in results], [0, 1])
+        for result in results:
+            self.assertTrue(verify_draw_batch(result, reveal))
+        self.assertNotEqual(source.commitment, commitment)
+
+    def test_tampered_results_or_seeds_fail(self) -> None:
+        source, results = self._draw()
+        reveal = source.reveal()
+        self.assertFalse(verify_draw_batch(replace(results[1], draw_nonce=0), reveal))
+        wrong_seed = FairnessReveal(b"\x00" * 32, reveal.client_seed, reveal.commitment)
+        self.assertFalse(verify_draw_batch(results[0], wrong_seed))
+        self.assertFalse(verify_draw_batch(results[0], replace(reveal, client_seed="bob")))
+        self.assertEqual(commitment_for(reveal.server_seed), reveal.commitment)
+
+    def test_single_draws_are_refused(self) -> None:
+        source = FairDrawSource(server_seed=b"\x01" * 32)
+        with self.assertRaises(TypeError):
+            GachaEngine(ELEMENTS, rng=source).pull()
+        self.assertEqual((source.nonce, source.last_nonce), (0, None))
+
+    def test_fair_backend_from_make_rng(self) -> None:
+        source = make_rng("fair", 7)
+        self.assertIsInstance(source, FairDrawSource)
+        self.assertEqual(source.server_seed, make_rng("fair", 7).server_seed)
+        self.assertNotEqual(source.server_seed, make_rng("fair", 7, stream=1).server_seed)
+        self.assertNotEqual(make_rng("fair").server_seed, make_rng("fair").server_seed)
+
+        state = SaveData(paid_unlocked=True, ticket_count=100, last_ticket_ts=100.0)
+        result = draw_batch(state, GachaEngine(ELEMENTS, rng=source), draw_count=50, now=100.0)
+        self.assertTrue(verify_draw_batch(result, source.reveal()))
+
+
+if __name__ == "__main__":
+    unittest.main()
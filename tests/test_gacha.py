@@ -5,7 +5,9 @@ import unittest
 
 import config
 from data.elements import ELEMENTS
-from gacha import GachaEngine, draw_batch
+from gacha import MULTINOMIAL_MIN_DRAWS, CollectionStats, DrawStream, GachaEngine, draw_batch, multinomial_counts
+from fairness import FairDrawSource, FairnessReveal, verify_draw_batch
+from rng import PhiloxRandom
 from save import SaveData
 
 
@@ -15,11 +17,76 @@ class ProbabilityTests(unittest.TestCase):
 
 
 class BucketTests(unittest.TestCase):
-    def test_drawn_element_matches_rolled_rarity(self) -> None:
+    def test_element_frequencies_match_table_weights(self) -> None:
         engine = GachaEngine(ELEMENTS, rng=random.Random(2026))
-        for _ in range(2000):
-            rolled_rarity, element = engine.pull_with_rarity()
-            self.assertEqual(rolled_rarity, element.rarity_level)
+        draw_count = 200_000
+        observed: dict[int, int] = {}
+        for _ in range(draw_count):
+            atomic_number = engine.pull().atomic_number
+            observed[atomic_number] = observed.get(atomic_number, 0) + 1
+        # Pearson chi-square over all 118 elements against rarity weight / bucket size;
+        # 117 degrees of freedom, so 180 is beyond the 0.1% critical value (~170).
+        chi_square = 0.0
+        for element in ELEMENTS:
+            bucket_size = len(engine.elements_by_rarity[element.rarity_level])
+            expected = draw_count * config.RARITY_WEIGHTS[element.rarity_level] / bucket_size
+            chi_square += (observed.get(element.atomic_number, 0) - expected) ** 2 / expected
+        self.assertLess(chi_square, 180.0)
+
+
+class AliasTableTests(unittest.TestCase):
+    def test_alias_table_matches_rarity_weights(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=random.Random(0))
+        probabilities = engine.alias_table.outcome_probabilities()
+        self.assertAlmostEqual(sum(probabilities.values()), 1.0, places=9)
+        for element, probability in probabilities.items():
+            bucket_size = len(engine.elements_by_rarity[element.rarity_level])
+            expected = config.RARITY_WEIGHTS[element.rarity_level] / bucket_size
+            self.assertAlmostEqual(probability, expected, places=9)
+
+    def test_sample_edges_stay_in_range(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=random.Random(0))
+        self.assertIn(engine.alias_table.sample(0.0), ELEMENTS)
+        self.assertIn(engine.alias_table.sample(0.9999999999999999), ELEMENTS)
+
+
+class PullCountsTests(unittest.TestCase):
+    def test_counts_sum_to_draw_count(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=random.Random(7))
+        for draw_count in (1, 10, 3600):
+            counts = engine.pull_counts(draw_count)
+            self.assertEqual(sum(counts.values()), draw_count)
+            self.assertTrue(all(count > 0 for count in counts.values()))
+
+    def test_counts_are_reproducible_for_seed(self) -> None:
+        first = GachaEngine(ELEMENTS, rng=random.Random(42)).pull_counts(3600)
+        second = GachaEngine(ELEMENTS, rng=random.Random(42)).pull_counts(3600)
+        self.assertEqual(first, second)
+
+    def test_multinomial_is_pinned_for_seed(self) -> None:
+        # Pure-Python sampler only: the same seed must give these counts with or without NumPy.
+        counts = multinomial_counts(random.Random(42), 3600, [1.0] * 6 + [0.5] * 4)
+        self.assertEqual(counts, [432, 453, 459, 446, 473, 429, 248, 219, 227, 214])
+
+    def test_small_batches_use_alias_sampler(self) -> None:
+        draw_count = MULTINOMIAL_MIN_DRAWS - 1
+        counts = GachaEngine(ELEMENTS, rng=random.Random(3)).pull_counts(draw_count)
+        engine = GachaEngine(ELEMENTS, rng=random.Random(3))
+        expected: dict[int, int] = {}
+        for _ in range(draw_count):
+            atomic_number = engine.pull().atomic_number
+            expected[atomic_number] = expected.get(atomic_number, 0) + 1
+        self.assertEqual(counts, expected)
+
+    def test_rarity_share_close_to_weights(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=random.Random(2026))
+        draw_count = 200_000
+        counts = engine.pull_counts(draw_count)
+        by_rarity: dict[int, int] = {rarity: 0 for rarity in config.RARITY_WEIGHTS}
+        for atomic_number, count in counts.items():
+            by_rarity[engine.elements_by_atomic_number[atomic_number].rarity_level] += count
+        for rarity, weight in config.RARITY_WEIGHTS.items():
+            self.assertAlmostEqual(by_rarity[rarity] / draw_count, weight, delta=0.01)
 
 
 class DrawBatchTests(unittest.TestCase):
@@ -30,6 +97,141 @@ class DrawBatchTests(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertEqual(result.message, "抽卡券不足 (3 / 5)")
 
+    def test_batch_spends_tickets_and_records_counts(self) -> None:
+        state = SaveData(ticket_count=100, last_ticket_ts=100.0)
+        engine = GachaEngine(ELEMENTS, rng=random.Random(3))
+        result = draw_batch(state, engine, draw_count=60, now=100.0)
+        self.assertTrue(result.success)
+        self.assertEqual(state.ticket_count, 40)
+        self.assertEqual(state.total_draws, 60)
+        self.assertEqual(sum(state.owned.values()), 60)
+        self.assertEqual(sum(entry.count for entry in result.newly_obtained), 60)
+        self.assertEqual(result.already_owned, [])
+
+    def test_entries_are_grouped_and_ordered(self) -> None:
+        state = SaveData(paid_unlocked=True, ticket_count=2_000, last_ticket_ts=100.0, owned={1: 1, 26: 1})
+        engine = GachaEngine(ELEMENTS, rng=random.Random(8))
+        result = draw_batch(state, engine, draw_count=1_500, now=100.0)
+        for entries in (result.newly_obtained, result.already_owned):
+            keys = [(-entry.element.rarity_level, entry.element.atomic_number) for entry in entries]
+            self.assertEqual(keys, sorted(keys))
+        self.assertEqual(list(result.by_rarity), sorted(result.by_rarity, reverse=True))
+        flattened = [pair for pairs in result.by_rarity.values() for pair in pairs]
+        self.assertEqual(len(flattened), len(result.newly_obtained) + len(result.already_owned))
+        for rarity, pairs in result.by_rarity.items():
+            atomic_numbers = [entry.element.atomic_number for entry, _ in pairs]
+            self.assertEqual(atomic_numbers, sorted(atomic_numbers))
+            self.assertTrue(all(entry.element.rarity_level == rarity for entry, _ in pairs))
+        new_ids = {entry.element.atomic_number for entry in result.newly_obtained}
+        self.assertEqual({entry.element.atomic_number for entry, is_new in flattened if is_new}, new_ids)
+        self.assertNotIn(1, new_ids)
+
+
+class StreamingTests(unittest.TestCase):
+    def test_iter_pulls_matches_sequential_pulls(self) -> None:
+        streamed = list(GachaEngine(ELEMENTS, rng=PhiloxRandom(11)).iter_pulls(300, chunk_size=64))
+        engine = GachaEngine(ELEMENTS, rng=PhiloxRandom(11))
+        self.assertEqual(streamed, [engine.pull() for _ in range(300)])
+
+    def test_pull_chunks_are_bounded_and_sum_to_batch(self) -> None:
+        chunks = list(GachaEngine(ELEMENTS, rng=PhiloxRandom(4)).iter_pull_chunks(1_000, chunk_size=256))
+        self.assertEqual([sum(chunk.values()) for chunk in chunks], [256, 256, 256, 232])
+        totals: dict[int, int] = {}
+        for chunk in chunks:
+            for atomic_number, count in chunk.items():
+                totals[atomic_number] = totals.get(atomic_number, 0) + count
+        self.assertEqual(totals, GachaEngine(ELEMENTS, rng=PhiloxRandom(4)).pull_counts(1_000))
+
+    def test_stream_spends_up_front_and_matches_draw_batch(self) -> None:
+        state = SaveData(paid_unlocked=True, ticket_count=2_000, last_ticket_ts=100.0, owned={1: 1})
+        stats = CollectionStats(ELEMENTS, state)
+        stream = DrawStream(state, GachaEngine(ELEMENTS, rng=PhiloxRandom(9)), 1_500, now=100.0, chunk_size=500, stats=stats)
+        self.assertTrue(stream.success)
+        self.assertEqual((state.ticket_count, state.total_draws), (500, 0))
+        first = next(iter(stream))
+        self.assertEqual((first.drawn, first.total), (500, 1_500))
+        self.assertEqual(sum(entry.count for entry, _ in first.entries), 500)
+        self.assertEqual(state.total_draws, 500)
+        streamed = stream.result()
+
+        expected_state = SaveData(paid_unlocked=True, ticket_count=2_000, last_ticket_ts=100.0, owned={1: 1})
+        expected = draw_batch(expected_state, GachaEngine(ELEMENTS, rng=PhiloxRandom(9)), 1_500, now=100.0)
+        self.assertEqual(streamed, expected)
+        self.assertEqual(state.owned, expected_state.owned)
+        self.assertEqual(state.total_draws, 1_500)
+        self.assertEqual(stats.collected, CollectionStats(ELEMENTS, state).collected)
+
+    def test_fair_chunks_share_one_nonce(self) -> None:
+        source = FairDrawSource("player", server_seed=b"\x05" * 32)
+        chunks = list(GachaEngine(ELEMENTS, rng=source).iter_pull_chunks(700, chunk_size=256))
+        self.assertEqual([sum(chunk.values()) for chunk in chunks], [256, 256, 188])
+        self.assertEqual((source.last_nonce, source.nonce), (0, 1))
+        totals: dict[int, int] = {}
+        for chunk in chunks:
+            for atomic_number, count in chunk.items():
+                totals[atomic_number] = totals.get(atomic_number, 0) + count
+        expected = GachaEngine(ELEMENTS, rng=FairDrawSource("player", server_seed=b"\x05" * 32)).pull_counts(700)
+        self.assertEqual(totals, expected)
+
+    def test_fair_stream_is_chunked_and_verifiable(self) -> None:
+        source = FairDrawSource("player", server_seed=b"\x06" * 32)
+        state = SaveData(paid_unlocked=True, ticket_count=1_000, last_ticket_ts=100.0)
+        stream = DrawStream(state, GachaEngine(ELEMENTS, rng=source), 900, now=100.0, chunk_size=300)
+        self.assertEqual([chunk.drawn for chunk in stream], [300, 600, 900])
+        result = stream.result()
+        self.assertEqual(result.draw_nonce, 0)
+        reveal = FairnessReveal(source.server_seed, source.client_seed, source.commitment)
+        self.assertTrue(verify_draw_batch(result, reveal))
+
+    def test_stopping_early_still_applies_every_draw(self) -> None:
+        expected_state = SaveData(paid_unlocked=True, ticket_count=1_000, last_ticket_ts=100.0)
+        draw_batch(expected_state, GachaEngine(ELEMENTS, rng=PhiloxRandom(3)), 900, now=100.0)
+
+        state = SaveData(paid_unlocked=True, ticket_count=1_000, last_ticket_ts=100.0)
+        with DrawStream(state, GachaEngine(ELEMENTS, rng=PhiloxRandom(3)), 900, now=100.0, chunk_size=200) as stream:
+            next(iter(stream))
+            self.assertEqual(state.total_draws, 200)
+        self.assertEqual((state.total_draws, state.owned), (900, expected_state.owned))
+
+        dropped = SaveData(paid_unlocked=True, ticket_count=1_000, last_ticket_ts=100.0)
+        stream = DrawStream(dropped, GachaEngine(ELEMENTS, rng=PhiloxRandom(3)), 900, now=100.0, chunk_size=200)
+        next(iter(stream))
+        del stream
+        self.assertEqual((dropped.total_draws, dropped.owned), (900, expected_state.owned))
+
+    def test_stream_rejects_without_spending(self) -> None:
+        state = SaveData(ticket_count=3, last_ticket_ts=100.0)
+        stream = DrawStream(state, GachaEngine(ELEMENTS, rng=random.Random(1)), 5, now=100.0)
+        self.assertFalse(stream.success)
+        self.assertEqual(list(stream), [])
+        self.assertEqual(stream.result().message, "抽卡券不足 (3 / 5)")
+        self.assertEqual(state.ticket_count, 3)
+
+
+class CollectionStatsTests(unittest.TestCase):
+    def test_incremental_stats_match_full_rebuild(self) -> None:
+        state = SaveData(ticket_count=1_000, last_ticket_ts=100.0, owned={1: 2, 8: 2})
+        engine = GachaEngine(ELEMENTS, rng=random.Random(5))
+        stats = CollectionStats(ELEMENTS, state)
+        self.assertEqual((stats.top_atomic_number, stats.top_count), (1, 2))
+        for _ in range(5):
+            draw_batch(state, engine, draw_count=37, now=100.0, stats=stats)
+            rebuilt = CollectionStats(ELEMENTS, state)
+            self.assertEqual(stats.collected, len(state.owned))
+            self.assertEqual(
+                (stats.top_atomic_number, stats.top_count),
+                (rebuilt.top_atomic_number, rebuilt.top_count),
+            )
+        owned_by_rarity = sum(stats.rarity_progress(rarity)[0] for rarity in config.RARITY_WEIGHTS)
+        self.assertEqual(owned_by_rarity, stats.collected)
+        self.assertEqual(sum(stats.rarity_progress(rarity)[1] for rarity in config.RARITY_WEIGHTS), 118)
+
+    def test_rebuild_follows_replaced_state(self) -> None:
+        stats = CollectionStats(ELEMENTS, SaveData(owned={26: 4}))
+        stats.rebuild(SaveData())
+        self.assertEqual(stats.collected, 0)
+        self.assertIsNone(stats.top_element())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import unittest
+
+import i18n
+from data.elements import ELEMENTS
+
+
+def _reference_t(language: str, key: str, **kwargs: object) -> str:
+    lang = i18n.normalize_language(language)
+    text = i18n.TEXTS.get(lang, {}).get(key) or i18n.TEXTS["zh"].get(key) or key
+    return text.format(**kwargs) if kwargs else text
+
+
+class CompiledCatalogTests(unittest.TestCase):
+    def test_catalog_matches_direct_lookup(self) -> None:
+        keys = {key for texts in i18n.TEXTS.values() for key in texts}
+        sample = {
+            "current": 3, "cap": 600, "total": 12, "collected": 7, "need": 10, "seconds": 60, "path": "x.json", "error": "e",
+            "commitment": "c", "nonce": 0, "server_seed": "s", "client_seed": "",
+        }
+        for language in (*i18n.SUPPORTED_LANGUAGES, "unknown"):
+            for key in keys:
+                self.assertEqual(i18n.t(language, key), _reference_t(language, key))
+                self.assertEqual(i18n.t(language, key, **sample), _reference_t(language, key, **sample))
+
+    def test_element_names_materialized(self) -> None:
+        catalog = i18n.get_catalog("ja")
+        self.assertEqual(len(catalog.element_names), len(ELEMENTS))
+        self.assertEqual(catalog.element_names[1], "水素")
+        self.assertIs(i18n.get_catalog("ja"), catalog)
+
+    def test_bulk_lookup_and_missing_keys(self) -> None:
+        texts = i18n.get_catalog("en").many("main_exit", "no_such_key")
+        self.assertEqual(texts["main_exit"], i18n.TEXTS["en"]["main_exit"])
+        self.assertEqual(texts["no_such_key"], "no_such_key")
+
+    def test_cache_holds_only_supported_languages(self) -> None:
+        for language in ("xx", "EN", "zh-TW", None):
+            self.assertIs(i18n.get_catalog(language), i18n.get_catalog("zh"))
+        self.assertTrue(set(i18n._CATALOGS) <= set(i18n.SUPPORTED_LANGUAGES))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import license_manager
+
+
+class LicenseVerificationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.license_path = Path(self._tmp.name) / "license.json"
+        self.license_path.write_text(
+            json.dumps({"v": 1, "product": "ElementGacha", "features": {"paid": True}, "sig": "AAAA"}),
+            encoding="utf-8",
+        )
+        patcher = mock.patch.object(license_manager, "_license_path", return_value=self.license_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_every_load_checks_the_signature(self) -> None:
+        with mock.patch.object(license_manager, "_verify_signature", return_value="ok") as verify:
+            self.assertEqual(license_manager.load_license()[:2], (True, "ok"))
+            self.assertEqual(license_manager.load_license()[:2], (True, "ok"))
+        self.assertEqual(verify.call_count, 2)
+
+    def test_bad_signature_is_rejected(self) -> None:
+        with mock.patch.object(license_manager, "_verify_signature", return_value="bad_signature"):
+            self.assertEqual(license_manager.is_paid_unlocked(), (False, "bad_signature"))
+
+    def test_structural_errors_skip_verification(self) -> None:
+        self.license_path.write_text(json.dumps({"v": 1, "product": "Other", "features": {}, "sig": "AAAA"}), encoding="utf-8")
+        with mock.patch.object(license_manager, "_verify_signature") as verify:
+            self.assertEqual(license_manager.load_license()[:2], (False, "product_mismatch"))
+        verify.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
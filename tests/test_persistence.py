@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import config
+from persistence import SaveWorker
+from save import DrawDelta, SaveData, get_journal_path, load_save, read_save_file, write_save
+
+
+class SaveWorkerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.save_path = Path(self._tmp.name) / config.SAVE_BINARY_FILENAME
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_rapid_draws_coalesce_into_one_journal_append(self) -> None:
+        state = SaveData(ticket_count=10, last_ticket_ts=100.0)
+        write_save(state, self.save_path)
+        worker = SaveWorker(self.save_path, journal_seq=state.journal_seq, debounce_seconds=60.0)
+        for _ in range(5):
+            state.owned[8] = state.owned.get(8, 0) + 1
+            state.total_draws += 1
+            state.ticket_count -= 1
+            worker.submit(state, DrawDelta({8: 1}, 1, state.ticket_count, state.last_ticket_ts))
+        worker.stop()
+
+        lines = get_journal_path(self.save_path).read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(worker.writes, 1)
+        loaded = load_save(self.save_path, now=100.0)
+        self.assertEqual(loaded.owned, {8: 5})
+        self.assertEqual(loaded.total_draws, 5)
+        self.assertEqual(loaded.ticket_count, 5)
+
+    def test_full_write_supersedes_pending_delta(self) -> None:
+        state = SaveData(ticket_count=10, last_ticket_ts=100.0)
+        write_save(state, self.save_path)
+        worker = SaveWorker(self.save_path, debounce_seconds=60.0)
+        state.owned[1] = 1
+        worker.submit(state, DrawDelta({1: 1}, 1, state.ticket_count, state.last_ticket_ts))
+        state.ui_language = "en"
+        worker.submit(state)
+        worker.flush()
+
+        self.assertFalse(get_journal_path(self.save_path).exists())
+        snapshot = read_save_file(self.save_path)
+        assert snapshot is not None
+        self.assertEqual(snapshot.ui_language, "en")
+        self.assertEqual(snapshot.owned, {1: 1})
+        worker.stop()
+
+    def test_submitted_snapshot_is_isolated_from_later_mutation(self) -> None:
+        state = SaveData(last_ticket_ts=100.0)
+        worker = SaveWorker(self.save_path, debounce_seconds=60.0)
+        state.owned[2] = 1
+        worker.submit(state)
+        state.owned[2] = 99
+        worker.stop()
+        snapshot = read_save_file(self.save_path)
+        assert snapshot is not None
+        self.assertEqual(snapshot.owned, {2: 1})
+
+    def test_unexpected_write_error_does_not_hang_stop(self) -> None:
+        class FailingOnceWorker(SaveWorker):
+            failed = False
+
+            def _write(self, snapshot, delta, full_write) -> None:
+                if not self.failed:
+                    self.failed = True
+                    raise ValueError("boom")
+                super()._write(snapshot, delta, full_write)
+
+        state = SaveData(last_ticket_ts=100.0)
+        worker = FailingOnceWorker(self.save_path, debounce_seconds=60.0)
+        state.owned[3] = 1
+        worker.submit(state, DrawDelta({3: 1}, 1, state.ticket_count, state.last_ticket_ts))
+        worker.flush()
+        self.assertIsInstance(worker.last_error, ValueError)
+        state.owned[3] = 2
+        worker.submit(state, DrawDelta({3: 1}, 1, state.ticket_count, state.last_ticket_ts))
+        worker.stop()
+        self.assertIsNone(worker.last_error)
+        snapshot = read_save_file(self.save_path)
+        assert snapshot is not None
+        self.assertEqual(snapshot.owned, {3: 2})
+
+    def test_failed_write_is_retried_without_new_submit(self) -> None:
+        class FlakyWorker(SaveWorker):
+            failures_left = 2
+
+            def _write(self, snapshot, delta, full_write) -> None:
+                if self.failures_left:
+                    self.failures_left -= 1
+                    raise OSError("disk busy")
+                super()._write(snapshot, delta, full_write)
+
+        state = SaveData(last_ticket_ts=100.0, owned={5: 1})
+        with mock.patch.object(config, "SAVE_RETRY_BASE_SECONDS", 0.01):
+            worker = FlakyWorker(self.save_path, debounce_seconds=0.0)
+            worker.submit(state)
+            deadline = time.monotonic() + 5.0
+            while not self.save_path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            worker.stop()
+        self.assertEqual(worker.failed_writes, 2)
+        self.assertIsNone(worker.last_error)
+        snapshot = read_save_file(self.save_path)
+        assert snapshot is not None
+        self.assertEqual(snapshot.owned, {5: 1})
+
+    def test_stop_reports_persistent_failure(self) -> None:
+        class BrokenWorker(SaveWorker):
+            def _write(self, snapshot, delta, full_write) -> None:
+                raise OSError("read-only")
+
+        worker = BrokenWorker(self.save_path, debounce_seconds=60.0)
+        worker.submit(SaveData(last_ticket_ts=100.0))
+        worker.stop()
+        self.assertIsInstance(worker.last_error, OSError)
+        self.assertFalse(self.save_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
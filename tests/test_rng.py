@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import unittest
+from collections import Counter
+
+from data.elements import ELEMENTS
+from gacha import GachaEngine
+from rng import NUMPY_AVAILABLE, PhiloxRandom, make_rng, philox4x32
+
+
+class PhiloxTests(unittest.TestCase):
+    def test_known_answer_vectors(self) -> None:
+        self.assertEqual(philox4x32((0, 0, 0, 0), (0, 0)), (0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8))
+        self.assertEqual(
+            philox4x32((0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344), (0xA4093822, 0x299F31D0)),
+            (0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1),
+        )
+
+    def test_sequential_draws_match_random_access(self) -> None:
+        rng = PhiloxRandom(7, stream=3)
+        sequential = [rng.random() for _ in range(9)]
+        self.assertEqual(sequential, PhiloxRandom(7, stream=3).uniforms(0, 9))
+        self.assertEqual(rng.jumped(-4).random(), sequential[5])
+        self.assertTrue(all(0.0 <= value < 1.0 for value in sequential))
+        self.assertNotEqual(sequential, PhiloxRandom(7, stream=4).uniforms(0, 9))
+
+    def test_batched_uniforms_match_per_slot_reference(self) -> None:
+        rng = PhiloxRandom("seed", stream=2)
+        for start, count in ((0, 5), (1, 8), (3, 1), (999, 3001)):
+            self.assertEqual(rng.uniforms(start, count), [rng.uniform_at(slot) for slot in range(start, start + count)])
+
+    def test_pinned_uniforms(self) -> None:
+        # Fixed values both backends must reproduce; the pure-Python side runs everywhere.
+        expected = [0.15792664855055483, 0.16509229961396876]
+        backends = [PhiloxRandom]
+        if NUMPY_AVAILABLE:
+            from rng import NumpyPhiloxRandom
+
+            backends.append(NumpyPhiloxRandom)
+        for backend in backends:
+            with self.subTest(backend=backend.__name__):
+                rng = backend("seed", stream=2)
+                self.assertEqual(list(rng.uniforms(998, 2)), expected)
+                self.assertEqual(list(rng.uniforms(4000, 1)), [0.5099125641163177])
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_numpy_backend_matches_pure_python(self) -> None:
+        from rng import NumpyPhiloxRandom
+
+        for start, count in ((0, 5), (1, 8), (999, 3001)):
+            self.assertEqual(
+                list(NumpyPhiloxRandom("seed", stream=2).uniforms(start, count)),
+                PhiloxRandom("seed", stream=2).uniforms(start, count),
+            )
+
+
+class CounterEngineTests(unittest.TestCase):
+    def test_batches_split_and_seek_consistently(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=make_rng("philox", 11))
+        batch = engine.pull_counts(500)
+        self.assertEqual(sum(batch.values()), 500)
+        parts = Counter(engine.pull_range(0, 123)) + Counter(engine.pull_range(123, 377))
+        self.assertEqual(parts, Counter(batch))
+
+        single = GachaEngine(ELEMENTS, rng=PhiloxRandom(11))
+        self.assertEqual(Counter(single.pull().atomic_number for _ in range(500)), Counter(batch))
+        self.assertEqual(engine.pull_at(42), GachaEngine(ELEMENTS, rng=PhiloxRandom(11)).pull_at(42))
+
+    def test_shuffle_is_a_permutation(self) -> None:
+        items = list(range(50))
+        PhiloxRandom(3).shuffle(items)
+        self.assertEqual(sorted(items), list(range(50)))
+        self.assertNotEqual(items, list(range(50)))
+
+
+if __name__ == "__main__":
+    unittest.main()
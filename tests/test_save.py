@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import config
+from save import (
+    RARITY_SIZES,
+    DrawDelta,
+    OwnedCounts,
+    SaveData,
+    append_draw_journal,
+    export_save,
+    get_journal_path,
+    load_save,
+    read_save_file,
+    write_save,
+)
+
+
+def _draw(data: SaveData, owned: dict[int, int], spent: int) -> DrawDelta:
+    for atomic_number, count in owned.items():
+        data.owned[atomic_number] = data.owned.get(atomic_number, 0) + count
+    data.total_draws += sum(owned.values())
+    data.ticket_count -= spent
+    return DrawDelta(owned=owned, draws=sum(owned.values()), ticket_count=data.ticket_count, last_ticket_ts=data.last_ticket_ts)
+
+
+class OwnedCountsTests(unittest.TestCase):
+    def test_counters_follow_increments(self) -> None:
+        owned = OwnedCounts({8: 2})
+        self.assertEqual((owned.collected, owned.total), (1, 2))
+        self.assertTrue(owned.increment(2, 3))
+        self.assertFalse(owned.increment(8))
+        self.assertEqual((owned.collected, owned.total), (2, 6))
+        self.assertEqual(owned.collected_in_rarity(1), 1)
+        self.assertEqual(owned.collected_in_rarity(5), 1)
+        owned[2] = 0
+        self.assertEqual((owned.collected, owned.total), (1, 3))
+        self.assertEqual(owned.collected_in_rarity(5), 0)
+        self.assertEqual(owned, {8: 3})
+
+    def test_behaves_like_mapping(self) -> None:
+        owned = OwnedCounts({1: 1, 118: 4})
+        self.assertEqual(owned.get(50, 0), 0)
+        self.assertNotIn(50, owned)
+        self.assertEqual(list(owned.items()), [(1, 1), (118, 4)])
+        self.assertEqual(sum(RARITY_SIZES.values()), 118)
+        clone = owned.copy()
+        clone.increment(50)
+        self.assertNotIn(50, owned)
+        self.assertEqual(clone.collected, 3)
+
+    def test_out_of_range_atomic_numbers_are_rejected(self) -> None:
+        owned = OwnedCounts()
+        for atomic_number in (0, 119, 10**9):
+            with self.assertRaises(KeyError):
+                owned[atomic_number] = 1
+        self.assertEqual(len(owned.slots()), 118)
+
+
+class SaveJournalTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.save_path = Path(self._tmp.name) / config.SAVE_BINARY_FILENAME
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_journal_replayed_on_load(self) -> None:
+        data = SaveData(ticket_count=10, last_ticket_ts=100.0)
+        write_save(data, self.save_path)
+        append_draw_journal(data, _draw(data, {8: 2, 26: 1}, 3), self.save_path)
+        append_draw_journal(data, _draw(data, {8: 1}, 1), self.save_path)
+        self.assertTrue(get_journal_path(self.save_path).exists())
+
+        loaded = load_save(self.save_path, now=100.0)
+        self.assertEqual(loaded.owned, {8: 3, 26: 1})
+        self.assertEqual(loaded.total_draws, 4)
+        self.assertEqual(loaded.ticket_count, 6)
+        self.assertFalse(get_journal_path(self.save_path).exists())
+
+    def test_torn_final_line_is_ignored(self) -> None:
+        data = SaveData(ticket_count=10, last_ticket_ts=100.0)
+        write_save(data, self.save_path)
+        append_draw_journal(data, _draw(data, {1: 1}, 1), self.save_path)
+        with get_journal_path(self.save_path).open("a", encoding="utf-8") as handle:
+            handle.write('{"seq": 2, "owned": {"1"')
+
+        loaded = load_save(self.save_path, now=100.0)
+        self.assertEqual(loaded.owned, {1: 1})
+        self.assertEqual(loaded.ticket_count, 9)
+
+    def test_entries_already_in_snapshot_are_not_reapplied(self) -> None:
+        data = SaveData(ticket_count=10, last_ticket_ts=100.0)
+        write_save(data, self.save_path)
+        append_draw_journal(data, _draw(data, {1: 1}, 1), self.save_path)
+        journal_text = get_journal_path(self.save_path).read_text(encoding="utf-8")
+        # Simulate a crash after the snapshot replace but before the journal was removed.
+        write_save(data, self.save_path)
+        get_journal_path(self.save_path).write_text(journal_text, encoding="utf-8")
+
+        loaded = load_save(self.save_path, now=100.0)
+        self.assertEqual(loaded.owned, {1: 1})
+        self.assertEqual(loaded.total_draws, 1)
+
+    def test_compaction_rewrites_snapshot(self) -> None:
+        data = SaveData(ticket_count=1000, last_ticket_ts=100.0)
+        write_save(data, self.save_path)
+        with mock.patch.object(config, "SAVE_JOURNAL_COMPACT_EVERY", 2):
+            append_draw_journal(data, _draw(data, {1: 1}, 1), self.save_path)
+            append_draw_journal(data, _draw(data, {2: 1}, 1), self.save_path)
+        self.assertFalse(get_journal_path(self.save_path).exists())
+        snapshot = read_save_file(self.save_path)
+        assert snapshot is not None
+        self.assertEqual(snapshot.owned, {1: 1, 2: 1})
+        self.assertEqual(snapshot.journal_seq, 2)
+
+    def test_corrupt_snapshot_is_set_aside(self) -> None:
+        self.save_path.write_text("{not json", encoding="utf-8")
+        loaded = load_save(self.save_path, now=100.0)
+        self.assertEqual(loaded.owned, {})
+        self.assertTrue(self.save_path.with_name(self.save_path.name + ".corrupt").exists())
+
+
+class SaveFormatTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.save_path = self.root / config.SAVE_BINARY_FILENAME
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_binary_round_trip(self) -> None:
+        data = SaveData(
+            paid_unlocked=True,
+            ticket_count=1234,
+            last_ticket_ts=1700000000.5,
+            total_draws=98765,
+            owned={1: 3, 59: 1, 118: 40},
+            ui_language="ko",
+            journal_seq=7,
+        )
+        write_save(data, self.save_path)
+        self.assertTrue(self.save_path.read_bytes().startswith(b"EGSV"))
+        loaded = read_save_file(self.save_path)
+        assert loaded is not None
+        self.assertEqual(loaded.owned, data.owned)
+        self.assertEqual(loaded.paid_unlocked, True)
+        self.assertEqual(loaded.ticket_count, 1234)
+        self.assertEqual(loaded.last_ticket_ts, 1700000000.5)
+        self.assertEqual(loaded.total_draws, 98765)
+        self.assertEqual(loaded.ui_language, "ko")
+        self.assertEqual(loaded.journal_seq, 7)
+
+    def test_checksum_mismatch_is_rejected(self) -> None:
+        write_save(SaveData(owned={8: 1}), self.save_path)
+        raw = bytearray(self.save_path.read_bytes())
+        raw[-10] ^= 0xFF
+        self.save_path.write_bytes(bytes(raw))
+        self.assertIsNone(read_save_file(self.save_path))
+
+    def test_legacy_json_is_migrated(self) -> None:
+        legacy = self.root / config.SAVE_FILENAME
+        legacy.write_text(
+            json.dumps({"unlocked": True, "last_free_pull_ts": 50.0, "total_pulls": 9, "owned": {"8": 9}}),
+            encoding="utf-8",
+        )
+        loaded = load_save(self.save_path, now=100.0)
+        self.assertTrue(loaded.paid_unlocked)
+        self.assertEqual(loaded.last_ticket_ts, 50.0)
+        self.assertEqual(loaded.total_draws, 9)
+        self.assertEqual(loaded.owned, {8: 9})
+        self.assertEqual(loaded.version, config.SAVE_VERSION)
+        self.assertTrue(self.save_path.exists())
+        self.assertFalse(legacy.exists())
+        self.assertTrue(legacy.with_name(legacy.name + ".migrated").exists())
+
+    def test_unknown_atomic_numbers_are_dropped_on_load(self) -> None:
+        legacy = self.root / config.SAVE_FILENAME
+        legacy.write_text(json.dumps({"owned": {"8": 2, "70000": 1, "1000000000": 3}}), encoding="utf-8")
+        loaded = load_save(self.save_path, now=100.0)
+        self.assertEqual(loaded.owned, {8: 2})
+        self.assertEqual(read_save_file(self.save_path).owned, {8: 2})
+
+    def test_export_writes_json(self) -> None:
+        write_save(SaveData(owned={26: 2}, last_ticket_ts=100.0), self.save_path)
+        exported = export_save(self.root / "export.json", path=self.save_path)
+        payload = json.loads(exported.read_text(encoding="utf-8"))
+        self.assertEqual(payload["owned"], {"26": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+import config
+from data.elements import ELEMENTS
+from gacha import GachaEngine
+from simulate import ALL_RARITIES_KEY, CompletionHistogram, SimulationStats, run_simulation, simulate_player
+
+
+class SimulatePlayerTests(unittest.TestCase):
+    def test_every_rarity_completes(self) -> None:
+        engine = GachaEngine(ELEMENTS, rng=random.Random(5))
+        completion = simulate_player(engine, batch_size=500)
+        self.assertEqual(set(completion), {ALL_RARITIES_KEY, *config.RARITY_WEIGHTS})
+        self.assertEqual(completion[ALL_RARITIES_KEY], max(completion.values()))
+        for rarity in config.RARITY_WEIGHTS:
+            bucket_size = len(engine.elements_by_rarity[rarity])
+            self.assertGreaterEqual(completion[rarity], bucket_size)
+
+
+class RunSimulationTests(unittest.TestCase):
+    def test_seed_is_reproducible(self) -> None:
+        first = run_simulation(players=6, seed=11, chunk_size=4)
+        second = run_simulation(players=6, seed=11, chunk_size=4)
+        self.assertEqual(first.players, 6)
+        for rarity, histogram in first.histograms.items():
+            self.assertEqual(histogram.bins, second.histograms[rarity].bins)
+            self.assertEqual(histogram.count, 6)
+
+    def test_fair_backend_is_reproducible(self) -> None:
+        first = run_simulation(players=3, seed=5, chunk_size=2, rng_backend="fair")
+        second = run_simulation(players=3, seed=5, chunk_size=2, rng_backend="fair")
+        self.assertEqual(first.players, 3)
+        for rarity, histogram in first.histograms.items():
+            self.assertEqual(histogram.bins, second.histograms[rarity].bins)
+
+    def test_worker_count_does_not_change_results(self) -> None:
+        serial = run_simulation(players=6, seed=19, workers=1, chunk_size=2, batch_size=500)
+        parallel = run_simulation(players=6, seed=19, workers=2, chunk_size=2, batch_size=500)
+        self.assertEqual(parallel.players, serial.players)
+        self.assertEqual(set(parallel.histograms), set(serial.histograms))
+        for rarity, histogram in serial.histograms.items():
+            other = parallel.histograms[rarity]
+            self.assertEqual(
+                (other.bins, other.count, other.total, other.minimum, other.maximum),
+                (histogram.bins, histogram.count, histogram.total, histogram.minimum, histogram.maximum),
+            )
+
+
+class CompletionHistogramTests(unittest.TestCase):
+    def test_percentiles_and_merge(self) -> None:
+        left = CompletionHistogram(bin_width=10)
+        right = CompletionHistogram(bin_width=10)
+        for value in range(1, 51):
+            left.add(value)
+        for value in range(51, 101):
+            right.add(value)
+        left.merge(right)
+        self.assertEqual(left.count, 100)
+        self.assertEqual(left.minimum, 1)
+        self.assertEqual(left.maximum, 100)
+        self.assertAlmostEqual(left.mean(), 50.5)
+        self.assertAlmostEqual(left.percentile(0.5), 50, delta=10)
+        self.assertEqual(left.completion_curve(10)[-1][1], 1.0)
+
+    def test_bin_width_follows_bucket_spread(self) -> None:
+        stats = SimulationStats(bin_width=50)
+        self.assertLess(stats.bin_widths[1], 10)
+        self.assertEqual(stats.bin_widths[ALL_RARITIES_KEY], 50)
+        self.assertEqual(stats.histogram(1).bin_width, stats.bin_widths[1])
+        self.assertTrue(all(1 <= width <= 50 for width in stats.bin_widths.values()))
+
+    def test_unit_bins_give_exact_percentiles(self) -> None:
+        histogram = CompletionHistogram(bin_width=1)
+        values = [12, 15, 15, 18, 21, 22, 30, 31, 40, 55]
+        for value in values:
+            histogram.add(value)
+        self.assertEqual(histogram.percentile(0.5), 21)
+        self.assertEqual(histogram.percentile(0.9), 40)
+        with self.assertRaises(ValueError):
+            histogram.merge(CompletionHistogram(bin_width=2, count=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
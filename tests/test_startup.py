@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import sys
+import unittest
+
+from startup import ImportTimer, StartupTimer, profiling_requested
+
+
+class StartupTimerTests(unittest.TestCase):
+    def test_marks_keep_first_occurrence_and_durations_accumulate(self) -> None:
+        timer = StartupTimer()
+        timer.mark("first_paint")
+        first = timer.marks["first_paint"]
+        timer.mark("first_paint")
+        self.assertEqual(timer.marks["first_paint"], first)
+
+        for _ in range(2):
+            with timer.measure("frame:GachaView"):
+                pass
+        report = timer.report()
+        self.assertIn("frame:GachaView", report["durations_ms"])
+        self.assertIn("first_paint", report["marks_ms"])
+        self.assertIn("frame:GachaView", timer.format_report())
+
+
+class ImportTimerTests(unittest.TestCase):
+    def test_records_first_import_only(self) -> None:
+        sys.modules.pop("colorsys", None)
+        timer = ImportTimer().install()
+        try:
+            __import__("colorsys")
+            __import__("colorsys")
+        finally:
+            timer.uninstall()
+        self.assertEqual([record.module for record in timer.records], ["colorsys"])
+        self.assertEqual(timer.records[0].depth, 0)
+
+    def test_profile_flag_detection(self) -> None:
+        self.assertTrue(profiling_requested(["--profile-startup"]))
+        self.assertTrue(profiling_requested(["--seed", "3", "--profile-startup=out"]))
+        self.assertFalse(profiling_requested(["--startup-report"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
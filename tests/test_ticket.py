@@ -4,7 +4,7 @@ import unittest
 
 import config
 from save import SaveData
-from ticket import get_ticket_rule, replenish_tickets
+from ticket import get_ticket_rule, project_ticket_count, project_tickets, replenish_tickets
 
 
 class TicketRuleTests(unittest.TestCase):
@@ -41,6 +41,34 @@ class TicketReplenishTests(unittest.TestCase):
         self.assertEqual(state.ticket_count, config.FREE_TICKET_CAP)
 
 
+class TicketProjectionTests(unittest.TestCase):
+    def test_projection_matches_replenish(self) -> None:
+        interval = config.FREE_TICKET_INTERVAL_SECONDS
+        for now in (100.0, 159.0, 160.0, 280.0, 100.0 + interval * 500):
+            state = SaveData(paid_unlocked=False, ticket_count=2, last_ticket_ts=100.0)
+            projected = project_ticket_count(state, now)
+            self.assertEqual(state.ticket_count, 2)
+            replenish_tickets(state, now=now)
+            self.assertEqual(projected, state.ticket_count)
+
+    def test_next_ticket_and_cap_times(self) -> None:
+        interval = config.FREE_TICKET_INTERVAL_SECONDS
+        state = SaveData(paid_unlocked=False, ticket_count=0, last_ticket_ts=100.0)
+        projection = project_tickets(state, now=100.0 + interval * 1.5)
+        self.assertEqual(projection.ticket_count, 1)
+        self.assertEqual(projection.next_ticket_at, 100.0 + interval * 2)
+        self.assertEqual(projection.full_at, 100.0 + interval * config.FREE_TICKET_CAP)
+        self.assertEqual(project_ticket_count(state, projection.full_at), config.FREE_TICKET_CAP)
+        self.assertEqual(project_ticket_count(state, projection.next_ticket_at - 0.001), 1)
+
+    def test_full_state_has_no_next_ticket(self) -> None:
+        state = SaveData(paid_unlocked=True, ticket_count=config.PAID_TICKET_CAP, last_ticket_ts=100.0)
+        projection = project_tickets(state, now=200.0)
+        self.assertEqual(projection.ticket_count, config.PAID_TICKET_CAP)
+        self.assertIsNone(projection.next_ticket_at)
+        self.assertIsNone(projection.full_at)
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -67,6 +67,47 @@ def replenish_tickets(state: SaveData, now: float | None = None) -> int:
     return added
 
 
+@dataclass(frozen=True)
+class TicketProjection:
+    ticket_count: int
+    next_ticket_at: float | None  # None when already at the cap
+    full_at: float | None  # None when already at the cap
+
+
+def _accrual_base(state: SaveData, at: float, rule: TicketRule) -> tuple[int, float]:
+    # Same starting point replenish_tickets would use at `at`, without touching state.
+    count = max(0, min(state.ticket_count, rule.cap))
+    if state.last_ticket_ts <= 0 or at < state.last_ticket_ts:
+        return count, at
+    return count, state.last_ticket_ts
+
+
+def project_ticket_count(state: SaveData, at: float, rule: TicketRule | None = None) -> int:
+    """Ticket count replenish_tickets would produce at time `at`; state is not modified."""
+    rule = rule or get_ticket_rule(state.paid_unlocked)
+    count, base_ts = _accrual_base(state, at, rule)
+    generated = int((at - base_ts) // rule.interval_seconds)
+    return min(rule.cap, count + max(0, generated))
+
+
+def project_tickets(state: SaveData, now: float | None = None, rule: TicketRule | None = None) -> TicketProjection:
+    """
+    Current count plus the exact times of the next ticket and of reaching the cap,
+    so callers can schedule one wake-up instead of polling.
+    """
+    current = time.time() if now is None else now
+    rule = rule or get_ticket_rule(state.paid_unlocked)
+    count, base_ts = _accrual_base(state, current, rule)
+    generated = max(0, int((current - base_ts) // rule.interval_seconds))
+    if count + generated >= rule.cap:
+        return TicketProjection(ticket_count=rule.cap, next_ticket_at=None, full_at=None)
+    return TicketProjection(
+        ticket_count=count + generated,
+        next_ticket_at=base_ts + (generated + 1) * rule.interval_seconds,
+        full_at=base_ts + (rule.cap - count) * rule.interval_seconds,
+    )
+
+
 def can_spend_tickets(state: SaveData, cost: int) -> bool:
     return cost > 0 and state.ticket_count >= cost
 
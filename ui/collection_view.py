@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import random
 import tkinter as tk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 import config
-from data.elements import ELEMENTS, Element
-from gacha import collected_count
+from data.elements import ELEMENT_BY_ATOMIC_NUMBER, ELEMENTS, Element
 from ui.element_detail import ElementDetailPanel
 from ui.gradient_frame import GradientFrame
+from ui.periodic_table_canvas import PeriodicTableCanvas
 
 if TYPE_CHECKING:
     from main import ElementGachaApp
@@ -87,10 +87,12 @@ class CollectionView(GradientFrame):
         self.mode_var = tk.StringVar(value="rarity")
         self.rarity_section_labels: dict[int, tk.Label] = {}
         self.rarity_card_widgets: dict[int, tuple[tk.Frame, tk.Label, tk.Label, tk.Label]] = {}
-        self.periodic_card_widgets: dict[int, tuple[tk.Frame, tk.Label, tk.Label, tk.Label]] = {}
+        self.periodic_table: PeriodicTableCanvas | None = None
         self.periodic_legend_title_label: tk.Label | None = None
         self.periodic_legend_labels: dict[str, tk.Label] = {}
         self._random_detail_initialized = False
+        # Atomic numbers whose cards are stale; None means every card.
+        self._dirty_cards: set[int] | None = None
 
         top = tk.Frame(root, bg=root_bg)
         top.pack(fill="x", pady=8, padx=12)
@@ -234,21 +236,14 @@ class CollectionView(GradientFrame):
         element: Element,
         width: int,
         height: int,
-        mode: str,
-        category_color: str | None = None,
     ) -> tuple[tk.Frame, tk.Label, tk.Label, tk.Label]:
-        bg = category_color if (mode == "periodic" and category_color) else config.RARITY_COLORS[element.rarity_level]
+        bg = config.RARITY_COLORS[element.rarity_level]
         card = tk.Frame(parent, width=width, height=height, bd=1, relief="solid", bg=bg)
         card.grid_propagate(False)
 
-        if mode == "periodic":
-            header_font = (config.FONT_EN, 7, "bold")
-            symbol_font = (config.FONT_EN, 12, "bold")
-            footer_font = (config.FONT_ZH, 7)
-        else:
-            header_font = (config.FONT_ZH, 7, "bold")
-            symbol_font = (config.FONT_EN, 14, "bold")
-            footer_font = (config.FONT_ZH, 8)
+        header_font = (config.FONT_ZH, 7, "bold")
+        symbol_font = (config.FONT_EN, 14, "bold")
+        footer_font = (config.FONT_ZH, 8)
 
         header = tk.Label(card, bg=bg, fg=config.ELEMENT_CARD_FG, font=header_font)
         header.place(relx=0.5, rely=0.15, anchor="center")
@@ -261,13 +256,7 @@ class CollectionView(GradientFrame):
 
         def on_click(_: tk.Event[tk.Misc]) -> None:
             owned_count = self.app.state.owned.get(element.atomic_number, 0)
-            detail_color = category_color if mode == "periodic" else None
-            self.detail_panel.show_element(
-                element,
-                owned_count,
-                reveal=owned_count > 0,
-                card_color=detail_color,
-            )
+            self.detail_panel.show_element(element, owned_count, reveal=owned_count > 0)
 
         for widget in (card, header, symbol, footer):
             widget.configure(cursor="hand2")
@@ -297,12 +286,11 @@ class CollectionView(GradientFrame):
             for index, element in enumerate(elements_by_rarity[rarity]):
                 row = index // columns
                 col = index % columns
-                card_widgets = self._create_card(grid, element, width=80, height=80, mode="rarity")
+                card_widgets = self._create_card(grid, element, width=80, height=80)
                 card_widgets[0].grid(row=row, column=col, padx=4, pady=4)
                 self.rarity_card_widgets[element.atomic_number] = card_widgets
 
     def _build_periodic_view(self, parent: tk.Widget) -> None:
-        self.periodic_card_widgets.clear()
         self.periodic_legend_title_label = None
         self.periodic_legend_labels.clear()
 
@@ -336,42 +324,35 @@ class CollectionView(GradientFrame):
             text_label.pack(side="left", padx=(4, 0))
             self.periodic_legend_labels[category] = text_label
 
-        table = tk.Frame(table_shell, bg=config.SPACE_BLUE_BG)
-        table.pack(anchor="nw")
-
-        for group in range(1, 19):
-            tk.Label(table, text=str(group), font=(config.FONT_EN, 7, "bold"), width=3, bg=config.SPACE_BLUE_BG, fg=config.SPACE_BLUE_FG).grid(row=0, column=group, pady=(0, 2))
-        for row in range(1, 8):
-            tk.Label(table, text=f"P{row}", font=(config.FONT_EN, 7, "bold"), width=3, bg=config.SPACE_BLUE_BG, fg=config.SPACE_BLUE_FG).grid(row=row, column=0, sticky="e")
-        tk.Label(table, text="La-Lu", font=(config.FONT_EN, 7, "bold"), width=3, bg=config.SPACE_BLUE_BG, fg=config.SPACE_BLUE_FG).grid(row=8, column=0, sticky="e")
-        tk.Label(table, text="Ac-Lr", font=(config.FONT_EN, 7, "bold"), width=3, bg=config.SPACE_BLUE_BG, fg=config.SPACE_BLUE_FG).grid(row=9, column=0, sticky="e")
+        self.periodic_table = PeriodicTableCanvas(table_shell, PERIODIC_POSITIONS, self._on_periodic_click)
+        self.periodic_table.pack(anchor="nw")
+        for element in ELEMENTS:
+            self.periodic_table.add_cell(element)
 
-        tk.Label(table, text="57-71", font=(config.FONT_EN, 7), width=4, fg=config.SPACE_BLUE_FG, bg=config.SPACE_BLUE_BG).grid(row=6, column=3)
-        tk.Label(table, text="89-103", font=(config.FONT_EN, 7), width=4, fg=config.SPACE_BLUE_FG, bg=config.SPACE_BLUE_BG).grid(row=7, column=3)
+    def _on_periodic_click(self, atomic_number: int) -> None:
+        element = ELEMENT_BY_ATOMIC_NUMBER.get(atomic_number)
+        if element is None:
+            return
+        owned_count = self.app.state.owned.get(atomic_number, 0)
+        self.detail_panel.show_element(
+            element,
+            owned_count,
+            reveal=owned_count > 0,
+            card_color=config.PERIODIC_CATEGORY_COLORS[self._periodic_category(atomic_number)],
+        )
 
-        for element in ELEMENTS:
-            position = PERIODIC_POSITIONS.get(element.atomic_number)
-            if position is None:
-                continue
-            row, col = position
-            category = self._periodic_category(element.atomic_number)
-            card_widgets = self._create_card(
-                table,
-                element,
-                width=46,
-                height=46,
-                mode="periodic",
-                category_color=config.PERIODIC_CATEGORY_COLORS[category],
-            )
-            card_widgets[0].grid(row=row, column=col, padx=1, pady=1)
-            self.periodic_card_widgets[element.atomic_number] = card_widgets
+    def mark_dirty(self, atomic_numbers: Iterable[int] | None = None) -> None:
+        if atomic_numbers is None:
+            self._dirty_cards = None
+        elif self._dirty_cards is not None:
+            self._dirty_cards.update(atomic_numbers)
 
     def _update_cards(
         self,
         card_widgets: dict[int, tuple[tk.Frame, tk.Label, tk.Label, tk.Label]],
-        periodic_mode: bool,
+        elements: Iterable[Element],
     ) -> None:
-        for element in ELEMENTS:
+        for element in elements:
             widgets = card_widgets.get(element.atomic_number)
             if widgets is None:
                 continue
@@ -379,33 +360,45 @@ class CollectionView(GradientFrame):
             owned_count = self.app.state.owned.get(element.atomic_number, 0)
             owned = owned_count > 0
 
-            if periodic_mode:
-                category = self._periodic_category(element.atomic_number)
-                base_bg = config.PERIODIC_CATEGORY_COLORS[category] if owned else config.UNKNOWN_CARD_COLOR
-                header_text = f"#{element.atomic_number}"
-                symbol_text = element.symbol if owned else config.UNKNOWN_CELL_TEXT
-                footer_text = self.app.element_name(element)[:4] if owned else config.UNKNOWN_CELL_TEXT
-            else:
-                base_bg = config.RARITY_COLORS[element.rarity_level] if owned else config.UNKNOWN_CARD_COLOR
-                header_text = (
-                    f"{self.app.element_name(element)} #{element.atomic_number}"
-                    if owned
-                    else f"{config.UNKNOWN_CELL_TEXT} #{element.atomic_number}"
-                )
-                symbol_text = element.symbol if owned else config.UNKNOWN_CELL_TEXT
-                footer_text = f"×{owned_count}" if owned else "×0"
+            base_bg = config.RARITY_COLORS[element.rarity_level] if owned else config.UNKNOWN_CARD_COLOR
+            header_text = (
+                f"{self.app.element_name(element)} #{element.atomic_number}"
+                if owned
+                else f"{config.UNKNOWN_CELL_TEXT} #{element.atomic_number}"
+            )
+            symbol_text = element.symbol if owned else config.UNKNOWN_CELL_TEXT
+            footer_text = f"×{owned_count}" if owned else "×0"
 
             card.configure(bg=base_bg)
             header.configure(text=header_text, bg=base_bg)
             symbol.configure(text=symbol_text, bg=base_bg)
             footer.configure(text=footer_text, bg=base_bg)
 
+    def _update_periodic_cells(self, elements: Iterable[Element]) -> None:
+        if self.periodic_table is None:
+            return
+        for element in elements:
+            owned = self.app.state.owned.get(element.atomic_number, 0) > 0
+            category = self._periodic_category(element.atomic_number)
+            self.periodic_table.update_cell(
+                element.atomic_number,
+                bg=config.PERIODIC_CATEGORY_COLORS[category] if owned else config.UNKNOWN_CARD_COLOR,
+                header_text=f"#{element.atomic_number}",
+                symbol_text=element.symbol if owned else config.UNKNOWN_CELL_TEXT,
+                footer_text=self.app.element_name(element)[:4] if owned else config.UNKNOWN_CELL_TEXT,
+            )
+
     def on_show(self) -> None:
-        current = collected_count(self.app.state, ELEMENTS)
-        self.progress_label.config(text=self.app.tr("collection_progress", collected=current))
+        current = self.app.stats.collected
+        self.progress_label.config(text=self.app.catalog.texts["collection_progress"].format(collected=current))
+        if self._dirty_cards is None:
+            stale: list[Element] = list(ELEMENTS)
+        else:
+            stale = [ELEMENT_BY_ATOMIC_NUMBER[n] for n in sorted(self._dirty_cards) if n in ELEMENT_BY_ATOMIC_NUMBER]
         # Keep both modes up to date, so switching modes doesn't trigger reflow/flicker.
-        self._update_cards(self.rarity_card_widgets, periodic_mode=False)
-        self._update_cards(self.periodic_card_widgets, periodic_mode=True)
+        self._update_cards(self.rarity_card_widgets, stale)
+        self._update_periodic_cells(stale)
+        self._dirty_cards = set()
         if not self._random_detail_initialized:
             self._show_random_detail()
 
@@ -428,18 +421,20 @@ class CollectionView(GradientFrame):
         self._random_detail_initialized = True
 
     def refresh_texts(self) -> None:
-        self.back_button.configure(text=self.app.tr("back_to_menu"))
-        self.mode_rarity_button.configure(text=self.app.tr("collection_mode_rarity"))
-        self.mode_periodic_button.configure(text=self.app.tr("collection_mode_periodic"))
+        catalog = self.app.catalog
+        texts = catalog.many("back_to_menu", "collection_mode_rarity", "collection_mode_periodic", "periodic_legend_title")
+        self.back_button.configure(text=texts["back_to_menu"])
+        self.mode_rarity_button.configure(text=texts["collection_mode_rarity"])
+        self.mode_periodic_button.configure(text=texts["collection_mode_periodic"])
 
         for rarity, label in self.rarity_section_labels.items():
-            label.configure(text=self.app.collection_section_title(rarity))
+            label.configure(text=catalog.collection_section_title(rarity))
 
         if self.periodic_legend_title_label is not None and self.periodic_legend_title_label.winfo_exists():
-            self.periodic_legend_title_label.configure(text=self.app.tr("periodic_legend_title"))
+            self.periodic_legend_title_label.configure(text=texts["periodic_legend_title"])
         for category, label in self.periodic_legend_labels.items():
             if label.winfo_exists():
-                label.configure(text=self.app.periodic_category_label(category))
+                label.configure(text=catalog.periodic_category_label(category))
 
         self.detail_panel.refresh_texts()
         self.on_show()
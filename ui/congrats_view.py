@@ -4,7 +4,6 @@ import tkinter as tk
 from typing import TYPE_CHECKING
 
 import config
-from data.elements import ELEMENTS
 
 if TYPE_CHECKING:
     from main import ElementGachaApp
@@ -114,27 +113,20 @@ class CongratsView(tk.Frame):
         self.refresh_texts()
         texts = self._texts()
 
-        collected = sum(1 for e in ELEMENTS if self.app.state.owned.get(e.atomic_number, 0) > 0)
-        total_owned_cards = sum(self.app.state.owned.values())
+        stats = self.app.stats
+        collected = stats.collected
+        total_owned_cards = stats.total_owned_cards
         duplicate_cards = max(0, total_owned_cards - collected)
         total_draws = self.app.state.total_draws
 
-        top_atomic = 0
-        top_count = 0
-        for atomic_number, count in self.app.state.owned.items():
-            if count > top_count:
-                top_atomic = atomic_number
-                top_count = count
-        top_element = next((e for e in ELEMENTS if e.atomic_number == top_atomic), None)
+        top_count = stats.top_count
+        top_element = stats.top_element()
         top_name = self.app.element_name(top_element) if top_element is not None else "-"
         top_symbol = top_element.symbol if top_element is not None else "-"
 
         rarity_stats: list[str] = []
         for rarity in sorted(config.RARITY_WEIGHTS.keys(), reverse=True):
-            total_in_rarity = sum(1 for e in ELEMENTS if e.rarity_level == rarity)
-            owned_in_rarity = sum(
-                1 for e in ELEMENTS if e.rarity_level == rarity and self.app.state.owned.get(e.atomic_number, 0) > 0
-            )
+            owned_in_rarity, total_in_rarity = stats.rarity_progress(rarity)
             rarity_stats.append(f"R{rarity} {self.app.rarity_label(rarity)}: {owned_in_rarity}/{total_in_rarity}")
 
         lines = [
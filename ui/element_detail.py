@@ -108,10 +108,9 @@ class ElementDetailPanel(tk.LabelFrame):
         self.value_vars["name_local"].set(local_name)
         self.value_vars["name_en"].set(element.name_en)
         self.value_vars["rarity"].set(f"R{element.rarity_level} {self.app.rarity_label(element.rarity_level)}")
-        abundance = config.EARTH_ABUNDANCE_PPM.get(
-            element.atomic_number,
-            self.app.tr("detail_abundance_na"),
-        )
+        abundance = config.EARTH_ABUNDANCE_PPM.get(element.atomic_number)
+        if abundance is None:
+            abundance = self.app.catalog.texts["detail_abundance_na"]
         self.value_vars["earth_abundance"].set(abundance)
         self.value_vars["owned_count"].set(str(owned_count))
 
@@ -127,10 +126,11 @@ class ElementDetailPanel(tk.LabelFrame):
         )
 
     def refresh_texts(self) -> None:
-        self.configure(text=self.app.tr("detail_panel_title"))
-        self._placeholder.configure(text=self.app.tr("detail_placeholder"))
+        texts = self.app.texts("detail_panel_title", "detail_placeholder", *self.row_label_widgets)
+        self.configure(text=texts["detail_panel_title"])
+        self._placeholder.configure(text=texts["detail_placeholder"])
         for key, label in self.row_label_widgets.items():
-            label.configure(text=f"{self.app.tr(key)}:")
+            label.configure(text=f"{texts[key]}:")
 
         self.refresh_current_data()
 
@@ -231,9 +231,10 @@ class ElementDetailBanner(tk.LabelFrame):
         self.info_vars["name_local"].set(local_name)
         self.info_vars["name_en"].set(element.name_en)
         self.info_vars["rarity"].set(f"R{element.rarity_level} {self.app.rarity_label(element.rarity_level)}")
-        self.info_vars["earth_abundance"].set(
-            config.EARTH_ABUNDANCE_PPM.get(element.atomic_number, self.app.tr("detail_abundance_na"))
-        )
+        abundance = config.EARTH_ABUNDANCE_PPM.get(element.atomic_number)
+        if abundance is None:
+            abundance = self.app.catalog.texts["detail_abundance_na"]
+        self.info_vars["earth_abundance"].set(abundance)
         self.info_vars["owned_count"].set(str(owned_count))
 
     def refresh_current_data(self) -> None:
@@ -248,9 +249,10 @@ class ElementDetailBanner(tk.LabelFrame):
         )
 
     def refresh_texts(self) -> None:
-        self.configure(text=self.app.tr("detail_panel_title"))
-        self._placeholder.configure(text=self.app.tr("detail_placeholder"))
+        texts = self.app.texts("detail_panel_title", "detail_placeholder", *self.info_labels)
+        self.configure(text=texts["detail_panel_title"])
+        self._placeholder.configure(text=texts["detail_placeholder"])
         for key, label in self.info_labels.items():
-            label.configure(text=self.app.tr(key))
+            label.configure(text=texts[key])
 
         self.refresh_current_data()
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import json
+import math
 import tkinter as tk
-from collections import defaultdict
-from typing import TYPE_CHECKING
+from tkinter import messagebox
+from typing import TYPE_CHECKING, Callable
 
 import config
-from data.elements import ELEMENTS
-from gacha import DrawBatchResult, DrawEntry, collected_count, draw_batch
-from ticket import get_ticket_rule, replenish_tickets
+from data.elements import Element
+from events import LICENSE_CHANGED, OWNERSHIP_CHANGED, TICKETS_CHANGED
+from gacha import DrawBatchResult, draw_batch
+from ticket import get_ticket_rule, project_tickets, replenish_tickets
 from ui.element_detail import ElementDetailPanel
 from ui.gradient_frame import GradientFrame
 
@@ -15,6 +18,51 @@ if TYPE_CHECKING:
     from main import ElementGachaApp
 
 
+class ResultCard:
+    """A result card built once per element and reconfigured on every draw."""
+
+    def __init__(self, parent: tk.Widget, element: Element, on_click: Callable[[Element], None]) -> None:
+        bg_color = config.RARITY_COLORS[element.rarity_level]
+        self.element = element
+        self.frame = tk.Frame(parent, width=80, height=80, bg=bg_color, bd=1, relief="solid")
+        self.frame.grid_propagate(False)
+
+        symbol = tk.Label(self.frame, text=element.symbol, bg=bg_color, fg=config.ELEMENT_CARD_FG, font=(config.FONT_EN, 16, "bold"))
+        symbol.place(relx=0.5, rely=0.42, anchor="center")
+
+        self.name_label = tk.Label(self.frame, bg=bg_color, fg=config.ELEMENT_CARD_FG, font=(config.FONT_ZH, 9))
+        self.name_label.place(relx=0.5, rely=0.83, anchor="center")
+
+        self.count_label = tk.Label(self.frame, bg=bg_color, fg=config.ELEMENT_CARD_FG, font=(config.FONT_EN, 9, "bold"))
+        self.count_label.place(relx=0.96, rely=0.97, anchor="se")
+
+        self.new_tag = tk.Label(self.frame, text="NEW", bg="#fff2a8", fg="#7a1f1f", font=(config.FONT_EN, 8, "bold"))
+        self._new_visible = False
+        self._name = ""
+        self._count = -1
+
+        def handle_click(_: tk.Event[tk.Misc]) -> None:
+            on_click(self.element)
+
+        for widget in (self.frame, symbol, self.name_label, self.count_label, self.new_tag):
+            widget.configure(cursor="hand2")
+            widget.bind("<Button-1>", handle_click)
+
+    def update(self, name: str, count: int, is_new: bool) -> None:
+        if name != self._name:
+            self.name_label.configure(text=name)
+            self._name = name
+        if count != self._count:
+            self.count_label.configure(text=f"×{count}")
+            self._count = count
+        if is_new != self._new_visible:
+            if is_new:
+                self.new_tag.place(x=2, y=2, anchor="nw")
+            else:
+                self.new_tag.place_forget()
+            self._new_visible = is_new
+
+
 class GachaView(GradientFrame):
     def __init__(self, parent: tk.Widget, app: "ElementGachaApp") -> None:
         super().__init__(parent)
@@ -22,9 +70,13 @@ class GachaView(GradientFrame):
         root = self.body
         root_bg = config.SPACE_BLUE_BG
         self._active = False
-        self._tick_id: str | None = None
+        self._ticket_wakeup_id: str | None = None
+        self._unsubscribers: list[Callable[[], None]] = []
         self._button_mode_paid: bool | None = None
         self._last_result: DrawBatchResult | None = None
+        self._result_sections: dict[int, tuple[tk.Frame, tk.Label, tk.Frame]] = {}
+        self._result_cards: dict[int, ResultCard] = {}
+        self._shown_cards: set[int] = set()
 
         top = tk.Frame(root, bg=root_bg)
         top.pack(fill="x", padx=12, pady=8)
@@ -48,6 +100,16 @@ class GachaView(GradientFrame):
         self.notice_label = tk.Label(root, text="", fg=config.SPACE_BLUE_FG, bg=root_bg, font=(config.FONT_ZH, 11))
         self.notice_label.pack(anchor="w", padx=12)
 
+        # Commit-reveal mode: show the published commitment and let the player reveal the seed.
+        self.fair_frame = tk.Frame(root, bg=root_bg)
+        self.fair_label = tk.Label(self.fair_frame, text="", font=(config.FONT_EN, 9), bg=root_bg, fg=config.SPACE_BLUE_FG, anchor="w")
+        self.fair_label.pack(side="left")
+        self.reveal_button = tk.Button(self.fair_frame, font=(config.FONT_ZH, 10), command=self.reveal_fair_seed)
+        self._style_button(self.reveal_button)
+        self.reveal_button.pack(side="right")
+        if hasattr(self.app.rng, "reveal"):
+            self.fair_frame.pack(fill="x", padx=12, pady=(2, 0))
+
         result_wrapper = tk.Frame(root, bg=root_bg)
         result_wrapper.pack(fill="both", expand=True, padx=12, pady=8)
         result_wrapper.grid_columnconfigure(0, weight=1)
@@ -89,20 +151,56 @@ class GachaView(GradientFrame):
     def on_show(self) -> None:
         self._active = True
         self.detail_panel.grid_remove()
-        self.refresh_status()
-        self._tick()
+        events = self.app.events
+        # on_show also runs again after a language switch; never subscribe twice.
+        self._unsubscribe_all()
+        self._unsubscribers = [
+            events.subscribe(TICKETS_CHANGED, self._on_state_changed),
+            events.subscribe(OWNERSHIP_CHANGED, self._on_state_changed),
+            events.subscribe(LICENSE_CHANGED, self._on_state_changed),
+        ]
+        self._on_state_changed()
 
     def on_hide(self) -> None:
         self._active = False
-        if self._tick_id is not None:
-            self.after_cancel(self._tick_id)
-            self._tick_id = None
+        self._unsubscribe_all()
+        self._cancel_ticket_wakeup()
+
+    def _unsubscribe_all(self) -> None:
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
 
-    def _tick(self) -> None:
+    def _on_state_changed(self, _: object = None) -> None:
         if not self._active:
             return
         self.refresh_status()
-        self._tick_id = self.after(400, self._tick)
+        self._schedule_ticket_wakeup()
+
+    def _cancel_ticket_wakeup(self) -> None:
+        if self._ticket_wakeup_id is not None:
+            self.after_cancel(self._ticket_wakeup_id)
+            self._ticket_wakeup_id = None
+
+    def _schedule_ticket_wakeup(self) -> None:
+        # One timer aligned to the next ticket boundary; none at all while the cap is reached.
+        self._cancel_ticket_wakeup()
+        now = self.app.time_provider()
+        next_ticket_at = project_tickets(self.app.state, now=now).next_ticket_at
+        if next_ticket_at is None:
+            return
+        delay_ms = max(1, math.ceil((next_ticket_at - now) * 1000))
+        self._ticket_wakeup_id = self.after(delay_ms, self._on_ticket_wakeup)
+
+    def _on_ticket_wakeup(self) -> None:
+        self._ticket_wakeup_id = None
+        if not self._active:
+            return
+        if replenish_tickets(self.app.state, now=self.app.time_provider()) > 0:
+            self.app.events.publish(TICKETS_CHANGED)
+        else:
+            # Woke a hair early (timer or float rounding); aim at the same boundary again.
+            self._schedule_ticket_wakeup()
 
     def _on_result_frame_configure(self, _: tk.Event[tk.Misc]) -> None:
         self.result_canvas.configure(scrollregion=self.result_canvas.bbox("all"))
@@ -164,90 +262,87 @@ class GachaView(GradientFrame):
 
         rule = get_ticket_rule(self.app.state.paid_unlocked)
         speed_text = self.app.tr("gacha_speed_paid") if self.app.state.paid_unlocked else self.app.tr("gacha_speed_free")
-        collected = sum(1 for element in ELEMENTS if self.app.state.owned.get(element.atomic_number, 0) > 0)
+        collected = self.app.stats.collected
 
         self.ticket_label.config(text=self.app.tr("gacha_ticket", current=self.app.state.ticket_count, cap=rule.cap))
         self.speed_label.config(text=speed_text)
         self.stats_label.config(text=self.app.tr("gacha_stats", total=self.app.state.total_draws, collected=collected))
+        self.refresh_fair_status()
 
-    def _clear_results(self) -> None:
-        for child in self.result_frame.winfo_children():
-            child.destroy()
-
-    def _create_card(self, parent: tk.Widget, entry: DrawEntry, is_new: bool) -> tk.Frame:
-        rarity = entry.element.rarity_level
-        bg_color = config.RARITY_COLORS[rarity]
-
-        card = tk.Frame(parent, width=80, height=80, bg=bg_color, bd=1, relief="solid")
-        card.grid_propagate(False)
-
-        symbol = tk.Label(card, text=entry.element.symbol, bg=bg_color, fg=config.ELEMENT_CARD_FG, font=(config.FONT_EN, 16, "bold"))
-        symbol.place(relx=0.5, rely=0.42, anchor="center")
-
-        name = tk.Label(card, text=self.app.element_name(entry.element), bg=bg_color, fg=config.ELEMENT_CARD_FG, font=(config.FONT_ZH, 9))
-        name.place(relx=0.5, rely=0.83, anchor="center")
-
-        count = tk.Label(card, text=f"×{entry.count}", bg=bg_color, fg=config.ELEMENT_CARD_FG, font=(config.FONT_EN, 9, "bold"))
-        count.place(relx=0.96, rely=0.97, anchor="se")
-
-        clickable_widgets: list[tk.Widget] = [card, symbol, name, count]
-        if is_new:
-            tag = tk.Label(card, text="NEW", bg="#fff2a8", fg="#7a1f1f", font=(config.FONT_EN, 8, "bold"))
-            tag.place(x=2, y=2, anchor="nw")
-            clickable_widgets.append(tag)
-
-        def on_click(_: tk.Event[tk.Misc]) -> None:
-            owned_count = self.app.state.owned.get(entry.element.atomic_number, 0)
-            self.detail_panel.grid(row=0, column=1, sticky="ns", padx=(10, 0))
-            self.detail_panel.show_element(entry.element, owned_count)
-
-        for widget in clickable_widgets:
-            widget.configure(cursor="hand2")
-            widget.bind("<Button-1>", on_click)
-
+    def refresh_fair_status(self) -> None:
+        source = self.app.rng
+        if not hasattr(source, "reveal"):
+            return
+        nonce = source.last_nonce
+        self.fair_label.config(text=self.app.tr("fair_status", commitment=source.commitment, nonce="-" if nonce is None else nonce))
+
+    def reveal_fair_seed(self) -> None:
+        revealed = self.app.rng.reveal().to_dict()
+        self.clipboard_clear()
+        self.clipboard_append(json.dumps(revealed))
+        messagebox.showinfo(self.app.tr("fair_reveal"), self.app.tr("fair_revealed", **revealed), parent=self)
+        self.refresh_fair_status()
+
+    def _result_section(self, rarity: int) -> tuple[tk.Frame, tk.Label, tk.Frame]:
+        section_widgets = self._result_sections.get(rarity)
+        if section_widgets is None:
+            section = tk.Frame(self.result_frame, bg=config.SPACE_BLUE_BG)
+            title = tk.Label(
+                section,
+                font=(config.FONT_ZH, 12, "bold"),
+                bg=config.SPACE_BLUE_BG,
+                fg=config.SPACE_BLUE_FG,
+            )
+            title.pack(anchor="w", pady=(0, 4))
+            grid = tk.Frame(section, bg=config.SPACE_BLUE_BG)
+            grid.pack(fill="x")
+            section_widgets = (section, title, grid)
+            self._result_sections[rarity] = section_widgets
+        return section_widgets
+
+    def _result_card(self, element: Element) -> ResultCard:
+        card = self._result_cards.get(element.atomic_number)
+        if card is None:
+            _, _, grid = self._result_section(element.rarity_level)
+            card = ResultCard(grid, element, self._on_card_click)
+            self._result_cards[element.atomic_number] = card
         return card
 
-    def _render_grouped_results(self, result: DrawBatchResult) -> None:
-        self._clear_results()
-        is_new_map = {entry.element.atomic_number: True for entry in result.newly_obtained}
-
-        grouped: dict[int, list[tuple[DrawEntry, bool]]] = defaultdict(list)
-        all_entries = result.newly_obtained + result.already_owned
-        for entry in all_entries:
-            grouped[entry.element.rarity_level].append(
-                (entry, is_new_map.get(entry.element.atomic_number, False))
-            )
+    def _on_card_click(self, element: Element) -> None:
+        owned_count = self.app.state.owned.get(element.atomic_number, 0)
+        self.detail_panel.grid(row=0, column=1, sticky="ns", padx=(10, 0))
+        self.detail_panel.show_element(element, owned_count)
 
+    def _render_grouped_results(self, result: DrawBatchResult) -> None:
+        # Cards and sections are pooled: a redraw only reconfigures and re-grids them.
+        grouped = result.by_rarity
+        shown: set[int] = set()
         columns = 10
         for rarity in config.RARITY_ORDER_DESC:
             items = grouped.get(rarity, [])
+            section_widgets = self._result_sections.get(rarity)
+            if section_widgets is not None:
+                section_widgets[0].pack_forget()
             if not items:
                 continue
 
-            items.sort(key=lambda pair: pair[0].element.atomic_number)
-            section = tk.Frame(self.result_frame, bg=config.SPACE_BLUE_BG)
+            section, title, _ = self._result_section(rarity)
+            title.configure(text=self.app.rarity_label(rarity))
             section.pack(fill="x", pady=(0, 10))
 
-            tk.Label(
-                section,
-                text=self.app.rarity_label(rarity),
-                font=(config.FONT_ZH, 12, "bold"),
-                bg=config.SPACE_BLUE_BG,
-                fg=config.SPACE_BLUE_FG,
-            ).pack(anchor="w", pady=(0, 4))
-
-            grid = tk.Frame(section, bg=config.SPACE_BLUE_BG)
-            grid.pack(fill="x")
-
             for index, (entry, is_new) in enumerate(items):
-                row = index // columns
-                column = index % columns
-                card = self._create_card(grid, entry, is_new)
-                card.grid(row=row, column=column, padx=4, pady=4)
+                card = self._result_card(entry.element)
+                card.update(self.app.element_name(entry.element), entry.count, is_new)
+                card.frame.grid(row=index // columns, column=index % columns, padx=4, pady=4)
+                shown.add(entry.element.atomic_number)
+
+        for atomic_number in self._shown_cards - shown:
+            self._result_cards[atomic_number].frame.grid_remove()
+        self._shown_cards = shown
 
     def draw_many(self, draw_count: int) -> None:
         replenish_tickets(self.app.state, now=self.app.time_provider())
-        before_collected = collected_count(self.app.state, ELEMENTS)
+        before_collected = self.app.stats.collected
         if self.app.state.ticket_count < draw_count:
             self.notice_label.config(
                 text=self.app.tr(
@@ -265,21 +360,22 @@ class GachaView(GradientFrame):
             engine=self.app.gacha_engine,
             draw_count=draw_count,
             now=self.app.time_provider(),
+            stats=self.app.stats,
         )
         if not result.success:
             self.notice_label.config(text=self.app.tr("insufficient_tickets", current=self.app.state.ticket_count, need=draw_count), fg=config.SPACE_BLUE_FG)
             return
 
         self._last_result = result
-        self.app.persist()
         self.notice_label.config(text="", fg=config.SPACE_BLUE_FG)
         self.detail_panel.grid_remove()
         self._render_grouped_results(result)
-        self.refresh_status()
+        self.app.commit_draw(result)
         self.app.check_completion_and_show(before_collected)
 
     def refresh_texts(self) -> None:
         self.back_button.configure(text=self.app.tr("back_to_menu"))
+        self.reveal_button.configure(text=self.app.tr("fair_reveal"))
         self._refresh_draw_buttons(force=True)
         self.detail_panel.refresh_texts()
         if self._last_result is not None:
@@ -1,20 +1,65 @@
 from __future__ import annotations
 
 import tkinter as tk
+from collections import OrderedDict
 
 import config
 
+GRADIENT_CACHE_SIZE = 4
+
+# Shared by every GradientFrame: one image per (interpreter, height), as wide as the screen.
+# All frames fill the same container, so they normally share one entry; the LRU only
+# bounds what a window resize leaves behind. Frames keep a reference to the image they
+# show, so eviction never blanks a visible gradient.
+_GRADIENT_IMAGES: OrderedDict[tuple[int, int], tk.PhotoImage] = OrderedDict()
+
+
+def _gradient_image(widget: tk.Misc, height: int) -> tk.PhotoImage:
+    key = (id(widget.tk), height)
+    image = _GRADIENT_IMAGES.get(key)
+    if image is not None:
+        _GRADIENT_IMAGES.move_to_end(key)
+        return image
+
+    width = max(1, widget.winfo_screenwidth())
+    image = tk.PhotoImage(master=widget._root(), width=width, height=height)
+    r1, g1, b1 = widget.winfo_rgb(config.SPACE_BLUE_GRADIENT_TOP)
+    r2, g2, b2 = widget.winfo_rgb(config.SPACE_BLUE_GRADIENT_BOTTOM)
+    steps = max(2, min(height, 180))
+    for i in range(steps):
+        ratio = i / (steps - 1)
+        nr = int(r1 + (r2 - r1) * ratio)
+        ng = int(g1 + (g2 - g1) * ratio)
+        nb = int(b1 + (b2 - b1) * ratio)
+        color = f"#{nr // 256:02x}{ng // 256:02x}{nb // 256:02x}"
+        y1 = int(i * height / steps)
+        y2 = int((i + 1) * height / steps)
+        if y2 > y1:
+            image.put(color, to=(0, y1, width, y2))
+    _GRADIENT_IMAGES[key] = image
+    while len(_GRADIENT_IMAGES) > GRADIENT_CACHE_SIZE:
+        _GRADIENT_IMAGES.popitem(last=False)
+    return image
+
 
 class GradientFrame(tk.Frame):
     def __init__(self, parent: tk.Widget) -> None:
         super().__init__(parent)
         self._gradient_after_id: str | None = None
         self._last_size: tuple[int, int] = (0, 0)
+        self._gradient_item: int | None = None
+        self._gradient_image: tk.PhotoImage | None = None
 
         self.bg_canvas = tk.Canvas(self, highlightthickness=0, bd=0)
         self.bg_canvas.pack(fill="both", expand=True)
         self.body: tk.Widget = self.bg_canvas
 
+        if self.winfo_rgb(config.SPACE_BLUE_GRADIENT_TOP) == self.winfo_rgb(config.SPACE_BLUE_GRADIENT_BOTTOM):
+            # Solid background: nothing to draw and nothing to redo on resize.
+            self.bg_canvas.configure(bg=config.SPACE_BLUE_GRADIENT_TOP)
+            return
+        # Covers any strip the cached image does not reach (e.g. windows wider than the screen).
+        self.bg_canvas.configure(bg=config.SPACE_BLUE_GRADIENT_BOTTOM)
         self.bg_canvas.bind("<Configure>", self._on_canvas_configure)
 
     def _on_canvas_configure(self, event: tk.Event[tk.Misc]) -> None:
@@ -26,22 +71,14 @@ class GradientFrame(tk.Frame):
         self._last_size = (width, height)
         if self._gradient_after_id is not None:
             self.after_cancel(self._gradient_after_id)
-        self._gradient_after_id = self.after(60, lambda w=width, h=height: self._draw_gradient(w, h))
+        self._gradient_after_id = self.after(60, lambda h=height: self._draw_gradient(h))
 
-    def _draw_gradient(self, width: int, height: int) -> None:
+    def _draw_gradient(self, height: int) -> None:
         self._gradient_after_id = None
-        self.bg_canvas.delete("gradient")
-        r1, g1, b1 = self.winfo_rgb(config.SPACE_BLUE_GRADIENT_TOP)
-        r2, g2, b2 = self.winfo_rgb(config.SPACE_BLUE_GRADIENT_BOTTOM)
-
-        steps = max(2, min(height, 180))
-        for i in range(steps):
-            ratio = i / (steps - 1)
-            nr = int(r1 + (r2 - r1) * ratio)
-            ng = int(g1 + (g2 - g1) * ratio)
-            nb = int(b1 + (b2 - b1) * ratio)
-            color = f"#{nr // 256:02x}{ng // 256:02x}{nb // 256:02x}"
-            y1 = int(i * height / steps)
-            y2 = int((i + 1) * height / steps)
-            self.bg_canvas.create_rectangle(0, y1, width, y2, outline="", fill=color, tags="gradient")
+        image = _gradient_image(self, height)
+        self._gradient_image = image
+        if self._gradient_item is None:
+            self._gradient_item = self.bg_canvas.create_image(0, 0, anchor="nw", image=image, tags="gradient")
+        else:
+            self.bg_canvas.itemconfigure(self._gradient_item, image=image)
         self.bg_canvas.tag_lower("gradient")
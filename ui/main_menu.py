@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import os
 import tkinter as tk
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -7,13 +10,15 @@ from typing import TYPE_CHECKING
 import config
 from ui.gradient_frame import GradientFrame
 
+# PIL is only imported when the scaled image is not cached yet.
 try:
-    from PIL import Image, ImageTk
-
-    PIL_AVAILABLE = True
-except Exception:
+    PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+except (ImportError, ValueError):
     PIL_AVAILABLE = False
 
+EARTH_IMAGE_SIZE = 120
+EARTH_CACHE_PREFIX = "earth-"
+
 if TYPE_CHECKING:
     from main import ElementGachaApp
 
@@ -68,6 +73,42 @@ HELP_DIALOG_BODY: dict[str, str] = {
 }
 
 
+def _earth_cache_path(source: Path, max_size: int) -> Path:
+    digest = hashlib.sha256(source.read_bytes()).hexdigest()[:16]
+    return config.SAVE_DIR / config.IMAGE_CACHE_DIRNAME / f"{EARTH_CACHE_PREFIX}{digest}-{max_size}.png"
+
+
+def _load_cached_image(cache_path: Path) -> tk.PhotoImage | None:
+    if not cache_path.exists():
+        return None
+    try:
+        return tk.PhotoImage(file=str(cache_path))
+    except tk.TclError:
+        return None
+
+
+def _render_scaled_image(source: Path, max_size: int, cache_path: Path) -> tk.PhotoImage | None:
+    from PIL import Image, ImageTk
+
+    try:
+        image = Image.open(source).convert("RGBA")
+    except OSError:
+        return None
+    image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in cache_path.parent.glob(f"{EARTH_CACHE_PREFIX}*.png"):
+            if stale != cache_path:
+                stale.unlink()
+        temp_path = cache_path.with_suffix(".tmp")
+        image.save(temp_path, format="PNG")
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # Cache is an optimisation; the image is still shown.
+    return ImageTk.PhotoImage(image)
+
+
 class MainMenu(GradientFrame):
     def __init__(self, parent: tk.Widget, app: "ElementGachaApp") -> None:
         super().__init__(parent)
@@ -158,8 +199,6 @@ class MainMenu(GradientFrame):
         )
 
     def _add_earth_decorations(self) -> None:
-        if not PIL_AVAILABLE:
-            return
         project_root = Path(__file__).resolve().parents[1]
         candidates = (
             "earth.png",
@@ -174,13 +213,14 @@ class MainMenu(GradientFrame):
             return
 
         try:
-            source = Image.open(image_path).convert("RGBA")
+            cache_path = _earth_cache_path(image_path, EARTH_IMAGE_SIZE)
         except OSError:
             return
-
-        max_size = 120
-        source.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-        image = ImageTk.PhotoImage(source)
+        image = _load_cached_image(cache_path)
+        if image is None and PIL_AVAILABLE:
+            image = _render_scaled_image(image_path, EARTH_IMAGE_SIZE, cache_path)
+        if image is None:
+            return
 
         self._earth_images = [image] * 4
         positions = (
@@ -198,11 +238,12 @@ class MainMenu(GradientFrame):
             self._earth_labels.append(label)
 
     def refresh_texts(self) -> None:
-        self.title_label.configure(text=self.app.tr("app_title"))
-        self.start_button.configure(text=self.app.tr("main_start_gacha"))
-        self.collection_button.configure(text=self.app.tr("main_collection"))
-        self.settings_button.configure(text=self.app.tr("main_settings"))
-        self.exit_button.configure(text=self.app.tr("main_exit"))
+        texts = self.app.texts("app_title", "main_start_gacha", "main_collection", "main_settings", "main_exit")
+        self.title_label.configure(text=texts["app_title"])
+        self.start_button.configure(text=texts["main_start_gacha"])
+        self.collection_button.configure(text=texts["main_collection"])
+        self.settings_button.configure(text=texts["main_settings"])
+        self.exit_button.configure(text=texts["main_exit"])
 
     def show_how_to_play(self) -> None:
         lang = getattr(self.app.state, "ui_language", "zh")
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import tkinter as tk
+from typing import Callable
+
+import config
+from data.elements import Element
+
+CELL_SIZE = 46
+CELL_GAP = 2
+LEFT_MARGIN = 36
+TOP_MARGIN = 16
+
+
+class PeriodicTableCanvas(tk.Canvas):
+    """
+    Periodic table drawn as canvas items on a single widget.
+    Each cell is a rectangle plus three text items sharing an `atomic-<n>` tag;
+    clicks are resolved from the tags of the item under the pointer.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Widget,
+        positions: dict[int, tuple[int, int]],
+        on_click: Callable[[int], None],
+        bg: str = config.SPACE_BLUE_BG,
+    ) -> None:
+        pitch = CELL_SIZE + CELL_GAP
+        rows = max(row for row, _ in positions.values())
+        columns = max(column for _, column in positions.values())
+        super().__init__(
+            parent,
+            width=LEFT_MARGIN + columns * pitch,
+            height=TOP_MARGIN + rows * pitch,
+            bg=bg,
+            highlightthickness=0,
+            bd=0,
+        )
+        self.positions = positions
+        self._on_click = on_click
+        self._cells: dict[int, tuple[int, int, int, int]] = {}
+        self._cell_state: dict[int, tuple[str, str, str, str]] = {}
+        self._draw_axes(rows, columns)
+        self.tag_bind("cell", "<Button-1>", self._handle_click)
+        self.tag_bind("cell", "<Enter>", lambda _: self.configure(cursor="hand2"))
+        self.tag_bind("cell", "<Leave>", lambda _: self.configure(cursor=""))
+
+    def _cell_origin(self, row: int, column: int) -> tuple[int, int]:
+        pitch = CELL_SIZE + CELL_GAP
+        return LEFT_MARGIN + (column - 1) * pitch + CELL_GAP // 2, TOP_MARGIN + (row - 1) * pitch + CELL_GAP // 2
+
+    def _draw_axes(self, rows: int, columns: int) -> None:
+        axis_font = (config.FONT_EN, 7, "bold")
+        for group in range(1, columns + 1):
+            x, _ = self._cell_origin(1, group)
+            self.create_text(x + CELL_SIZE // 2, TOP_MARGIN // 2, text=str(group), font=axis_font, fill=config.SPACE_BLUE_FG)
+        row_titles = {row: f"P{row}" for row in range(1, 8)}
+        row_titles.update({8: "La-Lu", 9: "Ac-Lr"})
+        for row in range(1, rows + 1):
+            _, y = self._cell_origin(row, 1)
+            self.create_text(
+                LEFT_MARGIN - 4,
+                y + CELL_SIZE // 2,
+                text=row_titles.get(row, ""),
+                font=axis_font,
+                fill=config.SPACE_BLUE_FG,
+                anchor="e",
+            )
+        # Placeholders pointing at the lanthanide/actinide rows below the main table.
+        for row, text in ((6, "57-71"), (7, "89-103")):
+            x, y = self._cell_origin(row, 3)
+            self.create_text(x + CELL_SIZE // 2, y + CELL_SIZE // 2, text=text, font=(config.FONT_EN, 7), fill=config.SPACE_BLUE_FG)
+
+    def add_cell(self, element: Element) -> None:
+        position = self.positions.get(element.atomic_number)
+        if position is None or element.atomic_number in self._cells:
+            return
+        x, y = self._cell_origin(*position)
+        tags = ("cell", f"atomic-{element.atomic_number}")
+        rect = self.create_rectangle(x, y, x + CELL_SIZE, y + CELL_SIZE, outline="#000000", width=1, tags=tags)
+        header = self.create_text(
+            x + CELL_SIZE // 2, y + CELL_SIZE * 0.15, font=(config.FONT_EN, 7, "bold"), fill=config.ELEMENT_CARD_FG, tags=tags
+        )
+        symbol = self.create_text(
+            x + CELL_SIZE // 2, y + CELL_SIZE * 0.5, font=(config.FONT_EN, 12, "bold"), fill=config.ELEMENT_CARD_FG, tags=tags
+        )
+        footer = self.create_text(
+            x + CELL_SIZE // 2, y + CELL_SIZE * 0.86, font=(config.FONT_ZH, 7), fill=config.ELEMENT_CARD_FG, tags=tags
+        )
+        self._cells[element.atomic_number] = (rect, header, symbol, footer)
+
+    def update_cell(self, atomic_number: int, bg: str, header_text: str, symbol_text: str, footer_text: str) -> None:
+        items = self._cells.get(atomic_number)
+        if items is None:
+            return
+        cell_state = (bg, header_text, symbol_text, footer_text)
+        if self._cell_state.get(atomic_number) == cell_state:
+            return
+        rect, header, symbol, footer = items
+        self.itemconfigure(rect, fill=bg)
+        self.itemconfigure(header, text=header_text)
+        self.itemconfigure(symbol, text=symbol_text)
+        self.itemconfigure(footer, text=footer_text)
+        self._cell_state[atomic_number] = cell_state
+
+    def _handle_click(self, _: tk.Event[tk.Misc]) -> None:
+        for tag in self.gettags("current"):
+            if tag.startswith("atomic-"):
+                self._on_click(int(tag[len("atomic-"):]))
+                return
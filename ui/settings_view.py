@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 import config
 import i18n
 from license_manager import install_license_from_path, is_paid_unlocked
-from save import clear_save, export_save, import_save, load_save
+from save import SaveData, clear_save, export_save, import_save, load_save
 from ticket import get_ticket_rule, replenish_tickets
 from ui.gradient_frame import GradientFrame
 
@@ -129,17 +129,28 @@ class SettingsView(GradientFrame):
         )
 
     def refresh_texts(self) -> None:
-        self.back_button.configure(text=self.app.tr("back_to_menu"))
-        self.title_label.configure(text=self.app.tr("settings_title"))
-        self.unlock_frame.configure(text=self.app.tr("settings_unlock_title"))
-        self.language_frame.configure(text=self.app.tr("settings_language_title"))
-        self.save_frame.configure(text=self.app.tr("settings_save_title"))
-        self.apply_unlock_button.configure(text=self.app.tr("settings_apply_unlock_code"))
+        texts = self.app.texts(
+            "back_to_menu",
+            "settings_title",
+            "settings_unlock_title",
+            "settings_language_title",
+            "settings_save_title",
+            "settings_apply_unlock_code",
+            "settings_apply_language",
+            "settings_clear_save",
+            "settings_export_save",
+        )
+        self.back_button.configure(text=texts["back_to_menu"])
+        self.title_label.configure(text=texts["settings_title"])
+        self.unlock_frame.configure(text=texts["settings_unlock_title"])
+        self.language_frame.configure(text=texts["settings_language_title"])
+        self.save_frame.configure(text=texts["settings_save_title"])
+        self.apply_unlock_button.configure(text=texts["settings_apply_unlock_code"])
         self.pick_license_button.configure(text="選擇授權檔")
         self.drop_hint_label.configure(text="可拖曳 license.json 到輸入框，或按「選擇授權檔」")
-        self.apply_language_button.configure(text=self.app.tr("settings_apply_language"))
-        self.clear_button.configure(text=self.app.tr("settings_clear_save"))
-        self.export_button.configure(text=self.app.tr("settings_export_save"))
+        self.apply_language_button.configure(text=texts["settings_apply_language"])
+        self.clear_button.configure(text=texts["settings_clear_save"])
+        self.export_button.configure(text=texts["settings_export_save"])
         self.import_button.configure(text="匯入存檔")
 
     def apply_language(self) -> None:
@@ -159,8 +170,7 @@ class SettingsView(GradientFrame):
 
     def refresh_unlock_status(self) -> None:
         paid_unlocked, reason = is_paid_unlocked()
-        self.app.state.paid_unlocked = paid_unlocked
-        self.app.license_reason = reason
+        self.app.set_paid_unlocked(paid_unlocked, reason)
         rule = get_ticket_rule(self.app.state.paid_unlocked)
         if self.app.state.paid_unlocked:
             text = f"{self.app.tr('settings_status_unlocked', seconds=rule.interval_seconds, cap=rule.cap)} (license:{reason})"
@@ -175,8 +185,7 @@ class SettingsView(GradientFrame):
         else:
             reason = "source_not_found"
         paid_unlocked, _ = is_paid_unlocked()
-        self.app.state.paid_unlocked = paid_unlocked
-        self.app.license_reason = reason
+        self.app.set_paid_unlocked(paid_unlocked, reason)
         replenish_tickets(self.app.state, now=self.app.time_provider())
         self.app.persist()
         self.refresh_unlock_status()
@@ -224,12 +233,12 @@ class SettingsView(GradientFrame):
         if not second:
             return
 
-        self.app.state = clear_save(path=self.app.save_path, now=self.app.time_provider())
+        self.app.replace_state(lambda: clear_save(path=self.app.save_path, now=self.app.time_provider()))
         self.refresh_unlock_status()
         self.message_label.config(text=self.app.tr("settings_save_cleared"), fg=config.SPACE_BLUE_FG)
 
     def export_save_file(self) -> None:
-        self.app.persist()
+        self.app.persist(wait=True)
         target = filedialog.asksaveasfilename(
             title=self.app.tr("settings_export_dialog_title"),
             defaultextension=".json",
@@ -245,13 +254,17 @@ class SettingsView(GradientFrame):
     def import_save_file(self) -> None:
         target = filedialog.askopenfilename(
             title="匯入存檔",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            filetypes=[("Save files", "*.json *.dat"), ("All files", "*.*")],
         )
         if not target:
             return
-        try:
+
+        def load_imported() -> SaveData:
             import_save(Path(target), path=self.app.save_path)
-            self.app.state = load_save(path=self.app.save_path, now=self.app.time_provider())
+            return load_save(path=self.app.save_path, now=self.app.time_provider())
+
+        try:
+            self.app.replace_state(load_imported)
             self.refresh_unlock_status()
             self.message_label.config(text="已匯入存檔", fg=config.SPACE_BLUE_FG)
         except Exception: